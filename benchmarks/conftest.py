@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Prepend src to sys.path so benchmarks import the local package
+sys.path.insert(0, str(SRC))
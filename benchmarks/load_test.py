@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Load test for ``python-project-generator serve``.
+
+Sends archive generation requests from several client threads and reports
+requests per second and latency percentiles:
+
+    python-project-generator serve --port 8765 &
+    python benchmarks/load_test.py --url http://127.0.0.1:8765 -c 16 -n 2000
+
+Use ``--unix-socket PATH`` to target a server listening on a Unix socket.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import socket
+import sys
+import threading
+import time
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over a Unix domain socket."""
+
+    def __init__(self, path: str):
+        super().__init__("localhost")
+        self.unix_path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of sorted samples."""
+    if not samples:
+        return 0.0
+    index = min(len(samples) - 1, max(0, round(fraction * len(samples)) - 1))
+    return samples[index]
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run the load test and return its summary."""
+    body = json.dumps(
+        {
+            "name": "load_test_project",
+            "description": "Load test",
+            "author": "Load Tester",
+            "email": "load@example.com",
+            "github_username": "load",
+            "format": args.format,
+        }
+    ).encode()
+    headers = {"Content-Type": "application/json"}
+
+    def connect() -> http.client.HTTPConnection:
+        if args.unix_socket:
+            return UnixHTTPConnection(args.unix_socket)
+        url = urlsplit(args.url)
+        return http.client.HTTPConnection(url.hostname, url.port or 80)
+
+    remaining = iter(range(args.requests))
+    lock = threading.Lock()
+    latencies: list[float] = []
+    errors = 0
+
+    def worker() -> None:
+        nonlocal errors
+        connection = connect()
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            start = time.perf_counter()
+            try:
+                connection.request("POST", "/generate", body, headers)
+                response = connection.getresponse()
+                response.read()
+                ok = response.status == HTTPStatus.OK
+            except OSError:
+                connection.close()
+                connection = connect()
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                errors += not ok
+        connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(args.concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": args.concurrency,
+        "duration_s": round(duration, 3),
+        "requests_per_s": round(len(latencies) / duration, 1) if duration else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse arguments, run the load test and print the summary."""
+    parser = argparse.ArgumentParser(description="Load test the generation server")
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Server URL")
+    parser.add_argument("--unix-socket", help="Connect to a Unix socket instead")
+    parser.add_argument("--requests", "-n", type=int, default=500)
+    parser.add_argument("--concurrency", "-c", type=int, default=8)
+    parser.add_argument("--format", choices=["tar.gz", "zip"], default="tar.gz")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    args = parser.parse_args(argv)
+
+    summary = run(args)
+    if args.json:
+        print(json.dumps(summary))  # noqa: T201
+    else:
+        for key, value in summary.items():
+            print(f"{key:>15}: {value}")  # noqa: T201
+    return 1 if summary["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
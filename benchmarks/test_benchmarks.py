@@ -0,0 +1,85 @@
+"""
+Benchmark suite runnable with pytest.
+
+Not collected by the default test run; invoke it explicitly:
+
+    pytest benchmarks
+    PPG_BENCH_BASELINE=benchmarks/baseline.json pytest benchmarks
+    PPG_BENCH_REF=main pytest benchmarks
+
+Each scenario fails when a metric regresses beyond PPG_BENCH_THRESHOLD
+(default 0.25) relative to the baseline. With PPG_BENCH_REF set, the baseline
+is measured first from that git revision on the same machine (an empty value
+picks the default branch, see bench.default_revision); ``tox -e bench`` does
+this. Otherwise the stored baseline file is used, and without one the timings
+are only printed. A scenario that regresses is re-run up to PPG_BENCH_RETRIES
+times (default 2), keeping the fastest value of each metric, so only
+slowdowns that reproduce fail the run.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.bench import (
+    DEFAULT_BASELINE,
+    DEFAULT_REVISIONS,
+    DEFAULT_THRESHOLD,
+    compare,
+    default_revision,
+    format_results,
+    run,
+    save_revision_baseline,
+)
+
+BASELINE = Path(os.environ.get("PPG_BENCH_BASELINE", DEFAULT_BASELINE))
+THRESHOLD = float(os.environ.get("PPG_BENCH_THRESHOLD", DEFAULT_THRESHOLD))
+RETRIES = int(os.environ.get("PPG_BENCH_RETRIES", "2"))
+REVISION = os.environ.get("PPG_BENCH_REF")
+
+
+@pytest.fixture(scope="session")
+def baseline(tmp_path_factory):
+    """Return the baseline metrics, or None if there is none to compare with."""
+    if REVISION is None:
+        if not BASELINE.exists():
+            return None
+        return json.loads(BASELINE.read_text(encoding="utf-8"))
+
+    revision = REVISION or default_revision()
+    if revision is None:
+        pytest.fail(
+            f"None of {', '.join(DEFAULT_REVISIONS)} exists; "
+            "set PPG_BENCH_REF to the revision to compare against"
+        )
+    path = tmp_path_factory.mktemp("baseline") / "baseline.json"
+    try:
+        measured = save_revision_baseline(revision, path)
+    except ValueError as error:
+        pytest.fail(f"{error}; set PPG_BENCH_REF to the revision to compare against")
+    if not measured:
+        pytest.skip(f"{revision} has no benchmarks to compare against")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("scenario", ["single", "batch", "large"])
+def test_no_regression(scenario, baseline):
+    """Run one scenario and compare it with the baseline."""
+    results = run(scenarios=(scenario,))
+    print(format_results(results))  # noqa: T201
+
+    if baseline is None:
+        pytest.skip(f"No baseline at {BASELINE}")
+    regressions = compare(results, baseline, THRESHOLD)
+    for _ in range(RETRIES):
+        if not regressions:
+            break
+        retry = run(scenarios=(scenario,))[scenario]
+        results[scenario] = {
+            metric: min(value, retry.get(metric, value))
+            for metric, value in results[scenario].items()
+        }
+        regressions = compare(results, baseline, THRESHOLD)
+    assert not regressions, "\n".join(regressions)
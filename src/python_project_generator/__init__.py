@@ -4,6 +4,14 @@ __version__ = "1.0.0"
 __author__ = "Python Community"
 __email__ = "support@example.com"
 
-from python_project_generator.cli import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name: str):
+    """Import the CLI entry point only when it is first used."""
+    if name == "main":
+        from python_project_generator.cli import main
+
+        return main
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
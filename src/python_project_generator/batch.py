@@ -0,0 +1,246 @@
+"""
+Batch generation of many projects from a manifest.
+
+This module loads project specifications from JSON or CSV manifests and
+fans generation out across a process pool, collecting a per-project report.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from python_project_generator.blobstore import DedupStats
+
+# Manifest column names mapped to ProjectGenerator keyword arguments.
+# Both the CLI-style names and the constructor names are accepted.
+MANIFEST_FIELDS = {
+    "name": "project_name",
+    "project_name": "project_name",
+    "description": "description",
+    "author": "author_name",
+    "author_name": "author_name",
+    "email": "author_email",
+    "author_email": "author_email",
+    "github_username": "github_username",
+    "output": "output_dir",
+    "output_dir": "output_dir",
+}
+
+REQUIRED_FIELDS = (
+    "project_name",
+    "description",
+    "author_name",
+    "author_email",
+    "github_username",
+)
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest or one of its entries is invalid."""
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of generating a single project in a batch."""
+
+    name: str
+    ok: bool
+    path: str | None = None
+    error: str | None = None
+    timings: dict[str, float] | None = None
+    dedup: dict[str, int] | None = None
+    #: GenerationResult.to_dict() of the generation
+    result: dict[str, Any] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+def normalize_spec(
+    row: dict[str, Any], defaults: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Convert a manifest row to ProjectGenerator keyword arguments.
+
+    Args:
+        row: Mapping of manifest column names to values
+        defaults: Values used for fields the row leaves empty
+
+    Returns:
+        Keyword arguments for ProjectGenerator
+
+    Raises:
+        ManifestError: If the row is not a mapping, a column is unknown or a
+            required field is missing
+    """
+    if not isinstance(row, dict):
+        msg = f"Manifest entry must be an object, not {type(row).__name__}"
+        raise ManifestError(msg)
+    spec = dict(defaults or {})
+    for key, value in row.items():
+        if key is None:
+            # csv.DictReader collects cells beyond the header under None
+            msg = "Manifest row has more values than the header has columns"
+            raise ManifestError(msg)
+        if not isinstance(key, str):
+            msg = f"Manifest field names must be strings, not {key!r}"
+            raise ManifestError(msg)
+        field = MANIFEST_FIELDS.get(key.strip().lower())
+        if field is None:
+            msg = f"Unknown manifest field: {key}"
+            raise ManifestError(msg)
+        if value not in (None, ""):
+            spec[field] = value
+
+    missing = [field for field in REQUIRED_FIELDS if not spec.get(field)]
+    if missing:
+        msg = f"Manifest entry is missing: {', '.join(missing)}"
+        raise ManifestError(msg)
+    return spec
+
+
+def load_manifest(
+    manifest_path: Path, defaults: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Load project specifications from a JSON or CSV manifest.
+
+    A JSON manifest is a list of objects; a CSV manifest has a header row.
+    Column names may use either the CLI option names (``name``, ``author``,
+    ``email``, ``output``) or the ProjectGenerator argument names.
+
+    Args:
+        manifest_path: Path to a ``.json`` or ``.csv`` file
+        defaults: Values used for fields an entry leaves empty
+
+    Returns:
+        List of keyword-argument dictionaries for ProjectGenerator
+
+    Raises:
+        ManifestError: If the manifest format or an entry is invalid
+    """
+    manifest_path = Path(manifest_path)
+    suffix = manifest_path.suffix.lower()
+
+    if suffix == ".json":
+        rows = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if not isinstance(rows, list):
+            msg = "JSON manifest must contain a list of project entries"
+            raise ManifestError(msg)
+    elif suffix == ".csv":
+        with manifest_path.open(newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+    else:
+        msg = f"Unsupported manifest format: {manifest_path.suffix}"
+        raise ManifestError(msg)
+
+    return [normalize_spec(row, defaults) for row in rows]
+
+
+def _generate_one(
+    spec: dict[str, Any], force: bool, init_git: bool, backup: bool = False
+) -> ProjectResult:
+    """Generate one project and capture its outcome (runs in worker processes)."""
+    from python_project_generator.generator import ProjectGenerator
+
+    name = str(spec.get("project_name", ""))
+    try:
+        generator = ProjectGenerator(**spec)
+        name = generator.project_name
+        project_path = generator.generate(force=force, init_git=init_git, backup=backup)
+    except Exception as e:
+        return _failed(name, e)
+    return ProjectResult(
+        name=name,
+        ok=True,
+        path=str(project_path),
+        timings=generator.phase_timings,
+        dedup=generator.dedup_stats.to_dict() if generator.dedup_stats else None,
+        result=generator.result.to_dict(),
+    )
+
+
+def _failed(name: str, error: BaseException) -> ProjectResult:
+    """Return the result of a project whose generation raised an error."""
+    return ProjectResult(name=name, ok=False, error=f"{type(error).__name__}: {error}")
+
+
+def _collect(spec: dict[str, Any], future: Future) -> ProjectResult:
+    """
+    Return the result of a worker process.
+
+    A worker that died (killed for lack of memory, crashed) breaks the whole
+    pool; its project and every project still pending fail with
+    BrokenProcessPool instead of aborting the batch.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return _failed(str(spec.get("project_name", "")), e)
+
+
+def generate_many(
+    specs: list[dict[str, Any]],
+    jobs: int = 1,
+    force: bool = False,
+    init_git: bool = True,
+    backup: bool = False,
+) -> list[ProjectResult]:
+    """
+    Generate many projects, optionally in parallel.
+
+    Args:
+        specs: Keyword arguments for each ProjectGenerator
+        jobs: Number of worker processes (0 uses all CPUs, 1 runs in-process)
+        force: Force overwrite if a project directory exists
+        init_git: Initialize a git repository in each project
+        backup: Keep directories replaced by ``force`` as backups
+
+    Returns:
+        One ProjectResult per spec, in the same order as ``specs``, even if
+        a worker process dies
+    """
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(specs)) or 1
+
+    if jobs == 1:
+        return [_generate_one(spec, force, init_git, backup) for spec in specs]
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = [
+            (spec, pool.submit(_generate_one, spec, force, init_git, backup))
+            for spec in specs
+        ]
+        return [_collect(spec, future) for spec, future in pending]
+
+
+def dedup_totals(results: list[ProjectResult]) -> DedupStats | None:
+    """
+    Add up the blob store statistics of a deduplicated batch.
+
+    Args:
+        results: Results of generate_many()
+
+    Returns:
+        Combined statistics, or None if no project was deduplicated
+    """
+    from python_project_generator.blobstore import DedupStats
+
+    stats = [result.dedup for result in results if result.dedup]
+    if not stats:
+        return None
+    return DedupStats(
+        files=sum(item["files"] for item in stats),
+        linked_bytes=sum(item["linked_bytes"] for item in stats),
+        stored_bytes=sum(item["stored_bytes"] for item in stats),
+        copied_bytes=sum(item.get("copied_bytes", 0) for item in stats),
+    )
@@ -0,0 +1,437 @@
+"""
+Benchmarks for project generation.
+
+Measures single-project latency, batch throughput and generation of a
+synthetic template tree with many files, broken down by the phases recorded
+in ``ProjectGenerator.phase_timings``. Results can be saved as a baseline and
+later runs fail when a phase regresses beyond a threshold:
+
+    python-project-generator bench --save-baseline benchmarks/baseline.json
+    python-project-generator bench --baseline benchmarks/baseline.json
+
+Timings only compare on the same machine, so save_revision_baseline() can
+measure an earlier git revision right before the current one instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from python_project_generator.generator import PHASES, ProjectGenerator
+from python_project_generator.template_cache import TemplateCache
+
+SCENARIOS = ("single", "batch", "large")
+
+DEFAULT_BASELINE = Path("benchmarks") / "baseline.json"
+
+#: Relative slowdown (0.25 = 25%) a metric may show before it counts as a
+#: regression
+DEFAULT_THRESHOLD = 0.25
+
+#: Absolute slowdown in seconds below which differences are treated as noise
+MIN_DELTA = 0.005
+
+#: This module, relative to the repository root
+BENCH_MODULE = "src/python_project_generator/bench.py"
+
+#: Revisions tried by default_revision(), in order
+DEFAULT_REVISIONS = ("origin/HEAD", "main", "master")
+
+_PROJECT = {
+    "description": "Benchmark project",
+    "author_name": "Bench Author",
+    "author_email": "bench@example.com",
+    "github_username": "bench",
+}
+
+
+def _median_timings(runs: list[dict[str, float]]) -> dict[str, float]:
+    """Return the median of each phase (and the total) over several runs."""
+    metrics = {}
+    for phase in (*PHASES, "total"):
+        samples = [run.get(phase, 0.0) for run in runs]
+        if any(samples):
+            metrics[phase] = statistics.median(samples)
+    return metrics
+
+
+def _timed_generate(generator: ProjectGenerator, init_git: bool) -> dict[str, float]:
+    """Generate a project and return its phase timings plus the total."""
+    start = time.perf_counter()
+    generator.generate(force=True, init_git=init_git)
+    total = time.perf_counter() - start
+    return {**generator.phase_timings, "total": total}
+
+
+def bench_single(workdir: Path, repeat: int = 5) -> dict[str, float]:
+    """
+    Measure the latency of generating one project with git and validation.
+
+    Args:
+        workdir: Scratch directory
+        repeat: Number of measured runs (after one warm-up run)
+
+    Returns:
+        Median seconds per phase and in total
+    """
+    generator = ProjectGenerator("bench_single", output_dir=workdir, **_PROJECT)
+    _timed_generate(generator, init_git=True)
+    runs = [_timed_generate(generator, init_git=True) for _ in range(repeat)]
+    return _median_timings(runs)
+
+
+def bench_batch(workdir: Path, count: int = 20, jobs: int = 0) -> dict[str, float]:
+    """
+    Measure the throughput of generating many projects in one batch.
+
+    Args:
+        workdir: Scratch directory
+        count: Number of projects
+        jobs: Worker processes (0 uses all CPUs)
+
+    Returns:
+        Total seconds, seconds per project and the per-project median of
+        every phase
+    """
+    specs = [
+        {"project_name": f"bench_batch_{index}", "output_dir": workdir, **_PROJECT}
+        for index in range(count)
+    ]
+    start = time.perf_counter()
+    results = ProjectGenerator.generate_many(specs, jobs=jobs, force=True)
+    total = time.perf_counter() - start
+
+    failed = [result for result in results if not result.ok]
+    if failed:
+        msg = f"Batch benchmark failed: {failed[0].error}"
+        raise RuntimeError(msg)
+
+    metrics = _median_timings([result.timings or {} for result in results])
+    metrics["total"] = total
+    metrics["per_project"] = total / count
+    return metrics
+
+
+def make_large_template_tree(root: Path, files: int = 10_000) -> Path:
+    """
+    Create a template set with the bundled templates plus many small files.
+
+    Every tenth file contains placeholders; the rest are copied verbatim.
+
+    Args:
+        root: Directory to create the template set in
+        files: Number of extra files
+
+    Returns:
+        Path of the template directory
+    """
+    bundled = ProjectGenerator("bench", **_PROJECT).template_dir
+    template_dir = root / "templates"
+    shutil.copytree(bundled, template_dir)
+    # The template set also includes these files next to the template dir
+    shutil.copytree(bundled.parent / ".github", root / ".github")
+    for name in (".gitignore", ".pre-commit-config.yaml"):
+        shutil.copy2(bundled.parent / name, root / name)
+    for index in range(files):
+        directory = template_dir / "data" / f"{index // 500:03d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        if index % 10 == 0:
+            content = f"# {{{{PROJECT_NAME}}}} fixture {index}\n" * 20
+        else:
+            content = f"static fixture {index}\n" * 20
+        (directory / f"fixture_{index:05d}.txt").write_text(content)
+    return template_dir
+
+
+def bench_large(workdir: Path, files: int = 10_000) -> dict[str, float]:
+    """
+    Measure generation from a synthetic template tree with many files.
+
+    Args:
+        workdir: Scratch directory
+        files: Number of extra template files
+
+    Returns:
+        Seconds per phase and in total, plus the cold template load time
+    """
+    template_dir = make_large_template_tree(workdir / "large", files)
+    cache = TemplateCache(template_dir)
+
+    start = time.perf_counter()
+    cache.files()
+    load = time.perf_counter() - start
+
+    generator = ProjectGenerator(
+        "bench_large",
+        output_dir=workdir / "out",
+        template_cache=cache,
+        **_PROJECT,
+    )
+    metrics = _timed_generate(generator, init_git=False)
+    metrics["template_load"] = load
+    return metrics
+
+
+def run(
+    scenarios: tuple[str, ...] = SCENARIOS,
+    repeat: int = 5,
+    batch_size: int = 20,
+    jobs: int = 0,
+    large_files: int = 10_000,
+) -> dict[str, dict[str, float]]:
+    """
+    Run benchmark scenarios in a temporary directory.
+
+    Args:
+        scenarios: Names from SCENARIOS to run
+        repeat: Measured runs of the single-project scenario
+        batch_size: Projects generated by the batch scenario
+        jobs: Worker processes of the batch scenario (0 uses all CPUs)
+        large_files: Extra template files of the large scenario
+
+    Returns:
+        Mapping of scenario name to metric name to seconds
+    """
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="ppg-bench-") as temp_dir:
+        workdir = Path(temp_dir)
+        for scenario in scenarios:
+            scratch = workdir / scenario
+            scratch.mkdir()
+            if scenario == "single":
+                results[scenario] = bench_single(scratch, repeat)
+            elif scenario == "batch":
+                results[scenario] = bench_batch(scratch, batch_size, jobs)
+            elif scenario == "large":
+                results[scenario] = bench_large(scratch, large_files)
+            else:
+                msg = f"Unknown benchmark scenario: {scenario}"
+                raise ValueError(msg)
+    return results
+
+
+def _git(repo: Path, *args: str) -> subprocess.CompletedProcess:
+    """Run a git command in a repository and capture its output."""
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=False
+    )
+
+
+def _resolve(repo: Path, revision: str) -> str | None:
+    """Return the commit id of a revision, or None if it does not exist."""
+    result = _git(repo, "rev-parse", "--verify", "--quiet", f"{revision}^{{commit}}")
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def default_revision(repo: Path | None = None) -> str | None:
+    """
+    Return the branch benchmarks are compared against by default.
+
+    Args:
+        repo: Directory inside the git repository (default: current directory)
+
+    Returns:
+        The first of DEFAULT_REVISIONS that exists, or None
+    """
+    repo = Path(repo or Path.cwd())
+    for revision in DEFAULT_REVISIONS:
+        if _resolve(repo, revision) is not None:
+            return revision
+    return None
+
+
+def save_revision_baseline(
+    revision: str,
+    path: Path,
+    scenarios: tuple[str, ...] = SCENARIOS,
+    repo: Path | None = None,
+) -> bool:
+    """
+    Measure another git revision and save its results as a baseline.
+
+    The revision is checked out in a temporary shared clone, so the
+    repository, its index and its worktrees are left untouched, and its own
+    bench module is run there on this machine.
+
+    Args:
+        revision: Commit, branch or tag to measure
+        path: Where to write the baseline
+        scenarios: Names from SCENARIOS to run
+        repo: Directory inside the git repository (default: current directory)
+
+    Returns:
+        False if the revision predates the benchmarks; nothing is written then
+
+    Raises:
+        ValueError: If the revision does not exist
+        subprocess.CalledProcessError: If checking out or measuring it fails
+    """
+    repo = Path(repo or Path.cwd())
+    commit = _resolve(repo, revision)
+    if commit is None:
+        msg = f"Unknown git revision: {revision}"
+        raise ValueError(msg)
+    if _git(repo, "cat-file", "-e", f"{commit}:{BENCH_MODULE}").returncode:
+        return False
+
+    top = _git(repo, "rev-parse", "--show-toplevel").stdout.strip()
+    path = Path(path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="ppg-bench-base-") as temp_dir:
+        checkout = Path(temp_dir) / "checkout"
+        for args in (
+            ("clone", "--shared", "--no-checkout", "--quiet", top, str(checkout)),
+            ("-C", str(checkout), "checkout", "--quiet", "--detach", commit),
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "python_project_generator.bench",
+                "--save-baseline",
+                str(path),
+                *(f"--scenario={scenario}" for scenario in scenarios),
+            ],
+            cwd=checkout,
+            env={**os.environ, "PYTHONPATH": str(checkout / "src")},
+            check=True,
+            capture_output=True,
+        )
+    return True
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """
+    Find metrics that are slower than the baseline.
+
+    A metric regresses when it exceeds its baseline by more than
+    ``threshold`` (relative) and by more than MIN_DELTA seconds.
+
+    Args:
+        results: Metrics of the current run
+        baseline: Metrics of the baseline run
+        threshold: Allowed relative slowdown
+
+    Returns:
+        One description per regressed metric
+    """
+    regressions = []
+    for scenario, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(scenario, {}).get(metric)
+            if not reference:
+                continue
+            if value > reference * (1 + threshold) and value - reference > MIN_DELTA:
+                regressions.append(
+                    f"{scenario}.{metric}: {value * 1000:.1f} ms "
+                    f"(baseline {reference * 1000:.1f} ms, "
+                    f"+{(value / reference - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def format_results(results: dict[str, dict[str, float]]) -> str:
+    """Format benchmark results as a table in milliseconds."""
+    lines = []
+    for scenario, metrics in results.items():
+        lines.append(scenario)
+        lines.extend(
+            f"  {metric:<14} {value * 1000:>10.1f} ms"
+            for metric, value in metrics.items()
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks and compare them with a baseline."""
+    parser = argparse.ArgumentParser(
+        prog="python-project-generator bench",
+        description="Benchmark project generation",
+    )
+    parser.add_argument(
+        "--scenario",
+        "-s",
+        action="append",
+        choices=SCENARIOS,
+        help="Scenario to run (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs of the single scenario"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=20, help="Projects in the batch scenario"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=0, help="Batch worker processes"
+    )
+    parser.add_argument(
+        "--large-files",
+        type=int,
+        default=10_000,
+        help="Extra template files in the large scenario",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline to compare against (default: {DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        type=Path,
+        help="Write the results to this file as the new baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed relative slowdown before failing (default: 0.25)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(
+        scenarios=tuple(args.scenario or SCENARIOS),
+        repeat=args.repeat,
+        batch_size=args.batch_size,
+        jobs=args.jobs,
+        large_files=args.large_files,
+    )
+
+    if args.json:
+        print(json.dumps(results, indent=2))  # noqa: T201
+    else:
+        print(format_results(results))  # noqa: T201
+
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(
+            json.dumps(results, indent=2) + "\n", encoding="utf-8"
+        )
+        return 0
+
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)  # noqa: T201
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+"""
+Content-addressed storage of generated files.
+
+Projects generated from the same templates share most of their files byte
+for byte. With deduplication, every unique file is written once into a
+BlobStore inside the output directory and the projects are materialized from
+it with reflinks (independent copy-on-write clones) or hard links (shared
+inodes), so a batch of hundreds of projects takes little more space than one.
+Hard links are only made on request, to read-only blobs (see sinks.DedupSink).
+
+The store is never cleaned up automatically, since a later batch may reuse
+its blobs. Blobs no project links to any more are removed with:
+
+    python-project-generator blobs prune --output DIR
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from python_project_generator.renderer import read_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+#: Name of the blob store directory inside an output directory
+BLOB_DIR = ".ppg-blobs"
+
+
+@dataclass
+class DedupStats:
+    """Bytes materialized from and written to a blob store."""
+
+    files: int = 0
+    #: Size of the project files materialized from the store
+    linked_bytes: int = 0
+    #: Size of the blobs that had to be written to the store
+    stored_bytes: int = 0
+    #: Size of the project files copied because they could not be linked
+    copied_bytes: int = 0
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes that did not have to be written thanks to deduplication."""
+        return self.linked_bytes - self.stored_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {**asdict(self), "saved_bytes": self.saved_bytes}
+
+
+class BlobStore:
+    """Directory of files named after the SHA-256 of their contents."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize a store; directories are created on demand.
+
+        Args:
+            root: Store directory; it must be on the same filesystem as the
+                projects for hard links and reflinks to work
+        """
+        self.root = Path(root)
+
+    @classmethod
+    def for_output(cls, output_dir: Path) -> BlobStore:
+        """Return the store shared by every project in an output directory."""
+        return cls(Path(output_dir) / BLOB_DIR)
+
+    def path_for(self, digest: str, mode: int) -> Path:
+        """
+        Return where a blob is stored.
+
+        Hard links share permission bits, so the mode is part of the name.
+        """
+        return self.root / digest[:2] / f"{digest[2:]}-{mode & 0o777:o}"
+
+    def add(self, data: bytes, mode: int = 0o644) -> tuple[Path, bool]:
+        """
+        Store file contents unless an identical blob already exists.
+
+        Blobs are written to a temporary file and linked into place, so
+        concurrent writers (threads or processes) never expose a partial
+        blob.
+
+        Args:
+            data: File contents
+            mode: Permission bits of the file
+
+        Returns:
+            The blob path and whether it was written by this call
+        """
+        blob = self.path_for(hashlib.sha256(data).hexdigest(), mode)
+        if blob.exists():
+            return blob, False
+        temp, _, _ = self._write_temp((data,), mode)
+        return blob, self._publish(temp, blob)
+
+    def add_chunks(
+        self, chunks: Iterable[bytes], mode: int = 0o644
+    ) -> tuple[Path, bool, int]:
+        """
+        Store file contents produced piece by piece, e.g. by a streaming render.
+
+        Args:
+            chunks: Consecutive pieces of the file
+            mode: Permission bits of the file
+
+        Returns:
+            The blob path, whether it was written by this call and its size
+        """
+        temp, digest, size = self._write_temp(chunks, mode)
+        blob = self.path_for(digest, mode)
+        return blob, self._publish(temp, blob), size
+
+    def add_file(self, source: Path, mode: int = 0o644) -> tuple[Path, bool, int]:
+        """
+        Store a file's contents without reading it into memory.
+
+        The file is hashed first, so nothing is written when an identical blob
+        already exists.
+
+        Args:
+            source: File to store
+            mode: Permission bits of the file
+
+        Returns:
+            The blob path, whether it was written by this call and its size
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in read_chunks(source):
+            hasher.update(chunk)
+            size += len(chunk)
+        blob = self.path_for(hasher.hexdigest(), mode)
+        if blob.exists():
+            return blob, False, size
+        return self.add_chunks(read_chunks(source), mode)
+
+    def _write_temp(self, chunks: Iterable[bytes], mode: int) -> tuple[Path, str, int]:
+        """Write contents to a temporary file; return it, its digest and size."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        temp = self.root / f".tmp-{uuid.uuid4().hex[:12]}"
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with temp.open("wb") as file:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+            temp.chmod(mode & 0o777)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+        return temp, hasher.hexdigest(), size
+
+    @staticmethod
+    def _publish(temp: Path, blob: Path) -> bool:
+        """Move a temporary file to its blob path; False if it already exists."""
+        try:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(temp, blob)
+            except FileExistsError:
+                return False
+            except OSError:
+                temp.replace(blob)
+            return True
+        finally:
+            temp.unlink(missing_ok=True)
+
+    def prune(self) -> int:
+        """
+        Delete blobs that no project links to any more.
+
+        A blob with a single link is only referenced by the store (projects
+        materialized with reflinks own independent copies), so removing it
+        never affects a project.
+
+        Returns:
+            Number of blobs deleted
+        """
+        removed = 0
+        for blob in self.root.glob("*/*"):
+            if blob.name.startswith(".tmp-"):
+                continue
+            try:
+                if blob.stat().st_nlink == 1:
+                    blob.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Delete the blobs of an output directory that no project links to."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python-project-generator blobs",
+        description=f"Maintain the {BLOB_DIR} store written by --dedupe",
+    )
+    parser.add_argument("action", choices=("prune",), help="What to do")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=Path.cwd(),
+        help="Output directory holding the store (default: current directory)",
+    )
+    args = parser.parse_args(argv)
+
+    store = BlobStore.for_output(args.output)
+    removed = store.prune()
+    print(f"Removed {removed} unused blobs from {store.root}")  # noqa: T201
+    return 0
@@ -4,15 +4,83 @@ Command-line interface for Python Project Generator.
 This module provides the CLI commands for generating new Python projects.
 """
 
-import argparse
+from __future__ import annotations
+
+import os
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from python_project_generator import __version__
+
+if TYPE_CHECKING:
+    import argparse
+    import cProfile
+    from pathlib import Path
+
+    from python_project_generator.batch import ProjectResult
+    from python_project_generator.generator import ProjectGenerator
+    from python_project_generator.metrics import OpenMetricsExporter
+    from python_project_generator.render_cache import RenderCache
+    from python_project_generator.update import UpdateReport
+
+# The generator and its dependencies are imported only once the arguments are
+# parsed, so --version and --help start quickly.
 
-from python_project_generator.generator import ProjectGenerator
+COMMANDS = {
+    "bench": "python_project_generator.bench",
+    "blobs": "python_project_generator.blobstore",
+    "cache": "python_project_generator.render_cache",
+    "serve": "python_project_generator.server",
+}
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Main CLI entry point."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv == ["--version"]:
+        print(f"{os.path.basename(sys.argv[0])} {__version__}")  # noqa: T201, PTH119
+        return 0
+
+    # Subcommands have their own parsers
+    if argv and argv[0] in COMMANDS:
+        import importlib
+
+        return importlib.import_module(COMMANDS[argv[0]]).main(argv[1:])
+
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    _check_options(parser, args)
+
+    if args.manifest:
+        return _run_batch(args)
+
+    generator = _create_generator(parser, args)
+    if args.profile:
+        from python_project_generator.profiling import Profiler
+
+        generator.profiler = Profiler()
+    exporter = _metrics_exporter(args)
+    if exporter is not None:
+        generator.observers.append(exporter)
+    cprofile = _start_cprofile(args)
+
+    try:
+        _run_mode(generator, args)
+    except Exception as e:
+        _report_error(e, args.traceback)
+        return 1
+    finally:
+        _finish_run(generator, args, cprofile, exporter)
+    return 0
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the parser of the generate command."""
+    import argparse
+    from pathlib import Path
+
     parser = argparse.ArgumentParser(
         description="Generate production-ready Python projects",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -25,9 +93,35 @@ Examples:
   python-project-generator --name YOUR_PROJECT --author "John Doe" \
     --email john@example.com
 
+  # Re-render an existing project after a template change
+  python-project-generator --name YOUR_PROJECT ... --update
+
   # Specify output directory
   python-project-generator --output /path/to/projects
 
+  # Stream the project as a tar.gz archive to standard output
+  python-project-generator --name YOUR_PROJECT ... --format tar.gz --output -
+
+  # Batch mode: generate every project in a manifest with 8 workers
+  python-project-generator --manifest projects.json --jobs 8
+
+  # Delete deduplicated files no project in the output directory uses
+  python-project-generator blobs prune --output /path/to/projects
+
+  # Keep templates warm and serve generation requests over local HTTP
+  python-project-generator serve --port 8765
+
+  # Benchmark generation and compare with a stored baseline
+  python-project-generator bench --baseline benchmarks/baseline.json
+
+  # Reuse the rendered files of an earlier run with the same values
+  python-project-generator --name YOUR_PROJECT ... --force --cache
+  python-project-generator cache stats
+
+  # Time each phase and file, writing a Chrome trace and a cProfile dump
+  python-project-generator --name YOUR_PROJECT ... --profile trace.json \
+    --cprofile generate.pstats
+
   # Show version
   python-project-generator --version
         """,
@@ -36,7 +130,7 @@ Examples:
     parser.add_argument(
         "--version",
         action="version",
-        version="%(prog)s 1.0.0",
+        version=f"%(prog)s {__version__}",
     )
 
     parser.add_argument(
@@ -84,44 +178,414 @@ Examples:
         help="Force overwrite if project directory exists",
     )
 
+    parser.add_argument(
+        "--backup",
+        action="store_true",
+        help="With --force, keep the existing directory as <name>.bak-<time> "
+        "instead of deleting it",
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["tar.gz", "zip"],
+        help="Write the project as an archive instead of a directory; "
+        "--output is then the archive file or - for standard output",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the files that would be generated, with sizes, and exit",
+    )
+
+    parser.add_argument(
+        "--update",
+        "-u",
+        action="store_true",
+        help="Update an existing project, rewriting only changed files",
+    )
+
     parser.add_argument(
         "--no-git",
         action="store_true",
         help="Skip git initialization",
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=1,
+        help="Number of threads writing files concurrently (default: 1)",
+    )
+
+    parser.add_argument(
+        "--link-mode",
+        choices=["copy", "hardlink", "reflink", "auto"],
+        default="copy",
+        help="How to materialize template files without placeholders: copy, "
+        "hardlink (links read-only templates, which then share their data with "
+        "the project, and clones the others like reflink), reflink "
+        "(copy-on-write clone) or auto (reflink, then copy_file_range, then "
+        "copy)",
+    )
+
+    parser.add_argument(
+        "--git-subprocess",
+        action="store_true",
+        help="Create the git repository by running git instead of natively",
+    )
+
+    parser.add_argument(
+        "--validate-subprocess",
+        action="store_true",
+        help="Validate the generated project in a separate Python process",
+    )
+
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const=Path("profile-trace.json"),
+        type=Path,
+        metavar="TRACE",
+        help="Print per-phase timings and write a Chrome trace of every phase "
+        "and file operation (default: profile-trace.json)",
+    )
+
+    parser.add_argument(
+        "--cprofile",
+        type=Path,
+        metavar="PSTATS",
+        help="Run the generation under cProfile and write the stats here",
+    )
+
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Write each unique file once into a content-addressed store in "
+        "the output directory and reflink it into the projects (for "
+        "--manifest). Without reflink support (Btrfs, XFS, APFS) files are "
+        "copied. With --link-mode hardlink they are hard-linked instead: this "
+        "works on any filesystem, but the projects share the files, which are "
+        "therefore read-only. Remove files no project uses any more with "
+        "'blobs prune'",
+    )
 
-    # Interactive mode if no project name provided
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Serve repeat generations with the same templates and values "
+        "from the on-disk render cache",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Render cache directory (default: "
+        "$XDG_CACHE_HOME/python-project-generator/renders); implies --cache",
+    )
+
+    parser.add_argument(
+        "--deep-validate",
+        action="store_true",
+        help="Also parse pyproject.toml and scan the generated files for "
+        "unrendered placeholders",
+    )
+
+    parser.add_argument(
+        "--metrics",
+        type=Path,
+        help="Write generation latency and file metrics in the OpenMetrics "
+        "text format to this file",
+    )
+
+    parser.add_argument(
+        "--traceback",
+        action="store_true",
+        help="Print the full traceback when generation fails",
+    )
+
+    parser.add_argument(
+        "--manifest",
+        "-m",
+        type=Path,
+        help="Generate every project listed in a JSON or CSV manifest",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for --manifest (0 = all CPUs)",
+    )
+
+    parser.add_argument(
+        "--report",
+        type=Path,
+        help="Write the --manifest per-project report as JSON to this file",
+    )
+
+    return parser
+
+
+def _check_options(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option combinations before prompting for anything."""
+    if args.backup and not args.force:
+        parser.error("--backup requires --force")
+    if args.update and args.force:
+        parser.error("--update and --force cannot be used together")
+    for flag, given in (("--dry-run", args.dry_run), ("--format", args.format)):
+        if given and (args.update or args.force):
+            mode = "--update" if args.update else "--force"
+            parser.error(f"{flag} and {mode} cannot be used together")
+
+
+def _generator_options(args: argparse.Namespace) -> dict[str, Any]:
+    """Return the ProjectGenerator settings selected on the command line."""
+    options: dict[str, Any] = {
+        "io_workers": max(1, args.io_workers),
+        "link_mode": args.link_mode,
+        "render_cache": _render_cache(args),
+        "dedupe": args.dedupe,
+        # Let replaced directories finish deleting after the CLI exits
+        "detach_cleanup": True,
+    }
+    if args.validate_subprocess:
+        options["validation"] = "subprocess"
+    elif args.deep_validate:
+        options["validation"] = "deep"
+    if args.git_subprocess:
+        options["git_backend"] = "subprocess"
+    return options
+
+
+def _create_generator(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> ProjectGenerator:
+    """Create the generator, prompting for the details unless --name is given."""
+    from python_project_generator.generator import ProjectGenerator
+
+    options = _generator_options(args)
     if not args.name:
         generator = ProjectGenerator.from_interactive()
-    else:
-        # Validate all required fields are provided in non-interactive mode
-        if not all([args.description, args.author, args.email, args.github_username]):
-            parser.error(
-                "In non-interactive mode, all of --name, --description, "
-                "--author, --email, and --github-username are required"
-            )
+        for key, value in options.items():
+            setattr(generator, key, value)
+        return generator
 
-        generator = ProjectGenerator(
-            project_name=args.name,
-            description=args.description,
-            author_name=args.author,
-            author_email=args.email,
-            github_username=args.github_username,
-            output_dir=args.output,
+    # Validate all required fields are provided in non-interactive mode
+    if not all([args.description, args.author, args.email, args.github_username]):
+        parser.error(
+            "In non-interactive mode, all of --name, --description, "
+            "--author, --email, and --github-username are required"
         )
+    return ProjectGenerator(
+        project_name=args.name,
+        description=args.description,
+        author_name=args.author,
+        author_email=args.email,
+        github_username=args.github_username,
+        output_dir=args.output,
+        **options,
+    )
 
-    try:
+
+def _start_cprofile(args: argparse.Namespace) -> cProfile.Profile | None:
+    """Start profiling the run with cProfile for --cprofile, if given."""
+    if not args.cprofile:
+        return None
+    import cProfile
+
+    profile = cProfile.Profile()
+    profile.enable()
+    return profile
+
+
+def _finish_run(
+    generator: ProjectGenerator,
+    args: argparse.Namespace,
+    cprofile: cProfile.Profile | None,
+    exporter: OpenMetricsExporter | None,
+) -> None:
+    """Write the profiles and metrics of a run, whether it failed or not."""
+    if cprofile is not None:
+        cprofile.disable()
+        cprofile.dump_stats(args.cprofile)
+    if generator.profiler is not None:
+        _report_profile(generator, args.profile)
+    if exporter is not None:
+        exporter.write(args.metrics)
+
+
+def _run_mode(generator: ProjectGenerator, args: argparse.Namespace) -> None:
+    """Dry-run, archive, update or generate the project as requested."""
+    if args.dry_run:
+        from python_project_generator.sinks import DryRunSink
+
+        generator.render(DryRunSink(generator.project_path))
+    elif args.format:
+        _write_archive(generator, args.output, args.format)
+    elif args.update:
+        _print_update_report(generator.update())
+    else:
         generator.generate(
             force=args.force,
             init_git=not args.no_git,
+            backup=args.backup,
         )
+        if generator.backup_path is not None:
+            msg = f"Previous project kept in {generator.backup_path}"
+            print(msg, file=sys.stderr)  # noqa: T201
 
-        return 0
+    for token in sorted(generator.renderer.unknown_placeholders):
+        msg = f"Warning: unknown placeholder {token}"
+        print(msg, file=sys.stderr)  # noqa: T201
 
-    except Exception:
-        return 1
+
+def _report_error(error: Exception, traceback: bool) -> None:
+    """Print why generation failed, with the full traceback if requested."""
+    if traceback:
+        import traceback as tb
+
+        tb.print_exception(type(error), error, error.__traceback__)
+    msg = f"Error: {error}"
+    print(msg, file=sys.stderr)  # noqa: T201
+
+
+def _metrics_exporter(args: argparse.Namespace) -> OpenMetricsExporter | None:
+    """Return an exporter for --metrics, if given."""
+    if args.metrics is None:
+        return None
+    from python_project_generator.metrics import OpenMetricsExporter
+
+    return OpenMetricsExporter()
+
+
+def _export_batch_metrics(
+    exporter: OpenMetricsExporter, results: list[ProjectResult]
+) -> None:
+    """Add the outcomes of generations run in worker processes to metrics."""
+    for result in results:
+        if result.result is None:
+            error_type = (result.error or "").partition(":")[0]
+            exporter.observe_failure(error_type or None)
+            continue
+        exporter.observe(
+            result.result["duration"],
+            result.result["phase_timings"],
+            files=result.result["actions"],
+            bytes_written=result.result["bytes_written"],
+            cache_hit=result.result["cache_hit"],
+        )
+
+
+def _render_cache(args: argparse.Namespace) -> RenderCache | None:
+    """Return the render cache selected on the command line, if any."""
+    if not (args.cache or args.cache_dir):
+        return None
+    from python_project_generator.render_cache import RenderCache
+
+    return RenderCache(args.cache_dir)
+
+
+def _report_profile(generator: ProjectGenerator, trace_path: Path) -> None:
+    """Print the phase summary and write the Chrome trace."""
+    profiler = generator.profiler
+    print(profiler.summary(generator.phase_timings), file=sys.stderr)  # noqa: T201
+    profiler.write_chrome_trace(trace_path)
+    msg = f"Trace written to {trace_path}"
+    print(msg, file=sys.stderr)  # noqa: T201
+
+
+def _write_archive(generator: ProjectGenerator, output: Path, fmt: str) -> None:
+    """Stream the project as an archive to a file, a directory or stdout."""
+    if str(output) == "-":
+        generator.generate_archive(sys.stdout.buffer, fmt)
+        return
+    if output.is_dir():
+        output = output / f"{generator.project_name}.{fmt}"
+    with output.open("wb") as fileobj:
+        generator.generate_archive(fileobj, fmt)
+
+
+def _print_update_report(report: UpdateReport) -> None:
+    """Print a summary of an incremental update."""
+    print(  # noqa: T201
+        f"{len(report.written)} updated, {len(report.unchanged)} unchanged, "
+        f"{len(report.conflicts)} conflicts"
+    )
+    for dest in report.conflicts:
+        msg = f"Conflict: {dest} was modified locally and was not updated"
+        print(msg, file=sys.stderr)  # noqa: T201
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    """Generate all projects in a manifest and print a per-project report."""
+    import json
+
+    from python_project_generator.batch import dedup_totals, load_manifest
+    from python_project_generator.generator import ProjectGenerator
+
+    # Options given on the command line act as defaults for manifest entries
+    defaults = {
+        "project_name": args.name,
+        "description": args.description,
+        "author_name": args.author,
+        "author_email": args.email,
+        "github_username": args.github_username,
+        "output_dir": args.output,
+    }
+    defaults = {key: value for key, value in defaults.items() if value}
+    defaults.update(_generator_options(args))
+
+    try:
+        specs = load_manifest(args.manifest, defaults)
+    except (OSError, ValueError) as e:
+        msg = f"Invalid manifest {args.manifest}: {e}"
+        print(msg, file=sys.stderr)  # noqa: T201
+        return 2
+
+    results = ProjectGenerator.generate_many(
+        specs,
+        jobs=args.jobs,
+        force=args.force,
+        init_git=not args.no_git,
+        backup=args.backup,
+    )
+
+    for result in results:
+        if result.ok:
+            print(f"ok      {result.name}: {result.path}")  # noqa: T201
+        else:
+            print(f"FAILED  {result.name}: {result.error}")  # noqa: T201
+
+    failed = sum(not result.ok for result in results)
+    print(f"{len(results) - failed} succeeded, {failed} failed")  # noqa: T201
+
+    dedup = dedup_totals(results)
+    if dedup is not None:
+        mib = 1024 * 1024
+        print(  # noqa: T201
+            f"Deduplicated {dedup.files} files: "
+            f"{dedup.linked_bytes / mib:.1f} MiB linked, "
+            f"{dedup.stored_bytes / mib:.1f} MiB stored, "
+            f"{dedup.saved_bytes / mib:.1f} MiB saved"
+        )
+        if dedup.copied_bytes:
+            print(  # noqa: T201
+                f"{dedup.copied_bytes / mib:.1f} MiB copied: the filesystem "
+                "cannot reflink; see --dedupe in --help"
+            )
+
+    if args.report:
+        report = [result.to_dict() for result in results]
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    exporter = _metrics_exporter(args)
+    if exporter is not None:
+        _export_batch_metrics(exporter, results)
+        exporter.write(args.metrics)
+
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
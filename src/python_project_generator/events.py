@@ -0,0 +1,116 @@
+"""
+Events and results of project generation.
+
+Applications embedding ProjectGenerator pass observers to see what a
+generation does while it runs: every phase and every file is reported as an
+event, and the finished generation as a GenerationResult with aggregate
+counters. Subclass GenerationObserver and override the methods you need:
+
+    class Logger(GenerationObserver):
+        def on_file(self, event):
+            log.debug("%s %s (%d bytes)", event.action, event.path, event.size)
+
+    ProjectGenerator(..., observers=[Logger()]).generate()
+
+File events are emitted on the thread that wrote the file, which is an I/O
+thread when ``io_workers`` is greater than 1.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from python_project_generator.blobstore import DedupStats
+
+#: What happened to a file: rendered from a template, copied or linked
+#: unchanged, skipped by an update because it did not change, or left alone
+#: by an update because it was modified locally
+FILE_ACTIONS = ("rendered", "copied", "linked", "skipped", "conflict")
+
+
+@dataclass(frozen=True)
+class PhaseEvent:
+    """A phase (one of generator.PHASES) that finished."""
+
+    phase: str
+    #: Seconds spent in the phase, including phases nested in it
+    duration: float
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class FileEvent:
+    """
+    A project file that was written or skipped.
+
+    The update manifest the generator keeps in every project is not reported.
+    """
+
+    #: Path relative to the project root, POSIX style
+    path: str
+    #: One of FILE_ACTIONS
+    action: str
+    #: Size of the file in bytes
+    size: int
+    #: Seconds spent writing the file (0 for skipped files)
+    duration: float
+
+
+@dataclass
+class GenerationResult:
+    """Aggregate counters of one generation."""
+
+    #: Project directory, or None when rendering into a sink not on disk
+    path: Path | None
+    #: Wall-clock seconds of the whole generation
+    duration: float = 0.0
+    phase_timings: dict[str, float] = field(default_factory=dict)
+    files: int = 0
+    #: Bytes of every file written (skipped and conflicting files excluded)
+    bytes_written: int = 0
+    #: Number of files per action in FILE_ACTIONS
+    actions: dict[str, int] = field(default_factory=dict)
+    cache_hit: bool = False
+    dedup: DedupStats | None = None
+    unknown_placeholders: list[str] = field(default_factory=list)
+
+    def add(self, event: FileEvent) -> None:
+        """Count a file event."""
+        self.files += 1
+        self.actions[event.action] = self.actions.get(event.action, 0) + 1
+        if event.action not in ("skipped", "conflict"):
+            self.bytes_written += event.size
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a JSON-serializable dictionary."""
+        return {
+            "path": str(self.path) if self.path is not None else None,
+            "duration": self.duration,
+            "phase_timings": dict(self.phase_timings),
+            "files": self.files,
+            "bytes_written": self.bytes_written,
+            "actions": dict(self.actions),
+            "cache_hit": self.cache_hit,
+            "dedup": self.dedup.to_dict() if self.dedup is not None else None,
+            "unknown_placeholders": list(self.unknown_placeholders),
+        }
+
+
+class GenerationObserver:
+    """Receive the events of a generation; every method does nothing."""
+
+    def on_phase(self, event: PhaseEvent) -> None:
+        """Handle a finished phase."""
+
+    def on_file(self, event: FileEvent) -> None:
+        """Handle a file that was written or skipped."""
+
+    def on_result(self, result: GenerationResult) -> None:
+        """Handle a generation that completed."""
+
+    def on_error(self, error: BaseException) -> None:
+        """Handle a generation that failed."""
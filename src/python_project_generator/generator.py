@@ -4,10 +4,97 @@ Project generator core functionality.
 This module handles the generation of new Python projects from templates.
 """
 
+from __future__ import annotations
+
 import re
-import shutil
+import threading
+import time
+from contextlib import contextmanager, suppress
 from datetime import date
+from functools import cached_property
 from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+from python_project_generator.events import (
+    FileEvent,
+    GenerationObserver,
+    GenerationResult,
+    PhaseEvent,
+)
+from python_project_generator.plan import GenerationPlan, PlanEntry
+from python_project_generator.renderer import Renderer
+from python_project_generator.sinks import (
+    LINK_MODES,
+    DedupSink,
+    DirectorySink,
+    MemorySink,
+    OutputSink,
+    archive_sink,
+)
+from python_project_generator.template_cache import INDEX_PATH, TemplateCache
+from python_project_generator.update import (
+    MANIFEST_NAME,
+    UpdateReport,
+    dumps_project_manifest,
+    file_digest,
+    load_project_manifest,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from python_project_generator.blobstore import DedupStats
+    from python_project_generator.profiling import Profiler
+    from python_project_generator.render_cache import CachedRender, RenderCache
+
+VALIDATION_MODES = ("in-process", "deep", "subprocess")
+
+GIT_BACKENDS = ("native", "subprocess")
+
+GIT_COMMIT_MESSAGE = "Initial commit from python-project-generator"
+
+VALIDATE_SCRIPT = Path(__file__).parent.parent / "validate_project.py"
+
+#: Phases reported in ProjectGenerator.phase_timings, in execution order
+PHASES = (
+    "clean",
+    "load",
+    "cache",
+    "copy",
+    "render",
+    "structure",
+    "flush",
+    "git",
+    "validate",
+    "publish",
+)
+
+_validator = None
+
+
+def _load_validator():
+    """
+    Import the bundled validate_project.py script as a module.
+
+    The script copied into generated projects is loaded from its file so the
+    generator validates with exactly the code it ships.
+
+    Returns:
+        The loaded validate_project module
+    """
+    global _validator  # noqa: PLW0603
+    if _validator is None:
+        import importlib.util
+        import sys
+
+        name = "_python_project_generator_validate_project"
+        spec = importlib.util.spec_from_file_location(name, VALIDATE_SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _validator = module
+    return _validator
 
 
 class ProjectGenerator:
@@ -21,6 +108,17 @@ class ProjectGenerator:
         author_email: str,
         github_username: str,
         output_dir: Path = Path.cwd(),
+        *,
+        template_cache: TemplateCache | None = None,
+        validation: str = "in-process",
+        git_backend: str = "native",
+        io_workers: int = 1,
+        profiler: Profiler | None = None,
+        detach_cleanup: bool = False,
+        link_mode: str = "copy",
+        render_cache: RenderCache | None = None,
+        dedupe: bool = False,
+        observers: Iterable[GenerationObserver] | None = None,
     ):
         """
         Initialize the project generator.
@@ -33,6 +131,30 @@ class ProjectGenerator:
             author_email: Author's email address
             github_username: GitHub username
             output_dir: Directory where project will be created
+            template_cache: Compiled templates to render from (defaults to
+                the process-wide cache for the bundled templates)
+            validation: How to validate the generated project: "in-process",
+                "deep" (in-process, also parsing pyproject.toml and scanning
+                for unrendered placeholders) or "subprocess"
+            git_backend: How to create the git repository: "native" (built-in
+                writer, falls back to git on failure) or "subprocess"
+            io_workers: Number of threads creating directories and writing
+                files concurrently (1 writes sequentially)
+            profiler: Records a span for every phase and file operation
+            detach_cleanup: Delete directories replaced by ``force`` in a
+                separate process that outlives this one, instead of a
+                background thread
+            link_mode: How template files without placeholders are
+                materialized: "copy", "hardlink", "reflink" or "auto" (see
+                sinks.DirectorySink)
+            render_cache: On-disk cache that serves generate() calls with
+                the same templates and variables without rendering again
+            dedupe: Write every file once into the blob store shared by all
+                projects in ``output_dir`` and reflink it into the project
+                (see sinks.DedupSink); ``link_mode`` "hardlink" links to
+                read-only blobs instead
+            observers: Receive an event for every phase and file and the
+                GenerationResult of every generation (see events)
         """
         self.project_name = self._sanitize_project_name(project_name)
         self.description = description
@@ -40,8 +162,57 @@ class ProjectGenerator:
         self.author_email = author_email
         self.github_username = github_username
         self.output_dir = Path(output_dir)
+        if validation not in VALIDATION_MODES:
+            msg = f"validation must be one of {', '.join(VALIDATION_MODES)}"
+            raise ValueError(msg)
+        self.validation = validation
+        if git_backend not in GIT_BACKENDS:
+            msg = f"git_backend must be one of {', '.join(GIT_BACKENDS)}"
+            raise ValueError(msg)
+        self.git_backend = git_backend
+        self.io_workers = max(1, int(io_workers))
+        self.profiler = profiler
+        self.detach_cleanup = detach_cleanup
+        if link_mode not in LINK_MODES:
+            msg = f"link_mode must be one of {', '.join(LINK_MODES)}"
+            raise ValueError(msg)
+        self.link_mode = link_mode
+        self.render_cache = render_cache
+        self.dedupe = dedupe
+        self.observers: list[GenerationObserver] = list(observers or ())
 
         self.template_dir = Path(__file__).parent.parent.parent / "templates"
+        self.template_cache = template_cache or TemplateCache.shared(
+            self.template_dir, index_path=INDEX_PATH
+        )
+
+        self._update_report: UpdateReport | None = None
+        self._file_hashes: dict[str, str] = {}
+        self._file_contents: dict[str, bytes | None] = {}
+        self._file_modes: dict[str, int] = {}
+        self._created_dirs: dict[str, Future | None] = {}
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._io_futures: list[Future] = []
+        self._phase_stack: list[str] = []
+
+        #: Seconds spent in each of PHASES during the last generation
+        self.phase_timings: dict[str, float] = {}
+
+        #: Bytes linked from and written to the blob store by the last
+        #: generate() with ``dedupe``
+        self.dedup_stats: DedupStats | None = None
+
+        #: Counters of the last generate(), update() or render()
+        self.result: GenerationResult | None = None
+        self._result: GenerationResult | None = None
+        self._events_lock = threading.Lock()
+
+        #: Whether the last generate() was served from the render cache
+        self.cache_hit = False
+
+        #: Where the previous project was kept by generate(backup=True)
+        self.backup_path: Path | None = None
+        self._cleanup_threads: list[threading.Thread] = []
 
     @staticmethod
     def _sanitize_project_name(name: str) -> str:
@@ -66,7 +237,7 @@ class ProjectGenerator:
         return name or "YOUR_PROJECT"
 
     @classmethod
-    def from_interactive(cls) -> "ProjectGenerator":
+    def from_interactive(cls) -> ProjectGenerator:
         """
         Create generator instance from interactive prompts.
 
@@ -104,6 +275,33 @@ class ProjectGenerator:
             output_dir=output_dir,
         )
 
+    @staticmethod
+    def generate_many(
+        specs: list[dict],
+        jobs: int = 1,
+        force: bool = False,
+        init_git: bool = True,
+        backup: bool = False,
+    ) -> list:
+        """
+        Generate many projects across a process pool.
+
+        Args:
+            specs: ProjectGenerator keyword arguments for each project
+            jobs: Number of worker processes (0 uses all CPUs)
+            force: Force overwrite if a project directory exists
+            init_git: Initialize git repository in each project
+            backup: Keep directories replaced by ``force`` as backups
+
+        Returns:
+            List of batch.ProjectResult, one per spec in input order
+        """
+        from python_project_generator.batch import generate_many
+
+        return generate_many(
+            specs, jobs=jobs, force=force, init_git=init_git, backup=backup
+        )
+
     def _get_replacements(self) -> dict[str, str]:
         """
         Get placeholder replacement mapping.
@@ -120,208 +318,487 @@ class ProjectGenerator:
             "{{CURRENT_YEAR}}": str(date.today().year),
         }
 
-    def _replace_in_file(self, file_path: Path) -> None:
+    @cached_property
+    def renderer(self) -> Renderer:
         """
-        Replace placeholders in a file.
+        Placeholder renderer shared by every file of this generation.
+
+        Returns:
+            Renderer built once from the replacement mapping
+        """
+        return Renderer(self._get_replacements())
+
+    @contextmanager
+    def _observed_run(self, path: Path | None):
+        """
+        Collect the GenerationResult of a run and report it to observers.
 
         Args:
-            file_path: Path to file to process
+            path: Project directory the run writes to, if any
+
+        Yields:
+            The result being collected; ``self.result`` is set on success
         """
+        self.result = None
+        result = self._result = GenerationResult(path=path)
+        start = time.perf_counter()
         try:
-            content = file_path.read_text(encoding="utf-8")
-            replacements = self._get_replacements()
+            yield result
+        except BaseException as e:
+            for observer in self.observers:
+                observer.on_error(e)
+            raise
+        finally:
+            self._result = None
+        result.duration = time.perf_counter() - start
+        result.phase_timings = dict(self.phase_timings)
+        result.unknown_placeholders = sorted(self.renderer.unknown_placeholders)
+        self.result = result
+        for observer in self.observers:
+            observer.on_result(result)
 
-            for placeholder, value in replacements.items():
-                content = content.replace(placeholder, value)
+    def _emit_file(self, event: FileEvent) -> None:
+        """Count a file event and pass it to the observers."""
+        with self._events_lock:
+            if self._result is not None:
+                self._result.add(event)
+            for observer in self.observers:
+                observer.on_file(event)
 
-            file_path.write_text(content, encoding="utf-8")
-        except Exception:
-            pass
+    def _observed(self, func, dest: str, size: int):
+        """Wrap a file operation so it emits a FileEvent with its action."""
+
+        def observed(*args, **kwargs):
+            start = time.perf_counter()
+            action = func(*args, **kwargs)
+            duration = time.perf_counter() - start
+            self._emit_file(FileEvent(dest, action, size, duration))
 
-    def _copy_template_files(self, project_path: Path) -> None:
+        return observed
+
+    @contextmanager
+    def _phase(self, name: str, **details):
         """
-        Copy template files to project directory.
+        Add the time spent in a block to ``phase_timings[name]``.
 
-        Args:
-            project_path: Path to new project directory
-        """
-        # Copy all template files
-        for item in self.template_dir.rglob("*"):
-            if item.is_file():
-                rel_path = item.relative_to(self.template_dir)
-                if "md_files" in str(rel_path):
-                    dest_path = project_path / item.name
-                else:
-                    dest_path = project_path / rel_path
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(item, dest_path)
-                self._replace_in_file(dest_path)
-
-        # Copy .gitignore from root
-        gitignore_src = self.template_dir.parent / ".gitignore"
-        if gitignore_src.exists():
-            shutil.copy2(gitignore_src, project_path / ".gitignore")
-
-        # Copy .github from root
-        github_src = self.template_dir.parent / ".github"
-        if github_src.exists():
-            for item in github_src.rglob("*"):
-                if item.is_file():
-                    rel_path = item.relative_to(github_src)
-                    dest_path = project_path / ".github" / rel_path
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(item, dest_path)
-                    self._replace_in_file(dest_path)
-
-        # Copy .pre-commit-config.yaml from root
-        precommit_src = self.template_dir.parent / ".pre-commit-config.yaml"
-        if precommit_src.exists():
-            shutil.copy2(precommit_src, project_path / ".pre-commit-config.yaml")
-
-    def _create_project_structure(self, project_path: Path) -> None:
-        """
-        Create the project directory structure.
+        Phases may nest; time spent in an inner phase is not counted towards
+        the enclosing one, so the timings add up to the total run time.
 
         Args:
-            project_path: Path to new project directory
-        """
-        # Create main directories
-        (project_path / "src" / self.project_name).mkdir(parents=True, exist_ok=True)
-        (project_path / "tests").mkdir(parents=True, exist_ok=True)
-        (project_path / "docs").mkdir(parents=True, exist_ok=True)
-        (project_path / "scripts").mkdir(parents=True, exist_ok=True)
-
-        # Copy validate_project.py to scripts
-        validate_script_src = Path(__file__).parent.parent / "validate_project.py"
-        shutil.copy2(
-            validate_script_src, project_path / "scripts" / "validate_project.py"
-        )
+            name: One of PHASES
+            **details: Extra details for the profiler span
+        """
+        self._phase_stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            elapsed = end - start
+            if self.profiler is not None:
+                self.profiler.record(name, "phase", start, end, **details)
+            self._phase_stack.pop()
+            timings = self.phase_timings
+            timings[name] = timings.get(name, 0.0) + elapsed
+            if self._phase_stack:
+                parent = self._phase_stack[-1]
+                timings[parent] = timings.get(parent, 0.0) - elapsed
+            if self.observers:
+                event = PhaseEvent(phase=name, duration=elapsed, details=details)
+                for observer in self.observers:
+                    observer.on_phase(event)
 
-        # Package files: create main module(s)
+    def _write_file(
+        self,
+        sink: OutputSink,
+        dest: str,
+        *,
+        data: bytes | None = None,
+        source: Path | None = None,
+        digest: str | None = None,
+        mode: int = 0o644,
+        stream: bool = False,
+        size: int | None = None,
+    ) -> None:
+        """
+        Write one generated file and record its hash in the project manifest.
 
-        # Create main.py
-        main_content = '''"""Main module for the application."""\n\nimport logging\n\nlogger = logging.getLogger(__name__)\n\n\ndef hello_world() -> str:\n    """Return a greeting message."""\n    return "Hello, World!"\n\n\ndef main() -> None:\n    """Main entry point."""\n    logger.info(hello_world())\n\n\nif __name__ == "__main__":\n    logging.basicConfig(level=logging.INFO)\n    main()\n'''
-        (project_path / "src" / self.project_name / "main.py").write_text(main_content)
+        Exactly one of ``data`` (rendered contents) or ``source`` (a file
+        copied byte for byte, or rendered chunk by chunk with ``stream``)
+        must be given. In update mode the file is only
+        written if it changed and was not modified by the user.
 
-        # Create __init__.py
-        __init_content = f'''"""{self.project_name} package."""
+        Args:
+            sink: Output the project is written to
+            dest: Destination path relative to the project, POSIX style
+            data: File contents to write
+            source: File to copy
+            digest: Precomputed SHA-256 of the contents
+            mode: Permission bits of the template the file comes from
+            stream: Render ``source`` as a stream instead of copying it
+            size: Size of the written file, if it differs from ``source``
+        """
+        if digest is None:
+            digest = file_digest(data if data is not None else source.read_bytes())
+        if size is None:
+            size = len(data) if data is not None else Path(source).stat().st_size
 
-__version__ = "0.1.0"
+        if self._update_report is not None:
+            action = self._update_report.decide(sink.root, dest, digest)
+            if action == "conflict":
+                previous = self._update_report.previous.get(dest)
+                if previous is not None:
+                    self._file_hashes[dest] = previous
+                self._emit_file(FileEvent(dest, "conflict", size, 0.0))
+                return
+            self._file_hashes[dest] = digest
+            if action == "unchanged":
+                self._emit_file(FileEvent(dest, "skipped", size, 0.0))
+                return
+        else:
+            self._file_hashes[dest] = digest
 
-'''
-        (project_path / "src" / self.project_name / "__init__.py").write_text(
-            __init_content
+        self._file_contents[dest] = data
+        self._file_modes[dest] = mode
+        parent = dest.rpartition("/")[0]
+        if parent not in self._created_dirs:
+            self._created_dirs[parent] = (
+                self._run_io(self._traced(sink.mkdir, f"{parent}/"), parent)
+                if parent
+                else None
+            )
+        parent_ready = self._created_dirs[parent]
+        materialize = self._observed(self._traced(self._materialize, dest), dest, size)
+        renderer = self.renderer if stream else None
+        self._run_io(
+            materialize,
+            sink,
+            dest,
+            data=data,
+            source=source,
+            mode=mode,
+            parent_ready=parent_ready,
+            renderer=renderer,
+            size=size,
         )
 
-        # Create test files
+    def _traced(self, func, path: str):
+        """Wrap a file operation so the profiler records it, if one is set."""
+        if self.profiler is None:
+            return func
+        return self.profiler.traced(func, path, "file")
 
-        test_content = f'''"""Tests for main module."""\n\nimport pytest\nfrom {self.project_name}.main import hello_world\n\n\ndef test_hello_world():\n    """Test the hello_world function."""\n    assert hello_world() == "Hello, World!"\n\n\ndef test_hello_world_not_empty():\n    """Test that hello_world returns a non-empty string."""\n    result = hello_world()\n    assert isinstance(result, str)\n    assert len(result) > 0\n'''
-        (project_path / "tests" / "test_main.py").write_text(test_content)
+    @staticmethod
+    def _materialize(
+        sink: OutputSink,
+        dest: str,
+        *,
+        data: bytes | None,
+        source: Path | None,
+        mode: int,
+        parent_ready: Future | None = None,
+        renderer: Renderer | None = None,
+        size: int = 0,
+    ) -> str:
+        """
+        Hand one file's contents to the output sink.
 
-        # Create __init__.py for tests
-        (project_path / "tests" / "__init__.py").write_text("")
+        Args:
+            sink: Output the project is written to
+            dest: Destination path relative to the project
+            data: File contents, or None to copy ``source``
+            source: File to copy when ``data`` is None
+            mode: Permission bits of the template the file comes from
+            parent_ready: Pending creation of the parent directory
+            renderer: Render ``source`` with this renderer chunk by chunk
+                instead of copying it
+            size: Size of the rendered file, when ``renderer`` is given
 
-        # Create __main__.py for CLI entry
-        main_entry = f'''"""Main entry point for {self.project_name}"""\n\nimport sys\nfrom {self.project_name}.main import main\n\nif __name__ == "__main__":\n    sys.exit(main())\n'''
-        (project_path / "__main__.py").write_text(main_entry)
+        Returns:
+            The file's action: "rendered", "copied" or "linked"
+        """
+        if parent_ready is not None:
+            parent_ready.result()
+        if renderer is not None:
+            sink.write_rendered(dest, source, renderer, size, mode)
+        elif data is None:
+            method = sink.copy_file(dest, source, mode)
+            return "linked" if method in ("hardlink", "reflink") else "copied"
+        else:
+            sink.write_bytes(dest, data, mode)
+        return "rendered"
 
-        # Create Makefile
-        makefile_content = """# Makefile for Python project
+    def _run_io(self, func, *args, **kwargs) -> Future | None:
+        """
+        Run a filesystem operation, on the I/O thread pool if one is active.
 
-.PHONY: help install test lint format clean
+        Returns:
+            The pending operation, or None if it already ran
+        """
+        if self._io_pool is None:
+            func(*args, **kwargs)
+            return None
+        future = self._io_pool.submit(func, *args, **kwargs)
+        self._io_futures.append(future)
+        return future
 
-help:  ## Show this help
-	@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort | awk 'BEGIN {FS = ":.*?## "}; {printf "\033[36m%-20s\033[0m %s\n", $$1, $$2}'
+    def build_plan(self) -> GenerationPlan:
+        """
+        Compile the plan of every directory and file of the project.
 
-install:  ## Install dependencies
-	pip install -e .
+        Returns:
+            GenerationPlan for the current template set
+        """
+        with self._phase("load"):
+            return GenerationPlan.build(self.template_cache.files(), VALIDATE_SCRIPT)
 
-test:  ## Run tests
-	pytest
+    def _write_entry(self, entry: PlanEntry, sink: OutputSink) -> None:
+        """
+        Materialize one plan entry, writing the destination exactly once.
 
-lint:  ## Run linting
-	flake8 src tests
+        Copy entries (files without placeholders, and binaries) are copied
+        byte for byte; render entries are rendered in memory and written in
+        one call.
 
-format:  ## Format code
-	black src tests
+        Args:
+            entry: Plan entry
+            sink: Output the project is written to
+        """
+        dest = entry.dest
+        if "{{" in dest:
+            dest = self.renderer.render(dest)
 
-clean:  ## Clean up
-	rm -rf build dist *.egg-info
-"""
-        (project_path / "Makefile").write_text(makefile_content)
+        if entry.operation == "stream":
+            self._write_stream(sink, dest, entry)
+            return
 
-    def generate(self, force: bool = False, init_git: bool = True) -> Path:
+        if entry.operation == "copy":
+            self._write_file(
+                sink,
+                dest,
+                source=entry.source,
+                digest=entry.sha256,
+                mode=entry.mode,
+            )
+            return
+
+        with self._phase("render", file=dest):
+            content = self.renderer.render_segments(entry.segments)
+        self._write_file(sink, dest, data=content.encode("utf-8"), mode=entry.mode)
+
+    def _write_stream(self, sink: OutputSink, dest: str, entry: PlanEntry) -> None:
         """
-        Generate the project.
+        Render a large template from disk without holding it in memory.
+
+        The manifest needs the digest before the file is written, so the
+        rendered output is hashed in a first streaming pass and rendered into
+        the sink in a second one. A template that turns out not to be UTF-8
+        is copied byte for byte.
 
         Args:
-            force: Force overwrite if directory exists
-            init_git: Initialize git repository
+            sink: Output the project is written to
+            dest: Rendered destination path
+            entry: Plan entry with operation "stream"
+        """
+        import hashlib
 
-        Returns:
-            Path to created project
+        with self._phase("render", file=dest):
+            hasher = hashlib.sha256()
+            size = 0
+            try:
+                with entry.source.open("rb") as file:
+                    for chunk in self.renderer.render_chunks(file):
+                        hasher.update(chunk)
+                        size += len(chunk)
+            except UnicodeDecodeError:
+                hasher = None
 
-        Raises:
-            FileExistsError: If project directory exists and force=False
+        if hasher is None:
+            self._write_file(
+                sink, dest, source=entry.source, digest=entry.sha256, mode=entry.mode
+            )
+            return
+        self._write_file(
+            sink,
+            dest,
+            source=entry.source,
+            digest=hasher.hexdigest(),
+            mode=entry.mode,
+            stream=True,
+            size=size,
+        )
+
+    def _execute_plan(self, plan: GenerationPlan, sink: OutputSink) -> None:
         """
-        import subprocess
+        Create the directories and files of a plan.
 
-        project_path = self.output_dir / self.project_name
+        Args:
+            plan: Plan to execute
+            sink: Output the project is written to
+        """
+        self._make_directories(
+            (self.renderer.render(directory) for directory in plan.directories),
+            sink,
+        )
 
-        # Check if directory exists
-        if project_path.exists():
-            if not force:
-                msg = (
-                    f"Directory '{project_path}' already exists. "
-                    "Use --force to overwrite."
+        with self._phase("copy"):
+            for entry in plan.entries:
+                self._write_entry(entry, sink)
+
+    def _make_directories(self, directories, sink: OutputSink) -> None:
+        """Create project directories that no file has created yet."""
+        with self._phase("structure"):
+            for directory in directories:
+                if directory not in self._created_dirs:
+                    self._created_dirs[directory] = self._run_io(
+                        self._traced(sink.mkdir, f"{directory}/"), directory
+                    )
+
+    def _execute_cached(self, cached: CachedRender, sink: OutputSink) -> None:
+        """
+        Copy the files of a cached render instead of rendering them.
+
+        Args:
+            cached: Render found in the render cache
+            sink: Output the project is written to
+        """
+        self._make_directories(cached.directories, sink)
+        with self._phase("copy"):
+            for dest, digest, mode in cached.files:
+                self._write_file(
+                    sink,
+                    dest,
+                    source=cached.file_path(dest),
+                    digest=digest,
+                    mode=mode,
                 )
-                raise FileExistsError(msg)
-            shutil.rmtree(project_path)
+        self.renderer.unknown_placeholders.update(cached.unknown_placeholders)
+
+    def _lookup_render(
+        self, plan: GenerationPlan
+    ) -> tuple[str | None, CachedRender | None]:
+        """
+        Look the project up in the render cache, if one is set.
+
+        Returns:
+            The cache key (None without a cache) and the cached render (None
+            on a miss)
+        """
+        if self.render_cache is None:
+            return None, None
+        from python_project_generator.render_cache import render_key
+
+        with self._phase("cache"):
+            key = render_key(plan.digest(), self._get_replacements())
+            return key, self.render_cache.lookup(key)
+
+    def _store_render(self, key: str, plan: GenerationPlan, root: Path) -> None:
+        """Add the project just rendered into ``root`` to the render cache."""
+        # The cache is an optimization; a full or read-only cache directory
+        # must not fail the generation
+        with self._phase("cache"), suppress(OSError):
+            self.render_cache.store(
+                key,
+                root,
+                [self.renderer.render(directory) for directory in plan.directories],
+                self._file_hashes,
+                self.renderer.unknown_placeholders,
+                modes=self._file_modes,
+            )
 
-        # Create project directory
-        project_path.mkdir(parents=True, exist_ok=True)
+    def _init_git(self, project_path: Path) -> None:
+        """
+        Initialize a git repository with an initial commit.
 
-        # Copy template files
-        self._copy_template_files(project_path)
+        The native writer builds the repository from the files rendered in
+        this generation; if it fails (or ``git_backend="subprocess"``), the
+        ``git`` command line is used instead.
 
-        # Create project structure
-        self._create_project_structure(project_path)
+        Args:
+            project_path: Path to the project directory
+        """
+        if self.git_backend == "native":
+            from python_project_generator.gitwriter import init_repository
 
-        # Initialize git if requested
-        if init_git:
             try:
-                subprocess.run(
-                    ["git", "init"],
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True,
-                )
-                subprocess.run(
-                    ["git", "add", "."],
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True,
+                init_repository(
+                    project_path,
+                    self._file_contents,
+                    self.author_name,
+                    self.author_email,
+                    GIT_COMMIT_MESSAGE,
                 )
-                subprocess.run(
-                    [
-                        "git",
-                        "commit",
-                        "-m",
-                        "Initial commit from python-project-generator",
-                    ],
-                    cwd=project_path,
-                    check=True,
-                    capture_output=True,
-                )
-            except subprocess.CalledProcessError:
-                pass
-            except FileNotFoundError:
-                pass
+                return
+            except (OSError, ValueError):
+                import shutil
+
+                shutil.rmtree(project_path / ".git", ignore_errors=True)
+
+        self._init_git_subprocess(project_path)
+
+    @staticmethod
+    def _init_git_subprocess(project_path: Path) -> None:
+        """Initialize the repository by running git init, add and commit."""
+        import subprocess
+
+        try:
+            subprocess.run(
+                ["git", "init"],
+                cwd=project_path,
+                check=True,
+                capture_output=True,
+            )
+            subprocess.run(
+                ["git", "add", "."],
+                cwd=project_path,
+                check=True,
+                capture_output=True,
+            )
+            subprocess.run(
+                ["git", "commit", "-m", GIT_COMMIT_MESSAGE],
+                cwd=project_path,
+                check=True,
+                capture_output=True,
+            )
+        except subprocess.CalledProcessError:
+            pass
+        except FileNotFoundError:
+            pass
+
+    def _validate(self, project_path: Path) -> None:
+        """
+        Validate the generated project using the included script.
+
+        By default the script's ``validate`` function runs in this process;
+        with ``validation="subprocess"`` the copied script is executed with
+        the current interpreter instead.
+
+        Args:
+            project_path: Path to the project directory
+
+        Raises:
+            RuntimeError: If the project fails validation
+        """
+        if self.validation == "subprocess":
+            self._validate_subprocess(project_path)
+            return
+
+        deep = self.validation == "deep"
+        result = _load_validator().validate(project_path, deep=deep)
+        if not result.ok:
+            details = "".join(f"\n  - {error}" for error in result.errors)
+            msg = f"Generated project validation failed:{details}"
+            raise RuntimeError(msg)
+
+    @staticmethod
+    def _validate_subprocess(project_path: Path) -> None:
+        """Run scripts/validate_project.py in a child interpreter."""
+        import subprocess
+        import sys
 
-        # Validate the generated project using the included script
         try:
             subprocess.run(
-                ["python", "scripts/validate_project.py"],
+                [sys.executable, "scripts/validate_project.py"],
                 cwd=project_path,
                 check=True,
                 capture_output=True,
@@ -332,4 +809,297 @@ clean:  ## Clean up
             msg = f"Generated project validation failed: {e.stdout}"
             raise RuntimeError(msg) from e
 
+    def _render_project(
+        self,
+        sink: OutputSink,
+        plan: GenerationPlan | None = None,
+        cached: CachedRender | None = None,
+    ) -> None:
+        """
+        Write all generated files and the project manifest.
+
+        Args:
+            sink: Output the project is written to
+            plan: Plan to execute (built from the templates when None)
+            cached: Cached render to copy instead of executing the plan
+        """
+        self._file_hashes = {}
+        self._file_contents = {}
+        self._file_modes = {}
+        self._created_dirs = {}
+        self._io_futures = []
+        if self.io_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=self.io_workers, thread_name_prefix="ppg-io"
+            )
+
+        try:
+            if cached is not None:
+                self._execute_cached(cached, sink)
+            else:
+                self._execute_plan(plan or self.build_plan(), sink)
+
+            # Surface the first failure in submission order
+            with self._phase("flush"):
+                for future in self._io_futures:
+                    future.result()
+        finally:
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True, cancel_futures=True)
+                self._io_pool = None
+
+        with self._phase("flush"):
+            manifest = dumps_project_manifest(self._file_hashes)
+            sink.write_bytes(MANIFEST_NAME, manifest)
+        self._file_contents[MANIFEST_NAME] = manifest
+
+    @property
+    def project_path(self) -> Path:
+        """Directory the project is generated in."""
+        return self.output_dir / self.project_name
+
+    def render(self, sink: OutputSink) -> OutputSink:
+        """
+        Render the project into an output sink.
+
+        Unlike generate(), this neither checks for an existing project nor
+        initializes git or validates the result, so it works with sinks that
+        do not write to disk.
+
+        Args:
+            sink: Output to write the project to, e.g. MemorySink or
+                DryRunSink
+
+        Returns:
+            The sink, after it has been closed
+        """
+        self._update_report = None
+        self.phase_timings = {}
+        with self._observed_run(getattr(sink, "root", None)):
+            self._render_project(sink)
+            with self._phase("flush"):
+                sink.close()
+        return sink
+
+    def generate_archive(self, fileobj: BinaryIO, fmt: str = "tar.gz") -> None:
+        """
+        Stream the project as an archive without writing it to disk.
+
+        Entries are placed under a top-level directory named after the
+        project and written in path order.
+
+        Args:
+            fileobj: Binary file object to write the archive to; it does not
+                need to be seekable
+            fmt: Archive format, "tar.gz" or "zip"
+        """
+        self.render(archive_sink(fmt, fileobj, prefix=self.project_name))
+
+    def render_to_memory(self) -> dict[str, bytes]:
+        """
+        Render the project in memory without touching disk.
+
+        Returns:
+            Mapping of project-relative POSIX paths to file contents
+        """
+        return self.render(MemorySink()).files
+
+    def generate(
+        self, force: bool = False, init_git: bool = True, backup: bool = False
+    ) -> Path:
+        """
+        Generate the project.
+
+        The project is generated and validated in a hidden staging directory
+        next to its final location and then renamed into place, so a failed
+        run leaves no partial project behind. Runs targeting the same project
+        path are serialized with a lock file.
+
+        With ``force``, an existing directory is renamed aside and deleted in
+        the background; with ``backup`` it is kept as
+        ``<name>.bak-<timestamp>`` instead. Directories left behind by
+        interrupted runs are removed on later runs.
+
+        With a ``render_cache``, a project whose templates and variables
+        match an earlier run is copied from the cache instead of rendered;
+        ``cache_hit`` tells which happened.
+
+        The counters of the run are kept in ``result`` and passed to the
+        observers along with an event for every phase and file.
+
+        Args:
+            force: Force overwrite if directory exists
+            init_git: Initialize git repository
+            backup: Keep the directory replaced by ``force`` as a backup
+
+        Returns:
+            Path to created project
+
+        Raises:
+            FileExistsError: If project directory exists and force=False
+        """
+        self.cache_hit = False
+        self.dedup_stats = None
+        with self._observed_run(self.project_path) as result:
+            project_path = self._generate(force, init_git, backup)
+            result.cache_hit = self.cache_hit
+            result.dedup = self.dedup_stats
+        return project_path
+
+    def _generate(self, force: bool, init_git: bool, backup: bool) -> Path:
+        """Stage, check and publish the project; see generate()."""
+        from python_project_generator import staging, trash
+
+        project_path = self.project_path
+        self.phase_timings = {}
+        self.backup_path = None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Leftovers are claimed first, so concurrent runs never delete the
+        # same directory twice
+        self._discard(*trash.find_leftovers(self.output_dir))
+
+        with staging.project_lock(project_path):
+            # Nobody else can be staging this project while we hold the lock
+            self._discard(*staging.find_staging(project_path))
+
+            # Check if directory exists
+            if project_path.exists() and not force:
+                msg = (
+                    f"Directory '{project_path}' already exists. "
+                    "Use --force to overwrite."
+                )
+                raise FileExistsError(msg)
+
+            staged = staging.staging_path(project_path)
+            staged.mkdir()
+            try:
+                self._update_report = None
+                plan = self.build_plan()
+                cache_key, cached = self._lookup_render(plan)
+                sink = self._directory_sink(staged, cached=cached is not None)
+                try:
+                    self._render_project(sink, plan, cached)
+                except OSError:
+                    if cached is None:
+                        raise
+                    # The entry was evicted while it was being copied
+                    cached = None
+                    sink = self._directory_sink(staged)
+                    self._render_project(sink, plan)
+                self.cache_hit = cached is not None
+                if isinstance(sink, DedupSink):
+                    self.dedup_stats = sink.stats
+
+                # Initialize git if requested
+                if init_git:
+                    with self._phase("git"):
+                        self._init_git(staged)
+
+                with self._phase("validate"):
+                    self._validate(staged)
+
+                if cache_key is not None and cached is None:
+                    self._store_render(cache_key, plan, staged)
+            except BaseException:
+                self._discard(staged)
+                raise
+
+            if project_path.exists() or project_path.is_symlink():
+                with self._phase("clean"):
+                    if backup:
+                        self.backup_path = trash.move_to_backup(project_path)
+                    else:
+                        self._discard(trash.move_aside(project_path))
+
+            with self._phase("publish"):
+                staging.publish(staged, project_path)
+
         return project_path
+
+    def _directory_sink(self, root: Path, cached: bool = False) -> DirectorySink:
+        """
+        Return the sink that writes the project files below ``root``.
+
+        Files served from the render cache are cloned or copied whatever the
+        ``link_mode`` and ``dedupe`` settings, so the project never shares an
+        inode with the cache entry.
+
+        Args:
+            root: Directory the project is written to
+            cached: Whether the files come from the render cache
+        """
+        if cached:
+            return DirectorySink(root, "reflink")
+        if not self.dedupe:
+            return DirectorySink(root, self.link_mode)
+        from python_project_generator.blobstore import BlobStore
+
+        store = BlobStore.for_output(self.output_dir)
+        return DedupSink(root, store, self.link_mode)
+
+    def _discard(self, *paths: Path) -> None:
+        """Delete directories that were moved aside, without waiting for them."""
+        if not paths:
+            return
+        from python_project_generator.trash import delete_in_background
+
+        thread = delete_in_background(*paths, detach=self.detach_cleanup)
+        if thread is not None:
+            self._cleanup_threads.append(thread)
+
+    def wait_for_cleanup(self, timeout: float | None = None) -> None:
+        """
+        Wait until directories replaced by generate(force=True) are deleted.
+
+        Args:
+            timeout: Maximum seconds to wait for each deletion
+        """
+        for thread in self._cleanup_threads:
+            thread.join(timeout)
+        self._cleanup_threads = [
+            thread for thread in self._cleanup_threads if thread.is_alive()
+        ]
+
+    def update(self) -> UpdateReport:
+        """
+        Re-render an existing project, rewriting only files that changed.
+
+        Files are compared with the hashes recorded in the project manifest
+        when the project was generated or last updated. Unchanged files are
+        skipped, files whose template or variables changed are rewritten, and
+        files modified by the user are left alone and reported as conflicts.
+
+        Returns:
+            UpdateReport listing written, unchanged and conflicting files
+
+        Raises:
+            FileNotFoundError: If the project directory does not exist
+        """
+        with self._observed_run(self.project_path):
+            return self._update()
+
+    def _update(self) -> UpdateReport:
+        """Rewrite the changed files of the project; see update()."""
+        project_path = self.project_path
+        if not project_path.is_dir():
+            msg = f"Directory '{project_path}' does not exist. Nothing to update."
+            raise FileNotFoundError(msg)
+
+        from python_project_generator.staging import project_lock
+
+        with project_lock(project_path):
+            report = UpdateReport(previous=load_project_manifest(project_path))
+            self.phase_timings = {}
+            self._update_report = report
+            try:
+                self._render_project(self._directory_sink(project_path))
+            finally:
+                self._update_report = None
+
+            report.orphaned = sorted(set(report.previous) - set(self._file_hashes))
+            with self._phase("validate"):
+                self._validate(project_path)
+        return report
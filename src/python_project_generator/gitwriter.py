@@ -0,0 +1,325 @@
+"""
+Native git repository writer.
+
+Creates a git repository with an initial commit directly, without running
+``git``: all blob, tree and commit objects go into a single packfile with
+its index, followed by the staging index, HEAD and the branch ref. The result
+is a regular repository that ``git status`` reports as clean.
+
+Files read from the working tree are hashed and compressed into the pack in
+chunks, so memory use does not depend on file size.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+import time
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from python_project_generator.renderer import CHUNK_SIZE, read_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+_OBJ_TYPES = {"commit": 1, "tree": 2, "blob": 3}
+
+#: Pack index offsets with this bit set point into the 64-bit offset table
+_LARGE_OFFSET = 0x80000000
+
+_CONFIG = """[core]
+\trepositoryformatversion = 0
+\tfilemode = true
+\tbare = false
+\tlogallrefupdates = true
+"""
+
+
+def _object_id(kind: str, data: bytes) -> bytes:
+    """Return the binary SHA-1 git assigns to an object."""
+    header = f"{kind} {len(data)}\0".encode()
+    return hashlib.sha1(header + data, usedforsecurity=False).digest()
+
+
+def _file_object_id(path: Path, size: int) -> bytes:
+    """Return the blob id of a file, reading it in chunks."""
+    hasher = hashlib.sha1(f"blob {size}\0".encode(), usedforsecurity=False)
+    for chunk in read_chunks(path):
+        hasher.update(chunk)
+    return hasher.digest()
+
+
+def _entry_header(kind: str, size: int) -> bytes:
+    """Encode the type and size header of an undeltified packfile entry."""
+    byte = (_OBJ_TYPES[kind] << 4) | (size & 0x0F)
+    size >>= 4
+    header = bytearray()
+    while size:
+        header.append(byte | 0x80)
+        byte = size & 0x7F
+        size >>= 7
+    header.append(byte)
+    return bytes(header)
+
+
+class _PackFile:
+    """Packfile being written, with its running offset and SHA-1."""
+
+    def __init__(self, file):
+        """Wrap an open binary file."""
+        self.file = file
+        self.offset = 0
+        self.sha1 = hashlib.sha1(usedforsecurity=False)
+
+    def write(self, data: bytes) -> None:
+        """Append bytes to the pack."""
+        self.file.write(data)
+        self.sha1.update(data)
+        self.offset += len(data)
+
+    def write_entry(self, kind: str, content: bytes | Path) -> int:
+        """
+        Append one undeltified object, compressing file contents in chunks.
+
+        Args:
+            kind: Object type
+            content: Object data, or a file whose contents are the data
+
+        Returns:
+            CRC-32 of the entry, for the pack index
+
+        Raises:
+            ValueError: If a file changed size while it was being packed
+        """
+        if isinstance(content, Path):
+            size = content.stat().st_size
+            chunks = read_chunks(content)
+        else:
+            size = len(content)
+            chunks = iter((content,))
+        header = _entry_header(kind, size)
+        self.write(header)
+        crc = zlib.crc32(header)
+        compressor = zlib.compressobj(1)
+        written = 0
+        for chunk in chunks:
+            written += len(chunk)
+            compressed = compressor.compress(chunk)
+            if compressed:
+                self.write(compressed)
+                crc = zlib.crc32(compressed, crc)
+        compressed = compressor.flush()
+        self.write(compressed)
+        crc = zlib.crc32(compressed, crc)
+        if written != size:
+            msg = f"{content} changed while it was being committed"
+            raise ValueError(msg)
+        return crc
+
+
+def _build_trees(
+    entries: dict[str, tuple[int, bytes]],
+    objects: dict[bytes, tuple[str, bytes | Path]],
+) -> bytes:
+    """
+    Build tree objects for a flat mapping of paths to (mode, blob id).
+
+    Args:
+        entries: Mapping of POSIX paths to (git file mode, blob id)
+        objects: Collected objects; tree objects are added to it
+
+    Returns:
+        Id of the root tree
+    """
+    root: dict = {}
+    for path, value in entries.items():
+        node = root
+        *parents, name = path.split("/")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+
+    def write_tree(node: dict) -> bytes:
+        items = []
+        for name, value in node.items():
+            if isinstance(value, dict):
+                # Git sorts directories as if their names ended with "/"
+                items.append((name + "/", b"40000", name, write_tree(value)))
+            else:
+                mode, oid = value
+                items.append((name, b"%o" % mode, name, oid))
+        items.sort(key=lambda item: item[0].encode())
+        data = b"".join(
+            mode + b" " + name.encode() + b"\0" + oid for _, mode, name, oid in items
+        )
+        oid = _object_id("tree", data)
+        objects[oid] = ("tree", data)
+        return oid
+
+    return write_tree(root)
+
+
+def _write_pack(git_dir: Path, objects: dict[bytes, tuple[str, bytes | Path]]) -> None:
+    """
+    Write all objects into one packfile plus its version 2 index.
+
+    Objects given as a Path are streamed from that file.
+    """
+    pack_dir = git_dir / "objects" / "pack"
+    temp = pack_dir / f"tmp_pack_{os.getpid()}"
+    offsets = {}
+    crcs = {}
+    try:
+        with temp.open("wb") as file:
+            pack = _PackFile(file)
+            pack.write(b"PACK" + struct.pack(">II", 2, len(objects)))
+            for oid, (kind, content) in objects.items():
+                offsets[oid] = pack.offset
+                crcs[oid] = pack.write_entry(kind, content)
+            pack_checksum = pack.sha1.digest()
+            file.write(pack_checksum)
+    except BaseException:
+        temp.unlink(missing_ok=True)
+        raise
+
+    oids = sorted(objects)
+    fanout = [0] * 256
+    for oid in oids:
+        fanout[oid[0]] += 1
+    total = 0
+    for index, count in enumerate(fanout):
+        total += count
+        fanout[index] = total
+
+    idx = bytearray(b"\377tOc" + struct.pack(">I", 2))
+    idx += struct.pack(">256I", *fanout)
+    idx += b"".join(oids)
+    idx += b"".join(struct.pack(">I", crcs[oid]) for oid in oids)
+    # Offsets of 2 GiB and more go into a table of 64-bit offsets
+    large_offsets = []
+    for oid in oids:
+        offset = offsets[oid]
+        if offset < _LARGE_OFFSET:
+            idx += struct.pack(">I", offset)
+        else:
+            idx += struct.pack(">I", _LARGE_OFFSET | len(large_offsets))
+            large_offsets.append(offset)
+    idx += b"".join(struct.pack(">Q", offset) for offset in large_offsets)
+    idx += pack_checksum
+    idx += hashlib.sha1(idx, usedforsecurity=False).digest()
+
+    name = f"pack-{pack_checksum.hex()}"
+    temp.replace(pack_dir / f"{name}.pack")
+    (pack_dir / f"{name}.idx").write_bytes(idx)
+
+
+def _write_index(
+    git_dir: Path, project_path: Path, entries: dict[str, tuple[int, bytes]]
+) -> None:
+    """Write a version 2 staging index matching the working tree."""
+    body = bytearray(b"DIRC" + struct.pack(">II", 2, len(entries)))
+    for path in sorted(entries, key=str.encode):
+        mode, oid = entries[path]
+        stat = (project_path / path).stat()
+        encoded = path.encode()
+        body += struct.pack(
+            ">10I",
+            int(stat.st_ctime) & 0xFFFFFFFF,
+            stat.st_ctime_ns % 1_000_000_000,
+            int(stat.st_mtime) & 0xFFFFFFFF,
+            stat.st_mtime_ns % 1_000_000_000,
+            stat.st_dev & 0xFFFFFFFF,
+            stat.st_ino & 0xFFFFFFFF,
+            mode,
+            stat.st_uid & 0xFFFFFFFF,
+            stat.st_gid & 0xFFFFFFFF,
+            stat.st_size & 0xFFFFFFFF,
+        )
+        body += oid + struct.pack(">H", min(len(encoded), 0xFFF)) + encoded
+        # Entries are NUL-terminated and padded to a multiple of 8 bytes
+        body += b"\0" * (8 - (62 + len(encoded)) % 8)
+    body += hashlib.sha1(body, usedforsecurity=False).digest()
+    (git_dir / "index").write_bytes(body)
+
+
+def _identity(name: str, email: str, role: str) -> str:
+    """Format an author or committer line, honoring git's environment."""
+    name = os.environ.get(f"GIT_{role}_NAME", name)
+    email = os.environ.get(f"GIT_{role}_EMAIL", email)
+    timestamp = int(os.environ.get("SOURCE_DATE_EPOCH", time.time()))
+    offset = time.localtime(timestamp).tm_gmtoff // 60
+    sign = "+" if offset >= 0 else "-"
+    zone = f"{sign}{abs(offset) // 60:02d}{abs(offset) % 60:02d}"
+    return f"{name} <{email}> {timestamp} {zone}"
+
+
+def init_repository(
+    project_path: Path,
+    files: Mapping[str, bytes | None],
+    author_name: str,
+    author_email: str,
+    message: str,
+    *,
+    branch: str = "main",
+) -> str:
+    """
+    Create a git repository whose first commit contains the given files.
+
+    Args:
+        project_path: Working tree that already contains the files
+        files: Mapping of POSIX paths to their contents; ``None`` reads the
+            file from the working tree (in chunks, if it is large)
+        author_name: Author and committer name
+        author_email: Author and committer email
+        message: Commit message
+        branch: Branch HEAD points to
+
+    Returns:
+        Hex id of the initial commit
+
+    Raises:
+        FileExistsError: If the project already contains a ``.git`` directory
+    """
+    project_path = Path(project_path)
+    git_dir = project_path / ".git"
+    if git_dir.exists():
+        msg = f"Git repository already exists in '{project_path}'"
+        raise FileExistsError(msg)
+
+    objects: dict[bytes, tuple[str, bytes | Path]] = {}
+    entries: dict[str, tuple[int, bytes]] = {}
+    for path, data in files.items():
+        file_path = project_path / path
+        stat = file_path.stat()
+        mode = 0o100755 if stat.st_mode & 0o111 else 0o100644
+        if data is None and stat.st_size > CHUNK_SIZE:
+            # Hashed now and compressed into the pack later, chunk by chunk
+            oid = _file_object_id(file_path, stat.st_size)
+            objects[oid] = ("blob", file_path)
+        else:
+            contents = file_path.read_bytes() if data is None else data
+            oid = _object_id("blob", contents)
+            objects[oid] = ("blob", contents)
+        entries[path] = (mode, oid)
+
+    tree = _build_trees(entries, objects)
+    commit = (
+        f"tree {tree.hex()}\n"
+        f"author {_identity(author_name, author_email, 'AUTHOR')}\n"
+        f"committer {_identity(author_name, author_email, 'COMMITTER')}\n"
+        f"\n{message}\n"
+    ).encode()
+    commit_id = _object_id("commit", commit)
+    objects[commit_id] = ("commit", commit)
+
+    for directory in ("objects/info", "objects/pack", "refs/heads", "refs/tags"):
+        (git_dir / directory).mkdir(parents=True, exist_ok=True)
+    _write_pack(git_dir, objects)
+    _write_index(git_dir, project_path, entries)
+    (git_dir / "config").write_text(_CONFIG)
+    (git_dir / "HEAD").write_text(f"ref: refs/heads/{branch}\n")
+    (git_dir / "refs" / "heads" / branch).write_text(f"{commit_id.hex()}\n")
+    return commit_id.hex()
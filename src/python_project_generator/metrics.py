@@ -0,0 +1,236 @@
+"""
+OpenMetrics export of generation metrics.
+
+OpenMetricsExporter is a GenerationObserver that aggregates latency
+histograms (per generation and per phase) and file counters across any
+number of generations, and formats them in the OpenMetrics text format read
+by Prometheus and compatible scrapers:
+
+    exporter = OpenMetricsExporter()
+    ProjectGenerator(..., observers=[exporter]).generate()
+    exporter.write(Path("/var/lib/node_exporter/ppg.prom"))
+
+The generation server exposes the same metrics at ``GET /metrics``.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from python_project_generator.events import GenerationObserver, GenerationResult
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+#: Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+PREFIX = "ppg"
+
+
+class _Histogram:
+    """Cumulative histogram of observed values."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        """Initialize an empty histogram with sorted bucket upper bounds."""
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count one value."""
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+
+    def lines(self, name: str, labels: str = "") -> Iterable[str]:
+        """Yield the bucket, count and sum samples of the histogram."""
+        separator = "," if labels else ""
+        for index, bound in enumerate(self.buckets):
+            count = self.counts[index]
+            yield f'{name}_bucket{{{labels}{separator}le="{bound}"}} {count}'
+        yield f'{name}_bucket{{{labels}{separator}le="+Inf"}} {self.count}'
+        braces = f"{{{labels}}}" if labels else ""
+        yield f"{name}_count{braces} {self.count}"
+        yield f"{name}_sum{braces} {self.sum}"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpenMetricsExporter(GenerationObserver):
+    """Aggregate generation metrics and format them as OpenMetrics text."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Initialize empty metrics.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._generations = _Histogram(self.buckets)
+        self._phases: dict[str, _Histogram] = {}
+        self._outcomes: dict[str, int] = {"success": 0, "failure": 0}
+        self._errors: dict[str, int] = {}
+        self._files: dict[str, int] = {}
+        self._bytes_written = 0
+        self._cache_hits = 0
+
+    def on_result(self, result: GenerationResult) -> None:
+        """Record a completed generation."""
+        self.observe(
+            result.duration,
+            result.phase_timings,
+            files=result.actions,
+            bytes_written=result.bytes_written,
+            cache_hit=result.cache_hit,
+        )
+
+    def on_error(self, error: BaseException) -> None:
+        """Record a failed generation and the type of its exception."""
+        self.observe_failure(type(error).__name__)
+
+    def observe_failure(self, error_type: str | None = None) -> None:
+        """
+        Record a failed generation, e.g. one that ran in another process.
+
+        Args:
+            error_type: Name of the exception class, if known
+        """
+        with self._lock:
+            self._outcomes["failure"] += 1
+            if error_type:
+                self._errors[error_type] = self._errors.get(error_type, 0) + 1
+
+    def observe(
+        self,
+        duration: float,
+        phase_timings: Mapping[str, float],
+        files: Mapping[str, int] | None = None,
+        bytes_written: int = 0,
+        cache_hit: bool = False,
+    ) -> None:
+        """
+        Record a completed generation from its timings and counters.
+
+        Args:
+            duration: Seconds the generation took
+            phase_timings: Seconds per phase
+            files: Number of files per action
+            bytes_written: Bytes of the files written
+            cache_hit: Whether the project came from the render cache
+        """
+        with self._lock:
+            self._outcomes["success"] += 1
+            self._generations.observe(duration)
+            for phase, seconds in phase_timings.items():
+                histogram = self._phases.get(phase)
+                if histogram is None:
+                    histogram = self._phases[phase] = _Histogram(self.buckets)
+                histogram.observe(seconds)
+            for action, count in (files or {}).items():
+                self._files[action] = self._files.get(action, 0) + count
+            self._bytes_written += bytes_written
+            self._cache_hits += int(cache_hit)
+
+    def render(self) -> str:
+        """
+        Format the metrics in the OpenMetrics text format.
+
+        Returns:
+            Exposition text ending with ``# EOF``
+        """
+        with self._lock:
+            lines = [
+                f"# TYPE {PREFIX}_generation_duration_seconds histogram",
+                (
+                    f"# HELP {PREFIX}_generation_duration_seconds "
+                    "Wall-clock time of completed generations."
+                ),
+                f"# UNIT {PREFIX}_generation_duration_seconds seconds",
+                *self._generations.lines(f"{PREFIX}_generation_duration_seconds"),
+                f"# TYPE {PREFIX}_phase_duration_seconds histogram",
+                (
+                    f"# HELP {PREFIX}_phase_duration_seconds "
+                    "Time spent in each generation phase."
+                ),
+                f"# UNIT {PREFIX}_phase_duration_seconds seconds",
+            ]
+            for phase in sorted(self._phases):
+                lines.extend(
+                    self._phases[phase].lines(
+                        f"{PREFIX}_phase_duration_seconds",
+                        f'phase="{_escape(phase)}"',
+                    )
+                )
+            lines.append(f"# TYPE {PREFIX}_generations counter")
+            lines.append(f"# HELP {PREFIX}_generations Generations by outcome.")
+            lines.extend(
+                f'{PREFIX}_generations_total{{outcome="{outcome}"}} {count}'
+                for outcome, count in self._outcomes.items()
+            )
+            lines.append(f"# TYPE {PREFIX}_generation_errors counter")
+            lines.append(
+                f"# HELP {PREFIX}_generation_errors Failed generations by exception."
+            )
+            lines.extend(
+                f'{PREFIX}_generation_errors_total{{type="{_escape(error)}"}} {count}'
+                for error, count in sorted(self._errors.items())
+            )
+            lines.append(f"# TYPE {PREFIX}_files counter")
+            lines.append(f"# HELP {PREFIX}_files Generated files by action.")
+            lines.extend(
+                f'{PREFIX}_files_total{{action="{_escape(action)}"}} {count}'
+                for action, count in sorted(self._files.items())
+            )
+            lines.extend(
+                [
+                    f"# TYPE {PREFIX}_written_bytes counter",
+                    f"# HELP {PREFIX}_written_bytes Bytes of generated files.",
+                    f"# UNIT {PREFIX}_written_bytes bytes",
+                    f"{PREFIX}_written_bytes_total {self._bytes_written}",
+                    f"# TYPE {PREFIX}_cache_hits counter",
+                    (
+                        f"# HELP {PREFIX}_cache_hits "
+                        "Generations served from the render cache."
+                    ),
+                    f"{PREFIX}_cache_hits_total {self._cache_hits}",
+                    "# EOF",
+                ]
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Path) -> None:
+        """
+        Write the metrics to a file, replacing it atomically.
+
+        Suitable for the textfile collector of the Prometheus node exporter.
+        """
+        path = Path(path)
+        temp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        temp.write_text(self.render(), encoding="utf-8")
+        temp.replace(path)
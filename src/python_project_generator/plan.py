@@ -0,0 +1,262 @@
+"""
+Compiled generation plans.
+
+A GenerationPlan lists everything a generated project contains: the
+directories to create and, for every file, its destination, where its
+contents come from and how they are produced. Template files and the files
+generated without a template (package modules, tests, Makefile) are
+described the same way, so one executor writes all of them into any output
+sink. Destinations may contain placeholders such as ``{{PROJECT_NAME}}``,
+which are rendered when the plan is executed. Plans can be serialized to
+JSON and loaded again.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from python_project_generator.renderer import split_placeholders
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from python_project_generator.template_cache import TemplateFile
+
+PLAN_VERSION = 1
+
+#: Supported file operations: copy the source byte for byte, render the
+#: entry's segments, or render the (large) source file chunk by chunk
+OPERATIONS = ("copy", "render", "stream")
+
+
+@dataclass(frozen=True)
+class PlanEntry:
+    """How to produce one file of a project."""
+
+    dest: str
+    operation: str
+    source: Path | None = None
+    segments: tuple[str, ...] | None = None
+    sha256: str | None = None
+    mode: int = 0o644
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the entry as a JSON-serializable dictionary."""
+        return {
+            "dest": self.dest,
+            "operation": self.operation,
+            "source": str(self.source) if self.source is not None else None,
+            "segments": list(self.segments) if self.segments is not None else None,
+            "sha256": self.sha256,
+            "mode": self.mode,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PlanEntry:
+        """
+        Create an entry from its dictionary form.
+
+        Raises:
+            ValueError: If the operation is unknown or lacks its input
+        """
+        operation = data["operation"]
+        if operation not in OPERATIONS:
+            msg = f"Unknown plan operation: {operation}"
+            raise ValueError(msg)
+        source = data.get("source")
+        segments = data.get("segments")
+        if operation in ("copy", "stream") and source is None:
+            msg = f"{operation.capitalize()} entry without a source: {data['dest']}"
+            raise ValueError(msg)
+        if operation == "render" and segments is None:
+            msg = f"Render entry without segments: {data['dest']}"
+            raise ValueError(msg)
+        return cls(
+            dest=data["dest"],
+            operation=operation,
+            source=Path(source) if source is not None else None,
+            segments=tuple(segments) if segments is not None else None,
+            sha256=data.get("sha256"),
+            mode=int(data.get("mode", 0o644)),
+        )
+
+
+@dataclass(frozen=True)
+class GenerationPlan:
+    """Directories and files of a project, in the order they are written."""
+
+    directories: tuple[str, ...]
+    entries: tuple[PlanEntry, ...]
+
+    @classmethod
+    def build(
+        cls, templates: Iterable[TemplateFile], validate_script: Path
+    ) -> GenerationPlan:
+        """
+        Compile the plan for a template set.
+
+        Args:
+            templates: Compiled template files, e.g. TemplateCache.files()
+            validate_script: Script copied to ``scripts/validate_project.py``
+
+        Returns:
+            Plan covering the template files followed by the files generated
+            without a template
+        """
+        entries = []
+        for template in templates:
+            if template.streamed:
+                entries.append(
+                    PlanEntry(
+                        dest=template.dest,
+                        operation="stream",
+                        source=template.source,
+                        sha256=template.sha256,
+                        mode=template.mode,
+                    )
+                )
+            elif template.has_placeholders:
+                entries.append(
+                    PlanEntry(
+                        dest=template.dest,
+                        operation="render",
+                        source=template.source,
+                        segments=template.segments,
+                        mode=template.mode,
+                    )
+                )
+            else:
+                entries.append(
+                    PlanEntry(
+                        dest=template.dest,
+                        operation="copy",
+                        source=template.source,
+                        sha256=template.sha256,
+                        mode=template.mode,
+                    )
+                )
+
+        entries.append(
+            PlanEntry(
+                dest="scripts/validate_project.py",
+                operation="copy",
+                source=Path(validate_script),
+                mode=0o755,
+            )
+        )
+        entries.extend(_INLINE_ENTRIES)
+        return cls(directories=DIRECTORIES, entries=tuple(entries))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the plan as a JSON-serializable dictionary."""
+        return {
+            "version": PLAN_VERSION,
+            "directories": list(self.directories),
+            "entries": [entry.to_dict() for entry in self.entries],
+        }
+
+    def digest(self) -> str:
+        """
+        Hash everything that determines the files the plan produces.
+
+        Source paths are not part of the hash; copied files count by their
+        contents, rendered files by their segments.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        import hashlib
+
+        hasher = hashlib.sha256(f"{PLAN_VERSION}\0".encode())
+        for directory in self.directories:
+            hasher.update(f"d\0{directory}\0".encode())
+        for entry in self.entries:
+            if entry.operation == "render":
+                content = json.dumps(entry.segments)
+            else:
+                # Copied files, and the template of streamed ones
+                content = entry.sha256
+                if content is None:
+                    content = hashlib.sha256(entry.source.read_bytes()).hexdigest()
+            hasher.update(
+                f"f\0{entry.dest}\0{entry.operation}\0{entry.mode}\0".encode()
+            )
+            hasher.update(f"{content}\0".encode())
+        return hasher.hexdigest()
+
+    def dumps(self) -> str:
+        """Serialize the plan to JSON."""
+        return json.dumps(self.to_dict(), indent=2) + "\n"
+
+    @classmethod
+    def loads(cls, text: str) -> GenerationPlan:
+        """
+        Load a plan serialized with dumps().
+
+        Raises:
+            ValueError: If the text is not a plan of the supported version
+        """
+        data = json.loads(text)
+        if not isinstance(data, dict) or data.get("version") != PLAN_VERSION:
+            msg = "Unsupported generation plan version"
+            raise ValueError(msg)
+        return cls(
+            directories=tuple(data["directories"]),
+            entries=tuple(PlanEntry.from_dict(entry) for entry in data["entries"]),
+        )
+
+
+#: Directories every project contains, even if no file is generated in them
+DIRECTORIES = ("src/{{PROJECT_NAME}}", "tests", "docs", "scripts")
+
+# Files generated without a template file
+
+MAIN_PY = '''"""Main module for the application."""\n\nimport logging\n\nlogger = logging.getLogger(__name__)\n\n\ndef hello_world() -> str:\n    """Return a greeting message."""\n    return "Hello, World!"\n\n\ndef main() -> None:\n    """Main entry point."""\n    logger.info(hello_world())\n\n\nif __name__ == "__main__":\n    logging.basicConfig(level=logging.INFO)\n    main()\n'''
+
+PACKAGE_INIT = '''"""{{PROJECT_NAME}} package."""
+
+__version__ = "0.1.0"
+
+'''
+
+TEST_MAIN = '''"""Tests for main module."""\n\nimport pytest\nfrom {{PROJECT_NAME}}.main import hello_world\n\n\ndef test_hello_world():\n    """Test the hello_world function."""\n    assert hello_world() == "Hello, World!"\n\n\ndef test_hello_world_not_empty():\n    """Test that hello_world returns a non-empty string."""\n    result = hello_world()\n    assert isinstance(result, str)\n    assert len(result) > 0\n'''
+
+MAIN_ENTRY = '''"""Main entry point for {{PROJECT_NAME}}"""\n\nimport sys\nfrom {{PROJECT_NAME}}.main import main\n\nif __name__ == "__main__":\n    sys.exit(main())\n'''
+
+MAKEFILE = """# Makefile for Python project
+
+.PHONY: help install test lint format clean
+
+help:  ## Show this help
+	@grep -E '^[a-zA-Z_-]+:.*?## .*$$' $(MAKEFILE_LIST) | sort | awk 'BEGIN {FS = ":.*?## "}; {printf "\033[36m%-20s\033[0m %s\n", $$1, $$2}'
+
+install:  ## Install dependencies
+	pip install -e .
+
+test:  ## Run tests
+	pytest
+
+lint:  ## Run linting
+	flake8 src tests
+
+format:  ## Format code
+	black src tests
+
+clean:  ## Clean up
+	rm -rf build dist *.egg-info
+"""
+
+_INLINE_ENTRIES = tuple(
+    PlanEntry(dest=dest, operation="render", segments=split_placeholders(text))
+    for dest, text in (
+        ("src/{{PROJECT_NAME}}/main.py", MAIN_PY),
+        ("src/{{PROJECT_NAME}}/__init__.py", PACKAGE_INIT),
+        ("tests/test_main.py", TEST_MAIN),
+        ("tests/__init__.py", ""),
+        ("__main__.py", MAIN_ENTRY),
+        ("Makefile", MAKEFILE),
+    )
+)
@@ -0,0 +1,167 @@
+"""
+Profiling of project generation.
+
+A Profiler attached to a ProjectGenerator records a span for every phase and
+every file operation, including those running on I/O threads. The spans can
+be summarized as a table or written as a Chrome trace-event file, which can
+be opened in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class Span:
+    """A timed operation, in seconds relative to the profiler start."""
+
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int
+    args: dict[str, Any] = field(default_factory=dict)
+
+
+class Profiler:
+    """Collect timed spans from one or more threads."""
+
+    def __init__(self):
+        """Initialize an empty profiler; times are relative to now."""
+        self.spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(
+        self, name: str, category: str, start: float, end: float, **args: Any
+    ) -> None:
+        """
+        Record a finished span.
+
+        Args:
+            name: Span name shown in the trace
+            category: "phase" or "file"
+            start: perf_counter() value when the operation started
+            end: perf_counter() value when the operation finished
+            **args: Extra details shown with the span
+        """
+        span = Span(
+            name=name,
+            category=category,
+            start=start - self._origin,
+            duration=end - start,
+            thread=threading.get_ident(),
+            args=args,
+        )
+        with self._lock:
+            self.spans.append(span)
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any):
+        """Record the time spent in a block as a span."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter(), **args)
+
+    def traced(self, func, name: str, category: str = "file", **args: Any):
+        """
+        Wrap a callable so every call is recorded as a span.
+
+        Args:
+            func: Callable to wrap
+            name: Span name
+            category: Span category
+            **args: Extra details shown with the span
+
+        Returns:
+            The wrapped callable
+        """
+
+        @wraps(func)
+        def wrapper(*func_args, **func_kwargs):
+            with self.span(name, category, **args):
+                return func(*func_args, **func_kwargs)
+
+        return wrapper
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """
+        Return the spans in Chrome trace-event format.
+
+        Returns:
+            JSON-serializable trace with one complete ("X") event per span
+        """
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for span in sorted(self.spans, key=lambda span: span.start):
+            tid = threads.setdefault(span.thread, len(threads))
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": round(span.start * 1e6, 3),
+                    "dur": round(span.duration * 1e6, 3),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": span.args,
+                }
+            )
+        for thread, tid in threads.items():
+            name = "main" if thread == threading.main_thread().ident else "io"
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"name": f"{name}-{tid}"},
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write the spans to a Chrome trace-event JSON file."""
+        Path(path).write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+
+    def summary(self, phase_timings: dict[str, float], top: int = 10) -> str:
+        """
+        Format per-phase totals and the slowest file operations as a table.
+
+        Args:
+            phase_timings: Seconds per phase, e.g. ProjectGenerator.phase_timings
+            top: Number of slowest file operations to list
+
+        Returns:
+            Multi-line table
+        """
+        total = sum(phase_timings.values()) or 1.0
+        lines = [f"{'phase':<12} {'ms':>10} {'%':>6}"]
+        lines.extend(
+            f"{phase:<12} {seconds * 1000:>10.2f} {seconds / total * 100:>5.1f}%"
+            for phase, seconds in phase_timings.items()
+        )
+        lines.append(f"{'total':<12} {total * 1000:>10.2f}")
+
+        files = [span for span in self.spans if span.category == "file"]
+        if files:
+            files.sort(key=lambda span: span.duration, reverse=True)
+            lines.append("")
+            lines.append(f"slowest of {len(files)} file operations:")
+            lines.extend(
+                f"  {span.duration * 1000:>8.2f} ms  {span.name}"
+                for span in files[:top]
+            )
+        return "\n".join(lines)
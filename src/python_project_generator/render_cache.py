@@ -0,0 +1,414 @@
+"""
+Persistent cache of rendered projects.
+
+Regenerating a project with the same templates and the same variables (a
+retry, a preview, a rerun of a failed batch) produces identical files. The
+render cache keeps those files on disk, keyed by a hash of the template set
+plus a hash of the replacement values, so a repeat ProjectGenerator.generate()
+copies them into place instead of rendering again.
+
+Cached files are always copied into the project as new files (cloned where
+the filesystem supports it), never hard-linked or deduplicated, so editing a
+generated project can not change the cache. Each file is checked against its
+recorded SHA-256 before an entry is served; a damaged entry is dropped and the
+project rendered again.
+
+Entries live under ``$XDG_CACHE_HOME/python-project-generator/renders``
+(``~/.cache/...`` when the variable is unset). Each entry is a directory with
+an ``index.json`` and the rendered files. A running total of their sizes is
+kept in a ``size`` file, and the least recently used entries are evicted once
+it grows beyond the size limit:
+
+    python-project-generator cache stats
+    python-project-generator cache clear
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+CACHE_VERSION = 2
+
+#: Default limit of the total size of cached files
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+INDEX_NAME = "index.json"
+
+#: File in the cache root holding the running total size of all entries
+SIZE_NAME = "size"
+
+#: Prefix of entries being written or evicted; never served
+_TEMP_PREFIX = ".tmp-"
+
+
+def default_cache_dir() -> Path:
+    """Return the render cache directory below ``$XDG_CACHE_HOME``."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "python-project-generator" / "renders"
+
+
+def render_key(template_digest: str, replacements: Mapping[str, str]) -> str:
+    """
+    Return the cache key of a template set rendered with some values.
+
+    Args:
+        template_digest: Hash of the template set, e.g. GenerationPlan.digest()
+        replacements: Placeholder to value mapping used for rendering
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    values = json.dumps(dict(replacements), sort_keys=True).encode("utf-8")
+    values_digest = hashlib.sha256(values).hexdigest()
+    text = f"{CACHE_VERSION}\0{template_digest}\0{values_digest}"
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedRender:
+    """A rendered project stored in the cache."""
+
+    path: Path
+    directories: tuple[str, ...]
+    #: (destination, sha256, mode) of every file, in write order
+    files: tuple[tuple[str, str, int], ...]
+    unknown_placeholders: tuple[str, ...] = ()
+
+    def file_path(self, dest: str) -> Path:
+        """Return where the cached copy of a project file is stored."""
+        return self.path / "files" / dest
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Size and location of a render cache."""
+
+    path: Path
+    entries: int
+    size: int
+    max_size: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {
+            "path": str(self.path),
+            "entries": self.entries,
+            "size": self.size,
+            "max_size": self.max_size,
+        }
+
+
+def _rmtree(path: Path) -> None:
+    """Rename a directory out of sight, then delete it."""
+    import shutil
+
+    hidden = path.with_name(f"{_TEMP_PREFIX}{uuid.uuid4().hex[:12]}")
+    try:
+        path.rename(hidden)
+    except OSError:
+        return
+    shutil.rmtree(hidden, ignore_errors=True)
+
+
+class RenderCache:
+    """On-disk cache of rendered projects with least-recently-used eviction."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize a cache; nothing is created until the first store.
+
+        Args:
+            root: Cache directory (defaults to default_cache_dir())
+            max_bytes: Total size of cached files to keep
+        """
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        """Return the directory of a cache entry."""
+        return self.root / key[:2] / key
+
+    def lookup(self, key: str) -> CachedRender | None:
+        """
+        Find a cached render, check its files and mark it as recently used.
+
+        Args:
+            key: Key from render_key()
+
+        Returns:
+            The cached render, or None on a miss or when a cached file no
+            longer matches its recorded hash
+        """
+        path = self._entry_path(key)
+        index_path = path / INDEX_NAME
+        try:
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+            if index.get("version") != CACHE_VERSION:
+                return None
+            render = CachedRender(
+                path=path,
+                directories=tuple(index["directories"]),
+                files=tuple(
+                    (entry["dest"], entry["sha256"], entry["mode"])
+                    for entry in index["files"]
+                ),
+                unknown_placeholders=tuple(index.get("unknown_placeholders", ())),
+            )
+            if not self._verify(render):
+                _rmtree(path)
+                self._update_size(delta=-int(index["size"]))
+                return None
+            os.utime(index_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return render
+
+    @staticmethod
+    def _verify(render: CachedRender) -> bool:
+        """Return whether every cached file still has its recorded SHA-256."""
+        from python_project_generator.renderer import read_chunks
+
+        for dest, digest, _ in render.files:
+            hasher = hashlib.sha256()
+            for chunk in read_chunks(render.file_path(dest)):
+                hasher.update(chunk)
+            if hasher.hexdigest() != digest:
+                return False
+        return True
+
+    def store(
+        self,
+        key: str,
+        project_root: Path,
+        directories: Iterable[str],
+        files: Mapping[str, str],
+        unknown_placeholders: Iterable[str] = (),
+        *,
+        modes: Mapping[str, int] | None = None,
+    ) -> bool:
+        """
+        Copy a rendered project into the cache and evict old entries.
+
+        The entry is written to a temporary directory and renamed into place,
+        so concurrent generators never serve a partial entry. Only file
+        contents are copied; the permission bits come from ``modes``, not
+        from the project files, which may be read-only links to a blob store.
+
+        Args:
+            key: Key from render_key()
+            project_root: Directory the project was rendered into
+            directories: Project directories, including empty ones
+            files: Destination to SHA-256 of every rendered file
+            unknown_placeholders: Placeholders the renderer left unreplaced
+            modes: Destination to permission bits of the template each file
+                comes from (default 0o644)
+
+        Returns:
+            True if the entry was stored, False if it was already cached or
+            larger than the cache
+        """
+        import shutil
+
+        path = self._entry_path(key)
+        if path.exists():
+            return False
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_name(f"{_TEMP_PREFIX}{uuid.uuid4().hex[:12]}")
+        try:
+            entries = []
+            size = 0
+            for dest, digest in files.items():
+                target = temp / "files" / dest
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(project_root / dest, target)
+                mode = (modes or {}).get(dest, 0o644) & 0o777
+                target.chmod(mode)
+                size += target.stat().st_size
+                entries.append({"dest": dest, "sha256": digest, "mode": mode})
+            if size > self.max_bytes:
+                return False
+
+            index = {
+                "version": CACHE_VERSION,
+                "size": size,
+                "directories": list(directories),
+                "files": entries,
+                "unknown_placeholders": sorted(unknown_placeholders),
+            }
+            (temp / INDEX_NAME).write_text(json.dumps(index), encoding="utf-8")
+            try:
+                temp.rename(path)
+            except OSError:
+                # Another process stored the same render first
+                return False
+        finally:
+            if temp.exists():
+                shutil.rmtree(temp, ignore_errors=True)
+
+        if self._update_size(delta=size) > self.max_bytes:
+            self.evict()
+        return True
+
+    def _update_size(self, delta: int = 0, total: int | None = None) -> int:
+        """
+        Add to or reset the running total size of the cache.
+
+        The total is kept in SIZE_NAME under a file lock, so stores only scan
+        the cache when it is over its limit. It is recomputed from the entries
+        when the file is missing or unreadable, and corrected by every
+        eviction, so drift from interrupted runs does not accumulate.
+
+        Args:
+            delta: Bytes added by an entry that is already in place
+            total: Size to record instead, e.g. after an eviction
+
+        Returns:
+            The new total
+        """
+        from python_project_generator.staging import lock_file
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.root / SIZE_NAME, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            lock_file(fd)
+            if total is None:
+                try:
+                    total = int(os.read(fd, 32)) + delta
+                except ValueError:
+                    # The new entry is already in place and gets counted
+                    total = sum(size for _, size, _ in self._entries())
+            os.lseek(fd, 0, os.SEEK_SET)
+            os.ftruncate(fd, 0)
+            os.write(fd, str(total).encode("ascii"))
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+        return total
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        """Return (last use, size, path) of every complete entry."""
+        found = []
+        try:
+            with os.scandir(self.root) as entries:
+                shards = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            return found
+        for shard in shards:
+            try:
+                with os.scandir(shard) as entries:
+                    paths = [
+                        Path(entry.path)
+                        for entry in entries
+                        if not entry.name.startswith(_TEMP_PREFIX)
+                    ]
+            except OSError:
+                continue
+            for path in paths:
+                index_path = path / INDEX_NAME
+                try:
+                    last_used = index_path.stat().st_mtime
+                    index = json.loads(index_path.read_text(encoding="utf-8"))
+                    size = int(index["size"])
+                except (OSError, ValueError, KeyError, TypeError):
+                    continue
+                found.append((last_used, size, path))
+        return found
+
+    def evict(self, max_bytes: int | None = None) -> int:
+        """
+        Delete the least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Size to shrink the cache to (defaults to max_bytes)
+
+        Returns:
+            Number of entries deleted
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            _rmtree(path)
+            total -= size
+            removed += 1
+        if self.root.is_dir():
+            self._update_size(total=total)
+        return removed
+
+    def clear(self) -> int:
+        """
+        Delete every cache entry.
+
+        Returns:
+            Number of entries deleted
+        """
+        return self.evict(0)
+
+    def stats(self) -> CacheStats:
+        """Return the number and total size of cached renders."""
+        entries = self._entries()
+        return CacheStats(
+            path=self.root,
+            entries=len(entries),
+            size=sum(size for _, size, _ in entries),
+            max_size=self.max_bytes,
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Show statistics of the render cache or clear it."""
+    parser = argparse.ArgumentParser(
+        prog="python-project-generator cache",
+        description="Inspect or clear the on-disk render cache",
+    )
+    parser.add_argument("action", choices=("stats", "clear"), help="What to do")
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"Cache directory (default: {default_cache_dir()})",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="Print the statistics as JSON"
+    )
+    args = parser.parse_args(argv)
+
+    cache = RenderCache(args.cache_dir)
+    if args.action == "clear":
+        removed = cache.clear()
+        print(f"Removed {removed} cached renders from {cache.root}")  # noqa: T201
+        return 0
+
+    stats = cache.stats()
+    if args.json:
+        print(json.dumps(stats.to_dict(), indent=2))  # noqa: T201
+    else:
+        print(f"path:     {stats.path}")  # noqa: T201
+        print(f"entries:  {stats.entries}")  # noqa: T201
+        print(  # noqa: T201
+            f"size:     {stats.size / 1024:.1f} KiB "
+            f"of {stats.max_size / 1024 / 1024:.0f} MiB"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Single-pass placeholder substitution.
+
+Templates mark variables as ``{{UPPER_CASE}}`` tokens. The renderer locates
+all tokens in one scan and builds the output in one join, so the cost does
+not grow with the number of variables. Tokens without a value are left in
+place and reported.
+
+Large templates are rendered as a stream of chunks with render_chunks(), so
+memory stays bounded by the chunk size however large the file is.
+"""
+
+from __future__ import annotations
+
+import codecs
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+# Matches {{UPPER_CASE}} placeholders; GitHub expressions like ${{ x }} do not
+PLACEHOLDER_RE = re.compile(r"(\{\{[A-Z][A-Z0-9_]*\}\})")
+
+#: PLACEHOLDER_RE for UTF-8 encoded bytes
+PLACEHOLDER_BYTES_RE = re.compile(rb"\{\{[A-Z][A-Z0-9_]*\}\}")
+
+# Matches the start of a placeholder cut off at the end of a chunk
+_PARTIAL_RE = re.compile(rb"\{(?:\{(?:[A-Z][A-Z0-9_]*\}?)?)?\Z")
+
+#: Bytes read at a time when streaming, hashing or copying a file
+CHUNK_SIZE = 256 * 1024
+
+#: Longest placeholder recognized when it straddles two chunks
+MAX_PLACEHOLDER_BYTES = 256
+
+
+def iter_complete_chunks(
+    fileobj: BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Read a file in chunks that never end inside a placeholder.
+
+    A placeholder cut off at the end of a chunk is held back and prepended
+    to the next one, so every chunk can be searched on its own.
+
+    Args:
+        fileobj: Binary file object to read
+        chunk_size: Bytes to read at a time
+
+    Yields:
+        Consecutive pieces of the file, each at most chunk_size plus
+        MAX_PLACEHOLDER_BYTES long
+    """
+    carry = b""
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            if carry:
+                yield carry
+            return
+        buffer = carry + chunk if carry else chunk
+        partial = _PARTIAL_RE.search(
+            buffer, max(0, len(buffer) - MAX_PLACEHOLDER_BYTES)
+        )
+        if partial is None:
+            carry = b""
+            yield buffer
+        else:
+            carry = buffer[partial.start() :]
+            if partial.start():
+                yield buffer[: partial.start()]
+
+
+def read_chunks(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read a file in pieces without holding all of it in memory.
+
+    Args:
+        path: File to read
+        chunk_size: Bytes to read at a time
+
+    Yields:
+        Consecutive pieces of the file, each at most chunk_size long
+    """
+    with Path(path).open("rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def split_placeholders(text: str) -> tuple[str, ...]:
+    """
+    Split text at placeholder boundaries.
+
+    Args:
+        text: Template text
+
+    Returns:
+        Alternating literal text and placeholder tokens; tokens are at odd
+        indices, so a text without placeholders yields a single segment
+    """
+    return tuple(PLACEHOLDER_RE.split(text))
+
+
+class Renderer:
+    """Substitute placeholder tokens with values in a single pass."""
+
+    def __init__(self, replacements: Mapping[str, str]):
+        """
+        Initialize the renderer.
+
+        Args:
+            replacements: Mapping of placeholder tokens (e.g.
+                ``{{PROJECT_NAME}}``) to their values
+        """
+        self.replacements = dict(replacements)
+        self.unknown_placeholders: set[str] = set()
+
+    def render_segments(self, segments: tuple[str, ...]) -> str:
+        """
+        Render a template that was pre-split with split_placeholders.
+
+        Args:
+            segments: Alternating literal text and placeholder tokens
+
+        Returns:
+            Rendered text
+        """
+        if len(segments) == 1:
+            return segments[0]
+
+        replacements = self.replacements
+        parts = list(segments)
+        for index in range(1, len(parts), 2):
+            token = parts[index]
+            value = replacements.get(token)
+            if value is None:
+                self.unknown_placeholders.add(token)
+            else:
+                parts[index] = value
+        return "".join(parts)
+
+    def render(self, text: str) -> str:
+        """
+        Render template text.
+
+        Args:
+            text: Template text
+
+        Returns:
+            Text with every known placeholder replaced; unknown placeholders
+            are kept and recorded in ``unknown_placeholders``
+        """
+        return self.render_segments(split_placeholders(text))
+
+    def render_chunks(
+        self, fileobj: BinaryIO, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Render a UTF-8 template from a binary file object chunk by chunk.
+
+        Args:
+            fileobj: Binary file object with the template
+            chunk_size: Bytes to read at a time
+
+        Yields:
+            Rendered UTF-8 encoded pieces of the file
+
+        Raises:
+            UnicodeDecodeError: If the template is not valid UTF-8; pieces
+                yielded before the error must be discarded
+        """
+        values = {
+            token.encode("utf-8"): value.encode("utf-8")
+            for token, value in self.replacements.items()
+        }
+
+        def substitute(match: re.Match) -> bytes:
+            token = match.group()
+            value = values.get(token)
+            if value is None:
+                self.unknown_placeholders.add(token.decode("ascii"))
+                return token
+            return value
+
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        for chunk in iter_complete_chunks(fileobj, chunk_size):
+            decoder.decode(chunk)
+            yield PLACEHOLDER_BYTES_RE.sub(substitute, chunk)
+        decoder.decode(b"", final=True)
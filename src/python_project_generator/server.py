@@ -0,0 +1,285 @@
+"""
+Long-running generation server.
+
+Keeps the compiled templates warm in one process and serves generation
+requests over local HTTP, either on a TCP port or a Unix socket:
+
+``GET /health``
+    Returns ``{"status": "ok"}``.
+
+``GET /metrics``
+    Returns latency histograms and file counters of the generations served
+    so far in the OpenMetrics text format.
+
+``POST /generate``
+    Takes a JSON object with the manifest fields accepted by ``--manifest``
+    (``name``, ``description``, ``author``, ``email``, ``github_username``).
+    With ``"format": "tar.gz"`` or ``"zip"`` the response body is the project
+    archive. Otherwise the project is generated into ``output`` (relative to
+    the server's ``--output-root``, which must be set to allow writes) and the
+    response is ``{"path": ...}``; ``"git": false`` skips git initialization.
+
+Each request is handled on its own thread.
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import socketserver
+import sys
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from python_project_generator.batch import normalize_spec
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.metrics import CONTENT_TYPE, OpenMetricsExporter
+
+ARCHIVE_CONTENT_TYPES = {"tar.gz": "application/gzip", "zip": "application/zip"}
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class GenerationRequestHandler(BaseHTTPRequestHandler):
+    """Handle health checks and generation requests."""
+
+    server_version = "python-project-generator"
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        """Return the client address; Unix socket clients have none."""
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        """Log requests only when the server runs in verbose mode."""
+        if getattr(self.server, "verbose", False):
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        """Send a complete response."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        """Send a JSON response."""
+        body = json.dumps(payload).encode("utf-8")
+        self._send(status, body, "application/json")
+
+    def do_GET(self) -> None:
+        """Answer health checks and metrics scrapes."""
+        if self.path == "/health":
+            self._send_json(HTTPStatus.OK, {"status": "ok"})
+        elif self.path == "/metrics":
+            body = self.server.metrics.render().encode("utf-8")
+            self._send(HTTPStatus.OK, body, CONTENT_TYPE)
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    def do_POST(self) -> None:
+        """Generate a project."""
+        if self.path != "/generate":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+            return
+
+        try:
+            self._generate(self._read_request())
+        except (ValueError, TypeError) as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+        except FileExistsError as e:
+            self._send_json(HTTPStatus.CONFLICT, {"error": str(e)})
+        except Exception as e:
+            self._send_json(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                {"error": f"{type(e).__name__}: {e}"},
+            )
+
+    def _read_request(self) -> dict:
+        """
+        Parse the JSON object in the request body.
+
+        Raises:
+            ValueError: If the body is too large or not valid JSON
+            TypeError: If the body is not a JSON object
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        if length > MAX_REQUEST_BYTES:
+            msg = "Request body too large"
+            raise ValueError(msg)
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if not isinstance(request, dict):
+            msg = "Request body must be a JSON object"
+            raise TypeError(msg)
+        return request
+
+    def _generate(self, request: dict) -> None:
+        """Render the requested project as an archive or into a directory."""
+        fmt = request.pop("format", None)
+        output = request.pop("output", None)
+        init_git = bool(request.pop("git", True))
+        force = bool(request.pop("force", False))
+
+        spec = normalize_spec(request)
+        spec.pop("output_dir", None)
+
+        if fmt is not None:
+            if fmt not in ARCHIVE_CONTENT_TYPES:
+                msg = f"Unsupported archive format: {fmt}"
+                raise ValueError(msg)
+            generator = ProjectGenerator(**spec, observers=[self.server.metrics])
+            buffer = io.BytesIO()
+            generator.generate_archive(buffer, fmt)
+            self._send(HTTPStatus.OK, buffer.getvalue(), ARCHIVE_CONTENT_TYPES[fmt])
+            return
+
+        output_dir = self.server.resolve_output(output)
+        generator = ProjectGenerator(
+            **spec, output_dir=output_dir, observers=[self.server.metrics]
+        )
+        project_path = generator.generate(force=force, init_git=init_git)
+        self._send_json(HTTPStatus.OK, {"path": str(project_path)})
+
+
+class _ServerMixin:
+    """Shared configuration for the TCP and Unix socket servers."""
+
+    daemon_threads = True
+    output_root: Path | None = None
+    verbose = False
+    metrics: OpenMetricsExporter
+
+    def resolve_output(self, output: str | None) -> Path:
+        """
+        Resolve a requested output directory below the output root.
+
+        Raises:
+            ValueError: If writes are disabled or the path escapes the root
+        """
+        root = self.output_root
+        if root is None:
+            msg = "Directory output is disabled; start the server with --output-root"
+            raise ValueError(msg)
+        output_dir = (root / (output or ".")).resolve()
+        if output_dir != root and root not in output_dir.parents:
+            msg = f"Output directory must be inside {root}"
+            raise ValueError(msg)
+        return output_dir
+
+
+class GenerationServer(_ServerMixin, ThreadingHTTPServer):
+    """Generation server listening on a TCP port."""
+
+
+class UnixGenerationServer(
+    _ServerMixin, socketserver.ThreadingMixIn, socketserver.UnixStreamServer
+):
+    """Generation server listening on a Unix socket."""
+
+
+def warm_templates() -> int:
+    """
+    Load the bundled templates into the shared cache.
+
+    Returns:
+        Number of template files loaded
+    """
+    generator = ProjectGenerator(
+        project_name="warmup",
+        description="",
+        author_name="",
+        author_email="",
+        github_username="",
+    )
+    return len(generator.template_cache.files())
+
+
+def create_server(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Path | None = None,
+    output_root: Path | None = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """
+    Create a generation server with warm templates.
+
+    Args:
+        host: Interface to listen on for TCP
+        port: TCP port (0 picks a free port)
+        unix_socket: Listen on this Unix socket instead of TCP
+        output_root: Directory that requests may generate projects into;
+            directory output is disabled when None
+        verbose: Log every request to standard error
+
+    Returns:
+        Server ready for serve_forever()
+    """
+    warm_templates()
+    if unix_socket is not None:
+        unix_socket = Path(unix_socket)
+        if unix_socket.exists():
+            unix_socket.unlink()
+        server = UnixGenerationServer(str(unix_socket), GenerationRequestHandler)
+    else:
+        server = GenerationServer((host, port), GenerationRequestHandler)
+    server.output_root = Path(output_root).resolve() if output_root else None
+    server.verbose = verbose
+    server.metrics = OpenMetricsExporter()
+    return server
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the generation server until interrupted."""
+    parser = argparse.ArgumentParser(
+        prog="python-project-generator serve",
+        description="Serve project generation requests over local HTTP",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port")
+    parser.add_argument(
+        "--unix-socket",
+        type=Path,
+        help="Listen on a Unix socket instead of a TCP port",
+    )
+    parser.add_argument(
+        "--output-root",
+        type=Path,
+        help="Allow requests to generate projects into directories below this",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Log requests")
+    args = parser.parse_args(argv)
+
+    server = create_server(
+        host=args.host,
+        port=args.port,
+        unix_socket=args.unix_socket,
+        output_root=args.output_root,
+        verbose=args.verbose,
+    )
+    if args.unix_socket is not None:
+        address = str(args.unix_socket)
+    else:
+        host, port = server.server_address[:2]
+        address = f"http://{host}:{port}"
+    msg = f"Serving on {address} (pid {os.getpid()})"
+    print(msg, file=sys.stderr)  # noqa: T201
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.unix_socket is not None and args.unix_socket.exists():
+            args.unix_socket.unlink()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
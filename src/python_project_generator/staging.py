@@ -0,0 +1,173 @@
+"""
+Atomic publication of generated projects.
+
+Projects are generated into a hidden staging directory next to their final
+location and moved into place with a single rename once they are complete
+and validated, so a crash or a failed validation never leaves a half-written
+project behind. A lock file per project name serializes runs that target the
+same directory, which makes concurrent generators safe. Lock files are kept
+out of the output directory, in default_lock_dir(), and are not removed
+(deleting a lock file another process has open would let two runs hold "the"
+lock at once); each is empty. Generators on several hosts sharing an output
+volume must point LOCK_DIR_ENV at a common directory on that volume.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+from python_project_generator.trash import CLAIM_MARKER
+
+#: Marker in the names of directories holding projects being generated
+STAGING_MARKER = ".ppg-staging-"
+
+#: Environment variable overriding the directory of the lock files
+LOCK_DIR_ENV = "PPG_LOCK_DIR"
+
+#: Suffix of the lock files that serialize runs for the same project
+LOCK_SUFFIX = ".lock"
+
+
+def staging_path(project_path: Path) -> Path:
+    """
+    Return a new staging directory name for a project.
+
+    The directory is a hidden sibling of the project, so it is on the same
+    filesystem and can be renamed into place atomically.
+
+    Args:
+        project_path: Final location of the project
+
+    Returns:
+        Unique staging path (not created)
+    """
+    name = f".{project_path.name}{STAGING_MARKER}{uuid.uuid4().hex[:12]}"
+    return project_path.with_name(name)
+
+
+def find_staging(project_path: Path) -> list[Path]:
+    """
+    Find staging directories left behind for a project by interrupted runs.
+
+    Only call this while holding the project's lock; otherwise the staging
+    directory of a run in progress would be reported too. Directories already
+    claimed for deletion (see trash.claim) are not reported.
+
+    Args:
+        project_path: Final location of the project
+
+    Returns:
+        Leftover staging directories, in name order
+    """
+    prefix = f".{project_path.name}{STAGING_MARKER}"
+    try:
+        with os.scandir(project_path.parent) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(prefix)
+                and CLAIM_MARKER not in entry.name
+                and entry.is_dir(follow_symlinks=False)
+            )
+    except OSError:
+        return []
+
+
+def default_lock_dir() -> Path:
+    """
+    Return the directory holding the per-project lock files.
+
+    Returns:
+        ``$PPG_LOCK_DIR`` if set, else ``python-project-generator/locks`` below
+        ``$XDG_RUNTIME_DIR`` or, when that is unset, ``$XDG_CACHE_HOME``
+        (``~/.cache``)
+    """
+    override = os.environ.get(LOCK_DIR_ENV)
+    if override:
+        return Path(override)
+    base = (
+        os.environ.get("XDG_RUNTIME_DIR")
+        or os.environ.get("XDG_CACHE_HOME")
+        or Path.home() / ".cache"
+    )
+    return Path(base) / "python-project-generator" / "locks"
+
+
+def lock_path(project_path: Path) -> Path:
+    """
+    Return the lock file of a project path.
+
+    Lock files are named after the project and a hash of its absolute path,
+    so projects with the same name in different output directories do not
+    wait for each other.
+
+    Args:
+        project_path: Final location of the project
+
+    Returns:
+        Path of the lock file in default_lock_dir() (not created)
+    """
+    resolved = str(project_path.resolve())
+    digest = hashlib.sha256(resolved.encode()).hexdigest()[:16]
+    return default_lock_dir() / f"{project_path.name}-{digest}{LOCK_SUFFIX}"
+
+
+def lock_file(fd: int) -> None:
+    """Block until an exclusive lock on an open file is acquired."""
+    try:
+        import fcntl
+    except ImportError:
+        import msvcrt
+
+        # LK_LOCK retries for about ten seconds before failing
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+
+@contextmanager
+def project_lock(project_path: Path):
+    """
+    Hold an exclusive lock for a project path.
+
+    The lock is an OS-level file lock on lock_path(project_path), outside
+    the output directory; it is released automatically if the process dies.
+
+    Args:
+        project_path: Final location of the project
+    """
+    path = lock_path(project_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        lock_file(fd)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def publish(staged: Path, project_path: Path) -> None:
+    """
+    Move a completed staging directory to its final location.
+
+    Args:
+        staged: Staging directory holding the complete project
+        project_path: Final location, which must not exist
+
+    Raises:
+        FileExistsError: If the final location exists
+    """
+    if project_path.exists() or project_path.is_symlink():
+        msg = f"Directory '{project_path}' already exists."
+        raise FileExistsError(msg)
+    staged.rename(project_path)
@@ -0,0 +1,367 @@
+"""
+In-memory cache of compiled project templates.
+
+This module loads the template set once, keeps every file's contents split at
+placeholder boundaries and shares the result between ProjectGenerator
+instances in the same process. The cache is reloaded when a template file's
+modification time or size changes.
+
+When a precomputed template index (see template_index) is available, the
+text/binary classification and placeholder offsets are taken from it instead
+of scanning every file's contents. The template tree is still listed (names
+and stats only) so that added, removed or resized files are noticed; a live
+scan is used whenever the index no longer matches the files on disk.
+
+Files larger than STREAM_THRESHOLD are never held in memory: they are hashed
+and scanned chunk by chunk, and templates among them that contain
+placeholders are rendered from disk as a stream when a project is generated.
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import json
+import os
+import threading
+from contextlib import suppress
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import ClassVar
+
+from python_project_generator.renderer import (
+    PLACEHOLDER_BYTES_RE,
+    iter_complete_chunks,
+    split_placeholders,
+)
+
+INDEX_VERSION = 1
+INDEX_PATH = Path(__file__).parent / "template_index.json"
+
+#: Files larger than this are streamed from disk instead of read into memory
+STREAM_THRESHOLD = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class TemplateFile:
+    """A single template file ready to be rendered into a project."""
+
+    source: Path
+    dest: str
+    mode: int
+    sha256: str
+    segments: tuple[str, ...] | None = None
+    #: Large text file with placeholders, rendered from disk chunk by chunk
+    streamed: bool = False
+
+    @property
+    def has_placeholders(self) -> bool:
+        """Whether rendering can change the file contents."""
+        if self.streamed:
+            return True
+        return self.segments is not None and len(self.segments) > 1
+
+
+#: Files in directories with this name are placed in the project root
+FLATTENED_DIR = "md_files"
+
+
+def _walk(directory: str, prefix: str, found: list, *, flatten: bool) -> None:
+    """Collect the files below a directory in sorted depth-first order."""
+    with os.scandir(directory) as entries:
+        ordered = sorted(entries, key=lambda entry: entry.name)
+    for entry in ordered:
+        if entry.is_dir():
+            _walk(
+                entry.path,
+                f"{prefix}{entry.name}/",
+                found,
+                flatten=flatten or entry.name == FLATTENED_DIR,
+            )
+        elif entry.is_file():
+            dest = entry.name if flatten else f"{prefix}{entry.name}"
+            found.append((Path(entry.path), dest, True, entry.stat()))
+
+
+def scan_template_sources(
+    template_dir: Path,
+) -> list[tuple[Path, str, bool, os.stat_result]]:
+    """
+    List every file in the template set in a single os.scandir pass.
+
+    The destination is a POSIX path relative to the project root. Files under
+    ``md_files`` are flattened into the project root; ``.gitignore`` and
+    ``.pre-commit-config.yaml`` are copied without placeholder rendering.
+
+    Args:
+        template_dir: The ``templates/`` directory; its parent supplies
+            ``.github/``, ``.gitignore`` and ``.pre-commit-config.yaml``
+
+    Returns:
+        (source, destination, render, stat) for every file, in copy order
+    """
+    repo_root = Path(template_dir).parent
+    found: list = []
+    _walk(str(template_dir), "", found, flatten=False)
+
+    def add_verbatim(source: Path) -> None:
+        with suppress(OSError):
+            found.append((source, source.name, False, source.stat()))
+
+    add_verbatim(repo_root / ".gitignore")
+    github_src = repo_root / ".github"
+    if github_src.is_dir():
+        _walk(str(github_src), ".github/", found, flatten=False)
+    add_verbatim(repo_root / ".pre-commit-config.yaml")
+    return found
+
+
+def iter_template_sources(template_dir: Path):
+    """
+    Yield (source, destination, render) for every file in the template set.
+
+    See scan_template_sources() for the layout rules.
+    """
+    for source, dest, render, _ in scan_template_sources(template_dir):
+        yield source, dest, render
+
+
+class StaleIndexError(Exception):
+    """Raised when the template index no longer matches the template files."""
+
+
+def _split_at_offsets(data: bytes, placeholders: list) -> tuple[str, ...]:
+    """Split file contents at precomputed (offset, length) placeholder spans."""
+    segments = []
+    position = 0
+    for offset, length in placeholders:
+        segments.append(data[position:offset].decode("utf-8"))
+        segments.append(data[offset : offset + length].decode("utf-8"))
+        position = offset + length
+    segments.append(data[position:].decode("utf-8"))
+    return tuple(segments)
+
+
+def load_index(index_path: Path, template_dir: Path) -> dict | None:
+    """
+    Load a template index if it exists and matches the template directory.
+
+    Args:
+        index_path: Path to the index JSON file
+        template_dir: The ``templates/`` directory the index must describe
+
+    Returns:
+        Mapping of source path to index entry, or None if unusable
+    """
+    try:
+        index = json.loads(Path(index_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if index.get("version") != INDEX_VERSION:
+        return None
+
+    repo_root = Path(template_dir).parent
+    return {str(repo_root / entry["source"]): entry for entry in index["files"]}
+
+
+class TemplateCache:
+    """Load a template set once and reuse it across generations."""
+
+    _shared: ClassVar[dict[Path, TemplateCache]] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, template_dir: Path, index_path: Path | None = None):
+        """
+        Initialize an empty cache for a template directory.
+
+        Args:
+            template_dir: The ``templates/`` directory; its parent supplies
+                ``.github/``, ``.gitignore`` and ``.pre-commit-config.yaml``
+            index_path: Optional precomputed template index to load from
+        """
+        self.template_dir = Path(template_dir)
+        self._index = load_index(index_path, self.template_dir) if index_path else None
+        self._files: list[TemplateFile] | None = None
+        self._signature: tuple | None = None
+        self._compiled: dict[tuple, TemplateFile] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls, template_dir: Path, index_path: Path | None = None
+    ) -> TemplateCache:
+        """
+        Return the process-wide cache for a template directory.
+
+        Args:
+            template_dir: The ``templates/`` directory
+            index_path: Precomputed template index used when the cache for
+                this directory is first created
+
+        Returns:
+            TemplateCache shared by every caller using the same directory
+        """
+        key = Path(template_dir).resolve()
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls(key, index_path=index_path)
+            return cache
+
+    @property
+    def uses_index(self) -> bool:
+        """Whether templates are loaded from the precomputed index."""
+        return self._index is not None
+
+    def _scan_index(self) -> tuple[list[tuple[Path, str, bool, int]], tuple] | None:
+        """
+        Return sources and signature from the index, or None if stale.
+
+        The index is stale when a template file was added or removed, or when
+        a file's size, destination or render flag differs; changed contents
+        of the same size are caught by the hash check when compiling.
+        """
+        listed = scan_template_sources(self.template_dir)
+        if {str(source) for source, *_ in listed} != self._index.keys():
+            return None
+        sources = []
+        signature = []
+        for source, dest, render, stat in listed:
+            key = str(source)
+            entry = self._index[key]
+            if (stat.st_size, dest, render) != (
+                entry["size"],
+                entry["dest"],
+                entry["render"],
+            ):
+                return None
+            sources.append((source, dest, render, stat.st_mode))
+            signature.append((key, stat.st_mtime_ns, stat.st_size))
+        return sources, tuple(signature)
+
+    def _scan(self) -> tuple[list[tuple[Path, str, bool, int]], tuple]:
+        """
+        Return the template sources and their (path, mtime, size) signature.
+
+        Each source is (path, destination, render, st_mode).
+        """
+        if self._index is not None:
+            scanned = self._scan_index()
+            if scanned is not None:
+                return scanned
+            self._index = None
+
+        sources = []
+        signature = []
+        for source, dest, render, stat in scan_template_sources(self.template_dir):
+            sources.append((source, dest, render, stat.st_mode))
+            signature.append((str(source), stat.st_mtime_ns, stat.st_size))
+        return sources, tuple(signature)
+
+    def _compile(
+        self, source: Path, dest: str, render: bool, mode: int
+    ) -> TemplateFile:
+        """Read one template file and split it at placeholder boundaries."""
+        with source.open("rb") as file:
+            if os.fstat(file.fileno()).st_size > STREAM_THRESHOLD:
+                return self._compile_large(file, source, dest, render, mode)
+            data = file.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+        template = TemplateFile(source=source, dest=dest, mode=mode, sha256=sha256)
+        if not render:
+            return template
+
+        entry = self._index.get(str(source)) if self._index is not None else None
+        if entry is not None:
+            if sha256 != entry["sha256"]:
+                raise StaleIndexError(str(source))
+            if entry["kind"] == "binary":
+                return template
+            segments = _split_at_offsets(data, entry["placeholders"])
+        else:
+            try:
+                segments = split_placeholders(data.decode("utf-8"))
+            except UnicodeDecodeError:
+                return template
+        return replace(template, segments=segments)
+
+    @staticmethod
+    def _compile_large(
+        file, source: Path, dest: str, render: bool, mode: int
+    ) -> TemplateFile:
+        """
+        Hash and classify a large template without holding it in memory.
+
+        The file is streamed only if it is valid UTF-8 and contains at least
+        one placeholder; otherwise it is copied byte for byte.
+        """
+        hasher = hashlib.sha256()
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        text = render
+        found = False
+        for chunk in iter_complete_chunks(file):
+            hasher.update(chunk)
+            if text:
+                try:
+                    decoder.decode(chunk)
+                except UnicodeDecodeError:
+                    text = False
+            if text and not found:
+                found = PLACEHOLDER_BYTES_RE.search(chunk) is not None
+        if text:
+            try:
+                decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                text = False
+        return TemplateFile(
+            source=source,
+            dest=dest,
+            mode=mode,
+            sha256=hasher.hexdigest(),
+            streamed=text and found,
+        )
+
+    def is_stale(self) -> bool:
+        """Whether the templates changed on disk since they were loaded."""
+        if self._files is None:
+            return True
+        return self._scan()[1] != self._signature
+
+    def invalidate(self) -> None:
+        """Drop the loaded templates so the next access reloads them."""
+        with self._lock:
+            self._files = None
+            self._signature = None
+            self._compiled.clear()
+
+    def files(self) -> list[TemplateFile]:
+        """
+        Return the compiled template files, reloading them if they changed.
+
+        Returns:
+            List of TemplateFile in copy order
+        """
+        with self._lock:
+            try:
+                return self._load()
+            except StaleIndexError:
+                # Template contents drifted from the index; rescan the tree
+                self._index = None
+                self._compiled.clear()
+                return self._load()
+
+    def _load(self) -> list[TemplateFile]:
+        """Recompile the templates whose (path, mtime, size) changed."""
+        sources, signature = self._scan()
+        if self._files is None or signature != self._signature:
+            compiled = {}
+            for index, source in enumerate(sources):
+                key = signature[index]
+                template = self._compiled.get(key)
+                if template is None or template.dest != source[1]:
+                    template = self._compile(*source)
+                compiled[key] = template
+            self._compiled = compiled
+            self._files = list(compiled.values())
+            self._signature = signature
+        return self._files
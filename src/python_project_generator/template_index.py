@@ -0,0 +1,137 @@
+"""
+Precomputed index of the bundled template set.
+
+The index records, for every file the generator copies into a project, its
+destination path, size, SHA-256 hash, text/binary classification and the byte
+offsets of its placeholders. TemplateCache loads templates from the index
+instead of sniffing every template file at runtime; the tree is only listed to
+notice files added or removed since the index was built.
+
+Rebuild the index after changing templates:
+
+    python -m python_project_generator.template_index
+
+Use ``--check`` to fail (e.g. in CI) when the shipped index is out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+from python_project_generator.renderer import PLACEHOLDER_BYTES_RE
+from python_project_generator.template_cache import (
+    INDEX_PATH,
+    INDEX_VERSION,
+    iter_template_sources,
+)
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent.parent / "templates"
+
+
+def index_entry(source: Path, dest: str, render: bool, repo_root: Path) -> dict:
+    """
+    Describe one template file.
+
+    Args:
+        source: Template file path
+        dest: Destination path relative to the project root
+        render: Whether placeholders in the file are rendered
+        repo_root: Directory the source path is recorded relative to
+
+    Returns:
+        Index entry for the file
+    """
+    data = source.read_bytes()
+    try:
+        data.decode("utf-8")
+        kind = "text"
+    except UnicodeDecodeError:
+        kind = "binary"
+
+    placeholders = []
+    if render and kind == "text":
+        placeholders = [
+            [match.start(), match.end() - match.start()]
+            for match in PLACEHOLDER_BYTES_RE.finditer(data)
+        ]
+
+    return {
+        "source": source.relative_to(repo_root).as_posix(),
+        "dest": dest,
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "kind": kind,
+        "render": render,
+        "placeholders": placeholders,
+    }
+
+
+def build_index(template_dir: Path = DEFAULT_TEMPLATE_DIR) -> dict:
+    """
+    Build the index for a template directory.
+
+    Args:
+        template_dir: The ``templates/`` directory
+
+    Returns:
+        JSON-serializable index
+    """
+    template_dir = Path(template_dir)
+    repo_root = template_dir.parent
+    return {
+        "version": INDEX_VERSION,
+        "files": [
+            index_entry(source, dest, render, repo_root)
+            for source, dest, render in iter_template_sources(template_dir)
+        ],
+    }
+
+
+def dumps_index(index: dict) -> str:
+    """Serialize an index in the stable format it is shipped in."""
+    return json.dumps(index, indent=1, sort_keys=True) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Rebuild or check the shipped template index."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--template-dir",
+        type=Path,
+        default=DEFAULT_TEMPLATE_DIR,
+        help="Template directory to index",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=INDEX_PATH,
+        help="Index file to write",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if the index is out of date instead of writing",
+    )
+    args = parser.parse_args(argv)
+
+    content = dumps_index(build_index(args.template_dir))
+
+    if args.check:
+        current = ""
+        if args.output.exists():
+            current = args.output.read_text(encoding="utf-8")
+        if current != content:
+            print(f"{args.output} is out of date", file=sys.stderr)  # noqa: T201
+            return 1
+        return 0
+
+    args.output.write_text(content, encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
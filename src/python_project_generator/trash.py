@@ -0,0 +1,219 @@
+"""
+Fast removal of existing project directories.
+
+Overwriting a project with ``--force`` renames the old directory aside, which
+is a single atomic operation on the same filesystem, and deletes it in the
+background while the new project is generated. Directories left behind by an
+interrupted deletion are swept on later runs in the same output directory.
+
+Many runs may share an output directory, so a directory is claimed before it
+is deleted: it is renamed once more to a name recording the deleting process
+(``<name>.ppg-deleting-<pid>@<host>``). The rename succeeds for exactly one
+claimant, and claimed directories are left alone by everyone else unless the
+process that claimed them is gone.
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import threading
+import time
+import uuid
+from pathlib import Path
+
+#: Marker in the names of renamed directories that are waiting for deletion
+TRASH_MARKER = ".ppg-trash-"
+
+#: Marker in the names of directories a process has claimed for deletion
+CLAIM_MARKER = ".ppg-deleting-"
+
+
+def move_aside(path: Path) -> Path:
+    """
+    Atomically rename a directory to a hidden sibling marked for deletion.
+
+    Args:
+        path: Directory to move out of the way
+
+    Returns:
+        New location of the directory
+    """
+    trash = path.with_name(f".{path.name}{TRASH_MARKER}{uuid.uuid4().hex[:12]}")
+    path.rename(trash)
+    return trash
+
+
+def move_to_backup(path: Path) -> Path:
+    """
+    Atomically rename a directory to a timestamped backup next to it.
+
+    Args:
+        path: Directory to keep as a backup
+
+    Returns:
+        Location of the backup, e.g. ``my_project.bak-20240101-120000``
+    """
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    backup = path.with_name(f"{path.name}.bak-{stamp}")
+    counter = 1
+    while backup.exists():
+        backup = path.with_name(f"{path.name}.bak-{stamp}-{counter}")
+        counter += 1
+    path.rename(backup)
+    return backup
+
+
+def _owner() -> str:
+    """Return the claim suffix identifying this process."""
+    return f"{os.getpid()}@{socket.gethostname()}"
+
+
+def claim(path: Path) -> Path | None:
+    """
+    Claim a directory for deletion by this process.
+
+    Args:
+        path: Directory to delete, possibly claimed by another process before
+
+    Returns:
+        New location of the directory, or None if another process claimed
+        (or deleted) it first
+    """
+    base = path.name.split(CLAIM_MARKER)[0]
+    claimed = path.with_name(f"{base}{CLAIM_MARKER}{_owner()}")
+    if claimed == path:
+        return path
+    try:
+        path.rename(claimed)
+    except OSError:
+        return None
+    return claimed
+
+
+def _is_running(pid: int) -> bool:
+    """Whether a process with this ID exists on this host."""
+    if sys.platform == "win32":
+        # os.kill would terminate the process; assume the deletion is ongoing
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _is_abandoned(name: str) -> bool:
+    """Whether the process that claimed a directory no longer exists."""
+    pid, _, host = name.rpartition(CLAIM_MARKER)[2].partition("@")
+    if host != socket.gethostname():
+        # Claimed on another host sharing the volume; it cannot be checked
+        return False
+    if not pid.isdigit():
+        return True
+    return int(pid) != os.getpid() and not _is_running(int(pid))
+
+
+def _rmtree(paths: tuple[Path, ...]) -> None:
+    """Delete directory trees, ignoring errors."""
+    import shutil
+
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def delete_in_background(*paths: Path, detach: bool = False) -> threading.Thread | None:
+    """
+    Claim directory trees and delete them without waiting.
+
+    Directories claimed by another process first are skipped. All trees are
+    deleted by a single thread or helper process.
+
+    Args:
+        *paths: Directories to delete
+        detach: Delete in a separate process that outlives this one instead
+            of a daemon thread that stops when the interpreter exits
+
+    Returns:
+        The deleting thread, or None if a process was started or there was
+        nothing left to delete
+    """
+    claimed = [path for path in map(claim, paths) if path is not None]
+    if not claimed:
+        return None
+
+    if detach:
+        import subprocess
+
+        # The helper claims the directories again under its own process ID,
+        # so they are not mistaken for abandoned once this process exits
+        env = dict(os.environ)
+        package_root = str(Path(__file__).resolve().parent.parent)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [package_root, env.get("PYTHONPATH")])
+        )
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "python_project_generator.trash",
+                *map(str, claimed),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            start_new_session=True,
+        )
+        return None
+
+    thread = threading.Thread(
+        target=_rmtree, args=(tuple(claimed),), name="ppg-trash", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def find_leftovers(directory: Path) -> list[Path]:
+    """
+    Find directories renamed aside by earlier runs that still exist.
+
+    Directories being deleted by a running process are not included; those
+    claimed by a process that has exited are.
+
+    Args:
+        directory: Output directory to look in
+
+    Returns:
+        Leftover directories, in name order
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.startswith(".")
+                and (
+                    _is_abandoned(entry.name)
+                    if CLAIM_MARKER in entry.name
+                    else TRASH_MARKER in entry.name
+                )
+                and entry.is_dir(follow_symlinks=False)
+            )
+    except OSError:
+        return []
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Claim and delete the directories given as arguments (helper process)."""
+    if argv is None:
+        argv = sys.argv[1:]
+    _rmtree(tuple(filter(None, (claim(Path(arg)) for arg in argv))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Incremental updates of previously generated projects.
+
+Every generated project stores a small manifest mapping each generated file
+to the SHA-256 hash of the content that was written. On update, a file is
+rewritten only if its new content differs from the recorded hash and the
+file on disk still matches that hash; files the user changed are left alone
+and reported as conflicts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MANIFEST_NAME = ".python-project-generator.json"
+MANIFEST_VERSION = 1
+
+
+def file_digest(data: bytes) -> str:
+    """Return the hex SHA-256 digest of file contents."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_project_manifest(project_path: Path) -> dict[str, str]:
+    """
+    Load the generated-file hashes recorded in a project.
+
+    Args:
+        project_path: Root of a generated project
+
+    Returns:
+        Mapping of project-relative POSIX paths to content hashes; empty if
+        the project has no (readable) manifest
+    """
+    try:
+        manifest = json.loads(
+            (project_path / MANIFEST_NAME).read_text(encoding="utf-8")
+        )
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return dict(manifest.get("files", {}))
+
+
+def dumps_project_manifest(hashes: dict[str, str]) -> bytes:
+    """
+    Serialize the generated-file hashes of a project.
+
+    Args:
+        hashes: Mapping of project-relative POSIX paths to content hashes
+
+    Returns:
+        Manifest file contents
+    """
+    manifest = {"version": MANIFEST_VERSION, "files": dict(sorted(hashes.items()))}
+    return (json.dumps(manifest, indent=2) + "\n").encode("utf-8")
+
+
+@dataclass
+class UpdateReport:
+    """Per-file outcome of updating an existing project."""
+
+    previous: dict[str, str]
+    written: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    conflicts: list[str] = field(default_factory=list)
+    orphaned: list[str] = field(default_factory=list)
+
+    def decide(self, project_path: Path, dest: str, digest: str) -> str:
+        """
+        Decide what to do with one generated file.
+
+        Args:
+            project_path: Root of the project being updated
+            dest: Project-relative POSIX path of the file
+            digest: Hash of the newly rendered content
+
+        Returns:
+            ``"write"``, ``"unchanged"`` or ``"conflict"``
+        """
+        recorded = self.previous.get(dest)
+        if recorded == digest:
+            # Template and variables unchanged: skip without touching disk
+            self.unchanged.append(dest)
+            return "unchanged"
+
+        dest_path = project_path / dest
+        try:
+            current = file_digest(dest_path.read_bytes())
+        except FileNotFoundError:
+            current = None
+
+        if current == digest:
+            action = "unchanged"
+        elif current == recorded:
+            # Missing and never written, or unchanged since the last run
+            action = "write"
+        else:
+            # Modified or deleted by the user, or an untracked file in the way
+            action = "conflict"
+
+        if action == "write":
+            self.written.append(dest)
+        elif action == "unchanged":
+            self.unchanged.append(dest)
+        else:
+            self.conflicts.append(dest)
+        return action
@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
-"""Validate that the project is properly set up."""
+"""
+Validate that the project is properly set up.
 
+Run without arguments to validate the project containing this script, or
+pass project roots to validate many projects in parallel:
+
+    python scripts/validate_project.py
+    python scripts/validate_project.py --jobs 8 --format ndjson repos/*/
+    python scripts/validate_project.py --deep
+    find repos -name pyproject.toml -printf '%h\n' |
+        python scripts/validate_project.py --from-file - --format json
+"""
+
+from __future__ import annotations
+
+import os
+import re
 import sys
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 # Required files for project validation
 REQUIRED_FILES = [
@@ -26,6 +47,38 @@ REQUIRED_DIRS = [
 ]
 
 
+# Template placeholders that survived rendering, e.g. an unknown variable.
+# Written with character classes so this file does not match itself.
+PLACEHOLDER_PATTERN = re.compile(rb"[{][{][A-Z][A-Z0-9_]*[}][}]")
+
+# Directories deep validation does not descend into
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".venv",
+        "venv",
+        ".tox",
+        ".nox",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".eggs",
+        "build",
+        "dist",
+        "site-packages",
+    }
+)
+
+# Files up to this size are read directly; larger ones are memory-mapped
+MMAP_THRESHOLD = 64 * 1024
+
+# A NUL byte in this many leading bytes marks a file as binary
+BINARY_PROBE_BYTES = 8192
+
+
 def _check_package(project_root: Path, errors: list[str]) -> None:
     """Check the package structure."""
     src_dirs = list((project_root / "src").glob("*"))
@@ -39,11 +92,166 @@ def _check_package(project_root: Path, errors: list[str]) -> None:
             errors.append(f"Missing main.py in {package_dir}")
 
 
-def validate_function() -> int:
-    """Validate the project structure."""
-    project_root = Path(__file__).parent.parent
+def _load_toml(path: Path):
+    """Parse a TOML file with tomllib, or tomli on Pythons before 3.11."""
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            return None
+    with path.open("rb") as file:
+        return tomllib.load(file)
+
 
-    errors = []
+def _check_pyproject(project_root: Path, errors: list[str]) -> None:
+    """Check that pyproject.toml parses and declares a project name."""
+    path = project_root / "pyproject.toml"
+    if not path.is_file():
+        return
+    try:
+        data = _load_toml(path)
+    except (OSError, ValueError) as e:
+        errors.append(f"Invalid pyproject.toml: {e}")
+        return
+    if data is None:
+        # No TOML parser available on this Python
+        return
+    if not data.get("project", {}).get("name"):
+        errors.append("pyproject.toml does not declare [project] name")
+
+
+def find_placeholders(path: Path) -> list[str]:
+    """
+    Find template placeholders left in a file.
+
+    Binary files (a NUL byte near the start) are skipped; large files are
+    memory-mapped instead of read, so any size can be scanned.
+
+    Args:
+        path: File to scan
+
+    Returns:
+        Distinct placeholder tokens in order of first occurrence
+    """
+    import mmap
+
+    with path.open("rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return []
+        if size <= MMAP_THRESHOLD:
+            data = file.read()
+            return _placeholders_in(data)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return _placeholders_in(data)
+
+
+def _placeholders_in(data) -> list[str]:
+    """Return the placeholders in bytes or an mmap, skipping binary data."""
+    if data.find(b"\0", 0, BINARY_PROBE_BYTES) != -1:
+        return []
+    if data.find(b"{{") == -1:
+        return []
+    tokens = dict.fromkeys(
+        match.group().decode("ascii") for match in PLACEHOLDER_PATTERN.finditer(data)
+    )
+    return list(tokens)
+
+
+def _iter_files(project_root: Path) -> Iterator[Path]:
+    """Yield every regular file below a root, skipping SKIP_DIRS."""
+    pending = [str(project_root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _check_placeholders(
+    project_root: Path,
+    errors: list[str],
+    skipped: list[str],
+    max_scan_bytes: int | None = None,
+) -> None:
+    """
+    Report files that still contain template placeholders.
+
+    Files larger than ``max_scan_bytes`` and files that cannot be read are
+    added to ``skipped`` with the reason instead of passing silently.
+    """
+    leftovers = []
+    not_scanned = []
+    for path in _iter_files(project_root):
+        rel_path = path.relative_to(project_root).as_posix()
+        try:
+            if max_scan_bytes is not None:
+                size = path.stat().st_size
+                if size > max_scan_bytes:
+                    not_scanned.append(f"{rel_path} ({size} bytes, over the limit)")
+                    continue
+            tokens = find_placeholders(path)
+        except (OSError, ValueError) as e:
+            not_scanned.append(f"{rel_path} ({e})")
+            continue
+        if tokens:
+            leftovers.append((rel_path, tokens))
+    errors.extend(
+        f"Unrendered placeholder in {rel_path}: {', '.join(tokens)}"
+        for rel_path, tokens in sorted(leftovers)
+    )
+    skipped.extend(sorted(not_scanned))
+
+
+@dataclass
+class ValidationResult:
+    """Structured outcome of validating one project."""
+
+    root: Path
+    errors: list[str] = field(default_factory=list)
+    #: Files deep validation did not scan for placeholders, with the reason
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project passed validation."""
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        """Return the result as a JSON-serializable dictionary."""
+        return {
+            "root": str(self.root),
+            "ok": self.ok,
+            "errors": self.errors,
+            "skipped": self.skipped,
+        }
+
+
+def validate(
+    project_root: Path, deep: bool = False, max_scan_bytes: int | None = None
+) -> ValidationResult:
+    """
+    Validate the structure of a project.
+
+    Args:
+        project_root: Root directory of the project to check
+        deep: Also parse pyproject.toml and scan every text file for
+            placeholders that were not rendered
+        max_scan_bytes: Do not scan files larger than this (default: scan
+            every file); skipped files are listed in the result
+
+    Returns:
+        ValidationResult listing every problem found
+    """
+    errors: list[str] = []
 
     # Check for required files
     errors.extend(
@@ -72,9 +280,46 @@ def validate_function() -> int:
     if not (project_root / "tests" / "test_main.py").exists():
         errors.append("Missing test_main.py in tests/")
 
-    if errors:
+    skipped: list[str] = []
+    if deep:
+        _check_pyproject(project_root, errors)
+        _check_placeholders(project_root, errors, skipped, max_scan_bytes)
+
+    return ValidationResult(root=project_root, errors=errors, skipped=skipped)
+
+
+def _print_skipped(result: ValidationResult) -> None:
+    """Print the files deep validation did not scan."""
+    for skipped in result.skipped:
+        print(f"  Not scanned: {skipped}")  # noqa: T201
+
+
+def validate_function(
+    project_root: Path | None = None,
+    deep: bool = False,
+    max_scan_bytes: int | None = None,
+) -> int:
+    """
+    Validate the project structure and print the outcome.
+
+    Args:
+        project_root: Project to check (default: the project containing this
+            script)
+        deep: Also check pyproject.toml and look for unrendered placeholders
+        max_scan_bytes: Do not scan files larger than this for placeholders
+
+    Returns:
+        Exit code: 0 if validation passed, 1 otherwise
+    """
+    if project_root is None:
+        project_root = Path(__file__).parent.parent
+
+    result = validate(project_root, deep=deep, max_scan_bytes=max_scan_bytes)
+    _print_skipped(result)
+
+    if not result.ok:
         print("Project validation failed:")  # noqa: T201
-        for error in errors:
+        for error in result.errors:
             print(f"  - {error}")  # noqa: T201
         return 1
 
@@ -82,5 +327,147 @@ def validate_function() -> int:
     return 0
 
 
+def validate_many(
+    project_roots: Iterable[Path],
+    jobs: int = 0,
+    deep: bool = False,
+    max_scan_bytes: int | None = None,
+) -> Iterator[ValidationResult]:
+    """
+    Validate many projects on a process pool.
+
+    Args:
+        project_roots: Root directories of the projects to check
+        jobs: Number of worker processes (0 uses all CPUs, 1 validates in
+            this process)
+        deep: Run the deep checks on every project
+        max_scan_bytes: Do not scan files larger than this for placeholders
+
+    Returns:
+        Iterator of ValidationResult in the order of ``project_roots``;
+        results are produced while later projects are still being checked
+    """
+    roots = [Path(root) for root in project_roots]
+    check = partial(validate, deep=deep, max_scan_bytes=max_scan_bytes)
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    jobs = min(jobs, len(roots)) or 1
+
+    if jobs == 1:
+        yield from map(check, roots)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Validation is cheap per project, so hand each worker several at once
+    chunksize = max(1, len(roots) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(check, roots, chunksize=chunksize)
+
+
+def _read_roots(source: str) -> list[Path]:
+    """Read project roots, one per line, from a file or - for stdin."""
+    if source == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+    return [Path(line.strip()) for line in lines if line.strip()]
+
+
+def _print_result(result: ValidationResult, fmt: str) -> None:
+    """Print one project's result as an NDJSON line or, if notable, as text."""
+    if fmt == "ndjson":
+        import json
+
+        print(json.dumps(result.to_dict()), flush=True)  # noqa: T201
+    elif not result.ok:
+        print(f"FAILED  {result.root}")  # noqa: T201
+        for error in result.errors:
+            print(f"  - {error}")  # noqa: T201
+        _print_skipped(result)
+    elif result.skipped:
+        print(f"ok      {result.root}")  # noqa: T201
+        _print_skipped(result)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Validate one or many projects from the command line.
+
+    Returns:
+        Exit code: 0 if every project passed validation, 1 otherwise
+    """
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Validate project structure")
+    parser.add_argument(
+        "roots",
+        nargs="*",
+        type=Path,
+        help="Project roots (default: the project containing this script)",
+    )
+    parser.add_argument(
+        "--from-file",
+        metavar="FILE",
+        help="Read additional project roots from FILE, one per line (- for stdin)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=0,
+        help="Number of worker processes (default: all CPUs)",
+    )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Also parse pyproject.toml and scan files for unrendered placeholders",
+    )
+    parser.add_argument(
+        "--max-scan-bytes",
+        type=int,
+        metavar="BYTES",
+        help="With --deep, do not scan files larger than BYTES for placeholders "
+        "(default: scan every file); skipped files are reported",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Report format (default: text)",
+    )
+    args = parser.parse_args(argv)
+
+    roots = list(args.roots)
+    if args.from_file:
+        roots.extend(_read_roots(args.from_file))
+    if not roots and args.format == "text":
+        return validate_function(deep=args.deep, max_scan_bytes=args.max_scan_bytes)
+    if not roots:
+        roots = [Path(__file__).parent.parent]
+
+    results = validate_many(
+        roots, jobs=args.jobs, deep=args.deep, max_scan_bytes=args.max_scan_bytes
+    )
+    total = failed = 0
+
+    if args.format == "json":
+        report = [result.to_dict() for result in results]
+        failed = sum(not result["ok"] for result in report)
+        summary = {"total": len(report), "failed": failed, "results": report}
+        print(json.dumps(summary, indent=2))  # noqa: T201
+        return 1 if failed else 0
+
+    for result in results:
+        total += 1
+        failed += not result.ok
+        _print_result(result, args.format)
+
+    if args.format == "text":
+        print(f"{total - failed} passed, {failed} failed")  # noqa: T201
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
-    sys.exit(validate_function())
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Tests for batch generation from manifests.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.batch import (
+    ManifestError,
+    generate_many,
+    load_manifest,
+)
+
+PROJECT_FIELDS = {
+    "description": "Batch project",
+    "author": "Batch Author",
+    "email": "batch@example.com",
+    "github_username": "batchuser",
+}
+
+
+class _ExitOnLoad:
+    """A spec value that kills the worker process that unpickles it."""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+class TestBatchGeneration:
+    """Test manifest loading and batch generation."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_batch_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_load_json_manifest(self, temp_output_dir):
+        """Test that JSON manifest entries map to generator arguments."""
+        manifest = temp_output_dir / "projects.json"
+        manifest.write_text(json.dumps([{"name": "alpha", **PROJECT_FIELDS}]))
+
+        specs = load_manifest(manifest, {"output_dir": temp_output_dir})
+
+        assert specs == [
+            {
+                "project_name": "alpha",
+                "description": "Batch project",
+                "author_name": "Batch Author",
+                "author_email": "batch@example.com",
+                "github_username": "batchuser",
+                "output_dir": temp_output_dir,
+            }
+        ]
+
+    def test_load_csv_manifest_uses_defaults(self, temp_output_dir):
+        """Test that empty CSV cells fall back to the given defaults."""
+        manifest = temp_output_dir / "projects.csv"
+        manifest.write_text("name,description\nbeta,\ngamma,Gamma project\n")
+
+        specs = load_manifest(
+            manifest,
+            {
+                "description": "Default",
+                "author_name": "A",
+                "author_email": "a@example.com",
+                "github_username": "a",
+            },
+        )
+
+        assert [spec["description"] for spec in specs] == ["Default", "Gamma project"]
+
+    def test_load_manifest_missing_field(self, temp_output_dir):
+        """Test that incomplete entries are rejected."""
+        manifest = temp_output_dir / "projects.json"
+        manifest.write_text(json.dumps([{"name": "delta"}]))
+
+        with pytest.raises(ValueError, match="missing"):
+            load_manifest(manifest)
+
+    def test_load_manifest_rejects_non_object_entries(self, temp_output_dir):
+        """Test that JSON entries that are not objects are rejected."""
+        manifest = temp_output_dir / "projects.json"
+        manifest.write_text(json.dumps(["epsilon"]))
+
+        with pytest.raises(ManifestError, match="must be an object"):
+            load_manifest(manifest)
+
+    def test_load_manifest_rejects_extra_csv_cells(self, temp_output_dir):
+        """Test that CSV rows longer than the header are rejected."""
+        manifest = temp_output_dir / "projects.csv"
+        manifest.write_text("name,description\nzeta,Zeta,extra\n")
+
+        with pytest.raises(ValueError, match="more values than the header"):
+            load_manifest(manifest)
+
+    def test_generate_many_reports_each_project(self, temp_output_dir):
+        """Test that a batch reports success and failure per project."""
+        (temp_output_dir / "taken").mkdir()
+        specs = [
+            {
+                "project_name": name,
+                "description": "Batch project",
+                "author_name": "Batch Author",
+                "author_email": "batch@example.com",
+                "github_username": "batchuser",
+                "output_dir": temp_output_dir,
+            }
+            for name in ("first", "taken", "second")
+        ]
+
+        results = generate_many(specs, jobs=2, init_git=False)
+
+        assert [result.name for result in results] == ["first", "taken", "second"]
+        assert [result.ok for result in results] == [True, False, True]
+        assert "FileExistsError" in results[1].error
+        assert (temp_output_dir / "second" / "pyproject.toml").exists()
+
+    def test_generate_many_survives_a_dead_worker(self, temp_output_dir):
+        """Test that a worker that dies fails its project instead of the batch."""
+        specs = [
+            {
+                "project_name": name,
+                "description": "Batch project",
+                "author_name": "Batch Author",
+                "author_email": "batch@example.com",
+                "github_username": "batchuser",
+                "output_dir": temp_output_dir,
+            }
+            for name in ("first", "crashed")
+        ]
+        specs[1]["description"] = _ExitOnLoad()
+
+        results = generate_many(specs, jobs=2, init_git=False)
+
+        assert [result.name for result in results] == ["first", "crashed"]
+        assert not results[1].ok
+        assert "BrokenProcessPool" in results[1].error
+
+    def test_cli_manifest(self, temp_output_dir):
+        """Test batch generation through the CLI with a JSON report."""
+        manifest = temp_output_dir / "projects.json"
+        manifest.write_text(json.dumps([{"name": "cli_batch", **PROJECT_FIELDS}]))
+        report = temp_output_dir / "report.json"
+
+        result = subprocess.run(
+            [
+                "python-project-generator",
+                "--manifest",
+                str(manifest),
+                "--output",
+                str(temp_output_dir),
+                "--jobs",
+                "2",
+                "--report",
+                str(report),
+                "--no-git",
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "1 succeeded, 0 failed" in result.stdout
+        assert json.loads(report.read_text())[0]["ok"] is True
@@ -0,0 +1,125 @@
+"""
+Tests for the benchmark helpers and phase timings.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.bench import (
+    compare,
+    default_revision,
+    run,
+    save_revision_baseline,
+)
+from python_project_generator.generator import PHASES, ProjectGenerator
+
+requires_git = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+class TestPhaseTimings:
+    """Test the per-phase timings recorded during generation."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_bench_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_generate_records_phases(self, temp_output_dir):
+        """Test that every phase of a generation is timed."""
+        generator = ProjectGenerator(
+            project_name="timed_project",
+            description="Timed",
+            author_name="Timer",
+            author_email="timer@example.com",
+            github_username="timer",
+            output_dir=temp_output_dir,
+        )
+        generator.generate()
+
+        timings = generator.phase_timings
+        assert set(timings) == set(PHASES) - {"clean", "cache"}
+        assert all(value >= 0 for value in timings.values())
+
+        generator.generate(force=True, init_git=False)
+        assert "clean" in generator.phase_timings
+        assert "git" not in generator.phase_timings
+
+    def test_run_small_scenarios(self):
+        """Test that the benchmark scenarios run end to end."""
+        results = run(repeat=1, batch_size=2, jobs=1, large_files=50)
+
+        assert set(results) == {"single", "batch", "large"}
+        assert results["single"]["total"] > 0
+        assert results["batch"]["per_project"] > 0
+        assert "template_load" in results["large"]
+
+
+class TestCompare:
+    """Test regression detection against a baseline."""
+
+    def test_regression_detected(self):
+        """Test that a slowdown beyond the threshold is reported."""
+        regressions = compare(
+            {"single": {"git": 0.2, "copy": 0.1}},
+            {"single": {"git": 0.1, "copy": 0.1}},
+            threshold=0.25,
+        )
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("single.git")
+
+    def test_small_differences_ignored(self):
+        """Test that tiny absolute slowdowns are treated as noise."""
+        regressions = compare(
+            {"single": {"render": 0.002}}, {"single": {"render": 0.001}}
+        )
+
+        assert regressions == []
+
+    def test_missing_baseline_metrics_ignored(self):
+        """Test that metrics without a baseline value are skipped."""
+        assert compare({"large": {"total": 1.0}}, {"single": {"total": 0.1}}) == []
+
+
+@requires_git
+class TestRevisionBaseline:
+    """Test measuring the baseline from another git revision."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create a repository whose only branch, master, has no benchmarks."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        (repo / "README.md").write_text("# repo\n")
+        identity = ("-c", "user.name=a", "-c", "user.email=a@example.com")
+        for args in (
+            ("init", "--quiet", "--initial-branch=master"),
+            ("add", "README.md"),
+            (*identity, "commit", "--quiet", "--message=Initial commit"),
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        return repo
+
+    def test_default_revision_without_main(self, repo):
+        """Test that clones without a main branch compare against master."""
+        assert default_revision(repo) == "master"
+
+    def test_revision_without_benchmarks(self, repo, tmp_path):
+        """Test that revisions predating the benchmarks are reported, not run."""
+        baseline = tmp_path / "baseline.json"
+
+        assert not save_revision_baseline("master", baseline, repo=repo)
+        assert not baseline.exists()
+
+    def test_unknown_revision(self, repo, tmp_path):
+        """Test that a missing revision is an error."""
+        with pytest.raises(ValueError, match="Unknown git revision: main"):
+            save_revision_baseline("main", tmp_path / "baseline.json", repo=repo)
@@ -0,0 +1,195 @@
+"""
+Tests for content-deduplicated project storage.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.batch import dedup_totals, generate_many
+from python_project_generator.blobstore import BLOB_DIR, BlobStore
+from python_project_generator.cli import main
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.renderer import CHUNK_SIZE
+from python_project_generator.sinks import DedupSink, DirectorySink
+
+
+class TestBlobStore:
+    """Test the content-addressed store."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for the store and projects."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_blobs_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_identical_contents_are_stored_once(self, temp_dir):
+        """Test that adding the same contents again reuses the blob."""
+        store = BlobStore(temp_dir / "blobs")
+
+        first, added_first = store.add(b"same", 0o644)
+        second, added_second = store.add(b"same", 0o644)
+
+        assert first == second
+        assert (added_first, added_second) == (True, False)
+        assert first.read_bytes() == b"same"
+
+    def test_mode_is_part_of_the_address(self, temp_dir):
+        """Test that hard-linked files keep their own permission bits."""
+        store = BlobStore(temp_dir / "blobs")
+
+        plain, _ = store.add(b"#!/bin/sh\n", 0o644)
+        script, _ = store.add(b"#!/bin/sh\n", 0o755)
+
+        assert plain != script
+        assert script.stat().st_mode & 0o111
+        assert not plain.stat().st_mode & 0o111
+
+    def test_dedup_sink_counts_saved_bytes(self, temp_dir):
+        """Test that a second identical project stores nothing new."""
+        store = BlobStore(temp_dir / "blobs")
+        first = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        second = DedupSink(temp_dir / "two", store, link_mode="hardlink")
+        data = b"x" * 10
+        for sink in (first, second):
+            sink.mkdir("")
+            sink.write_bytes("a.txt", data)
+
+        assert first.stats.stored_bytes == len(data)
+        assert second.stats.linked_bytes == len(data)
+        assert second.stats.saved_bytes == len(data)
+        assert (temp_dir / "two" / "a.txt").read_bytes() == data
+
+    def test_rewrite_does_not_change_shared_blob(self, temp_dir):
+        """Test that updating a hard-linked file leaves other copies alone."""
+        store = BlobStore(temp_dir / "blobs")
+        sink = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        sink.mkdir("")
+        sink.write_bytes("a.txt", b"shared")
+        blob, _ = store.add(b"shared", 0o444)
+
+        DirectorySink(temp_dir / "one").write_bytes("a.txt", b"edited")
+
+        assert blob.read_bytes() == b"shared"
+        assert (temp_dir / "one" / "a.txt").read_bytes() == b"edited"
+
+    def test_prune_removes_unreferenced_blobs(self, temp_dir):
+        """Test that blobs no project links to are deleted."""
+        store = BlobStore(temp_dir / "blobs")
+        sink = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        sink.mkdir("")
+        sink.write_bytes("kept.txt", b"kept")
+        store.add(b"orphan")
+
+        assert store.prune() == 1
+        assert store.add(b"kept", 0o444)[1] is False
+
+    def test_prune_command(self, temp_dir, capsys):
+        """Test pruning the store of an output directory from the command line."""
+        store = BlobStore.for_output(temp_dir)
+        sink = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        sink.mkdir("")
+        sink.write_bytes("kept.txt", b"kept")
+        store.add(b"orphan")
+
+        assert main(["blobs", "prune", "--output", str(temp_dir)]) == 0
+
+        assert "Removed 1 unused blobs" in capsys.readouterr().out
+        assert store.add(b"kept", 0o444)[1] is False
+        assert store.add(b"orphan")[1] is True
+
+    def test_hard_linked_files_are_read_only(self, temp_dir):
+        """Test that a file shared with other projects cannot be edited."""
+        store = BlobStore(temp_dir / "blobs")
+        sink = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        sink.mkdir("")
+        sink.write_bytes("run.sh", b"#!/bin/sh\n", 0o755)
+
+        path = temp_dir / "one" / "run.sh"
+        assert path.stat().st_nlink > 1
+        assert not path.stat().st_mode & 0o222
+        assert path.stat().st_mode & 0o111
+
+    def test_no_hard_links_without_opt_in(self, temp_dir):
+        """Test that files are copied when reflinks are unavailable."""
+        store = BlobStore(temp_dir / "blobs")
+        files = {"a.txt": b"x" * 10, "b.txt": b"y" * 10}
+        with patch("python_project_generator.sinks._reflink", return_value=False):
+            for name in ("one", "two"):
+                sink = DedupSink(temp_dir / name, store)
+                sink.mkdir("")
+                for path, data in files.items():
+                    sink.write_bytes(path, data)
+
+        path = temp_dir / "two" / "a.txt"
+        assert path.stat().st_nlink == 1
+        assert sink.stats.linked_bytes == 0
+        assert sink.stats.copied_bytes == sum(map(len, files.values()))
+
+    def test_copy_file_is_stored_in_chunks(self, temp_dir):
+        """Test that copied files are hashed and stored without a full read."""
+        source = temp_dir / "large.bin"
+        source.write_bytes(b"z" * (CHUNK_SIZE * 2 + 1))
+        store = BlobStore(temp_dir / "blobs")
+        sink = DedupSink(temp_dir / "one", store, link_mode="hardlink")
+        sink.mkdir("")
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            assert sink.copy_file("large.bin", source) == "hardlink"
+            assert sink.copy_file("again.bin", source) == "hardlink"
+
+        assert sink.stats.stored_bytes == source.stat().st_size
+        assert (temp_dir / "one" / "again.bin").read_bytes() == source.read_bytes()
+
+
+class TestDedupedGeneration:
+    """Test generating projects through the blob store."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_dedupe_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def spec(name: str, output_dir: Path) -> dict:
+        """Return generator arguments for a deduplicated project."""
+        return {
+            "project_name": name,
+            "description": "Deduplicated",
+            "author_name": "Dedupe Author",
+            "author_email": "dedupe@example.com",
+            "github_username": "dedupe",
+            "output_dir": output_dir,
+            "dedupe": True,
+            "link_mode": "hardlink",
+        }
+
+    def test_projects_share_blobs(self, temp_output_dir):
+        """Test that the second project reuses the first project's files."""
+        first = ProjectGenerator(**self.spec("first", temp_output_dir))
+        first.generate(init_git=False)
+        second = ProjectGenerator(**self.spec("second", temp_output_dir))
+        project = second.generate(init_git=False)
+
+        assert (temp_output_dir / BLOB_DIR).is_dir()
+        assert first.dedup_stats.stored_bytes > 0
+        assert second.dedup_stats.saved_bytes > second.dedup_stats.stored_bytes
+        assert "second" in (project / "pyproject.toml").read_text()
+
+    def test_batch_reports_totals(self, temp_output_dir):
+        """Test that a deduplicated batch reports the bytes saved."""
+        specs = [self.spec(f"batch_{i}", temp_output_dir) for i in range(3)]
+
+        results = generate_many(specs, init_git=False)
+        totals = dedup_totals(results)
+
+        assert all(result.ok for result in results)
+        assert totals.files == sum(result.dedup["files"] for result in results)
+        assert totals.saved_bytes > 0
+        assert dedup_totals([]) is None
@@ -0,0 +1,213 @@
+"""
+Tests for generation events, results and metrics export.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.cli import main
+from python_project_generator.events import GenerationObserver
+from python_project_generator.generator import PHASES, ProjectGenerator
+from python_project_generator.metrics import OpenMetricsExporter
+from python_project_generator.sinks import MemorySink
+from python_project_generator.update import MANIFEST_NAME
+
+
+class RecordingObserver(GenerationObserver):
+    """Keep every event and result it receives."""
+
+    def __init__(self):
+        """Initialize empty recordings."""
+        self.phases = []
+        self.files = []
+        self.results = []
+        self.errors = []
+
+    def on_phase(self, event):
+        """Record a phase event."""
+        self.phases.append(event)
+
+    def on_file(self, event):
+        """Record a file event."""
+        self.files.append(event)
+
+    def on_result(self, result):
+        """Record a result."""
+        self.results.append(result)
+
+    def on_error(self, error):
+        """Record an error."""
+        self.errors.append(error)
+
+
+class TestObservers:
+    """Test the events reported to generation observers."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_events_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def make_generator(output_dir: Path, observer) -> ProjectGenerator:
+        """Create a generator reporting to an observer."""
+        return ProjectGenerator(
+            project_name="observed_project",
+            description="Observed",
+            author_name="Events Author",
+            author_email="events@example.com",
+            github_username="events",
+            output_dir=output_dir,
+            observers=[observer],
+        )
+
+    def test_generate_reports_phases_files_and_result(self, temp_output_dir):
+        """Test that the result counters match the reported events."""
+        observer = RecordingObserver()
+        generator = self.make_generator(temp_output_dir, observer)
+
+        project = generator.generate(init_git=False)
+
+        result = generator.result
+        assert observer.results == [result]
+        assert result.path == project
+        assert result.files == len(observer.files)
+        assert result.actions["rendered"] > 0
+        assert result.bytes_written == sum(event.size for event in observer.files)
+        readme = next(e for e in observer.files if e.path == "README.md")
+        assert readme.size == (project / "README.md").stat().st_size
+        assert {event.phase for event in observer.phases} <= set(PHASES)
+        assert result.phase_timings == generator.phase_timings
+        assert result.duration >= sum(result.phase_timings.values())
+
+    def test_update_reports_skipped_files(self, temp_output_dir):
+        """Test that files an update leaves alone are reported as skipped."""
+        self.make_generator(temp_output_dir, GenerationObserver()).generate(
+            init_git=False
+        )
+        observer = RecordingObserver()
+
+        self.make_generator(temp_output_dir, observer).update()
+
+        assert {event.action for event in observer.files} == {"skipped"}
+        assert observer.results[0].bytes_written == 0
+
+    def test_render_reports_to_observers(self):
+        """Test that rendering into a sink reports a result without a path."""
+        observer = RecordingObserver()
+        generator = self.make_generator(Path("unused"), observer)
+
+        sink = generator.render(MemorySink())
+
+        assert generator.result.path is None
+        written = {event.path for event in observer.files}
+        assert written == set(sink.files) - {MANIFEST_NAME}
+        assert generator.result.files == len(written)
+
+    def test_failure_is_reported(self, temp_output_dir):
+        """Test that observers hear about failed generations."""
+        (temp_output_dir / "observed_project").mkdir()
+        observer = RecordingObserver()
+        generator = self.make_generator(temp_output_dir, observer)
+
+        with pytest.raises(FileExistsError):
+            generator.generate(init_git=False)
+
+        assert isinstance(observer.errors[0], FileExistsError)
+        assert observer.results == []
+        assert generator.result is None
+
+
+class TestOpenMetricsExporter:
+    """Test the OpenMetrics text format."""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket, count and sum samples."""
+        exporter = OpenMetricsExporter(buckets=(0.1, 1.0))
+        exporter.observe(0.05, {"render": 0.5})
+        exporter.observe(2.0, {"render": 0.01})
+        exporter.observe_failure()
+
+        lines = exporter.render().splitlines()
+
+        name = "ppg_generation_duration_seconds"
+        assert f'{name}_bucket{{le="0.1"}} 1' in lines
+        assert f'{name}_bucket{{le="1.0"}} 1' in lines
+        assert f'{name}_bucket{{le="+Inf"}} 2' in lines
+        assert f"{name}_count 2" in lines
+        assert 'ppg_phase_duration_seconds_bucket{phase="render",le="1.0"} 2' in lines
+        assert 'ppg_generations_total{outcome="failure"} 1' in lines
+        assert lines[-1] == "# EOF"
+
+    def test_errors_are_counted_by_type(self):
+        """Test that failures are also counted by exception type."""
+        exporter = OpenMetricsExporter()
+        exporter.on_error(FileExistsError("exists"))
+        exporter.observe_failure()
+
+        lines = exporter.render().splitlines()
+
+        assert 'ppg_generations_total{outcome="failure"} 2' in lines
+        assert 'ppg_generation_errors_total{type="FileExistsError"} 1' in lines
+
+    def test_write(self, tmp_path):
+        """Test that the metrics file is written."""
+        exporter = OpenMetricsExporter()
+        exporter.observe(0.2, {}, files={"copied": 3}, bytes_written=10)
+
+        exporter.write(tmp_path / "ppg.prom")
+
+        text = (tmp_path / "ppg.prom").read_text()
+        assert 'ppg_files_total{action="copied"} 3' in text
+        assert "ppg_written_bytes_total 10" in text
+
+
+class TestCommandLine:
+    """Test error reporting and metrics on the command line."""
+
+    ARGS = (
+        "--name",
+        "cli_project",
+        "--description",
+        "CLI",
+        "--author",
+        "CLI Author",
+        "--email",
+        "cli@example.com",
+        "--github-username",
+        "cli",
+        "--no-git",
+    )
+
+    def test_error_is_printed(self, tmp_path, capsys):
+        """Test that a failed generation says why instead of exiting silently."""
+        (tmp_path / "cli_project").mkdir()
+
+        assert main([*self.ARGS, "--output", str(tmp_path)]) == 1
+
+        err = capsys.readouterr().err
+        assert "Error:" in err
+        assert "already exists" in err
+        assert "Traceback" not in err
+
+    def test_traceback(self, tmp_path, capsys):
+        """Test that --traceback prints the full traceback."""
+        (tmp_path / "cli_project").mkdir()
+
+        assert main([*self.ARGS, "--output", str(tmp_path), "--traceback"]) == 1
+
+        assert "Traceback" in capsys.readouterr().err
+
+    def test_metrics_file(self, tmp_path):
+        """Test that --metrics writes the generation's metrics."""
+        metrics = tmp_path / "ppg.prom"
+
+        code = main([*self.ARGS, "--output", str(tmp_path), "--metrics", str(metrics)])
+
+        assert code == 0
+        assert 'ppg_generations_total{outcome="success"} 1' in metrics.read_text()
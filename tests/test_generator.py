@@ -0,0 +1,177 @@
+"""
+Tests for ProjectGenerator internals.
+"""
+
+import shutil
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.sinks import DirectorySink
+
+
+class TestTemplateMaterialization:
+    """Test how template files are written into a project."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_generator_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @pytest.fixture
+    def generator(self, temp_output_dir):
+        """Create a generator writing into the temporary directory."""
+        return ProjectGenerator(
+            project_name="render_project",
+            description="Render test",
+            author_name="Render Author",
+            author_email="render@example.com",
+            github_username="render",
+            output_dir=temp_output_dir,
+        )
+
+    def test_each_file_written_once(self, generator, temp_output_dir):
+        """Test that static files are copied and rendered files written once."""
+        templates = generator.template_cache.files()
+        rendered = [t for t in templates if t.has_placeholders]
+        plan = generator.build_plan()
+        copies = [entry for entry in plan.entries if entry.operation == "copy"]
+
+        real_copy2 = shutil.copy2
+        with patch("shutil.copy2") as copy2:
+            copy2.side_effect = real_copy2
+            generator.render(DirectorySink(temp_output_dir))
+
+        assert copy2.call_count == len(copies)
+        for template in rendered:
+            content = (temp_output_dir / template.dest).read_text()
+            assert "{{PROJECT_NAME}}" not in content
+
+    def test_static_files_are_byte_identical(self, generator, temp_output_dir):
+        """Test that files without placeholders are passed through untouched."""
+        generator.render(DirectorySink(temp_output_dir))
+
+        for template in generator.template_cache.files():
+            if not template.has_placeholders:
+                assert (temp_output_dir / template.dest).read_bytes() == (
+                    template.source.read_bytes()
+                )
+
+
+class TestValidation:
+    """Test how generated projects are validated."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_validation_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, output_dir: Path, **kwargs):
+        """Create a generator writing into output_dir."""
+        return ProjectGenerator(
+            project_name="validated_project",
+            description="Validation test",
+            author_name="Validation Author",
+            author_email="validation@example.com",
+            github_username="validation",
+            output_dir=output_dir,
+            **kwargs,
+        )
+
+    def test_validation_runs_in_process(self, temp_output_dir):
+        """Test that the default validation does not spawn a subprocess."""
+        with patch("subprocess.run") as run:
+            self.make_generator(temp_output_dir).generate(init_git=False)
+
+        run.assert_not_called()
+
+    def test_subprocess_validation(self, temp_output_dir):
+        """Test that subprocess validation is still available."""
+        generator = self.make_generator(temp_output_dir, validation="subprocess")
+
+        assert generator.generate(init_git=False).exists()
+
+    def test_deep_validation(self, temp_output_dir):
+        """Test that a generated project passes deep validation."""
+        generator = self.make_generator(temp_output_dir, validation="deep")
+
+        assert generator.generate(init_git=False).exists()
+
+    def test_validation_failure_raises(self, temp_output_dir):
+        """Test that an invalid project raises RuntimeError with the errors."""
+        generator = self.make_generator(temp_output_dir)
+        plan = generator.build_plan()
+        entries = tuple(entry for entry in plan.entries if entry.dest != "Makefile")
+        with (
+            patch.object(
+                generator, "build_plan", return_value=replace(plan, entries=entries)
+            ),
+            pytest.raises(RuntimeError, match="Missing required file: Makefile"),
+        ):
+            generator.generate(init_git=False)
+
+    def test_unknown_validation_mode(self, temp_output_dir):
+        """Test that an unknown validation mode is rejected."""
+        with pytest.raises(ValueError, match="validation"):
+            self.make_generator(temp_output_dir, validation="never")
+
+
+class TestConcurrentWrites:
+    """Test writing files on an I/O thread pool."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_io_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, output_dir: Path, **kwargs):
+        """Create a generator writing into output_dir."""
+        return ProjectGenerator(
+            project_name="io_project",
+            description="I/O test",
+            author_name="IO Author",
+            author_email="io@example.com",
+            github_username="io",
+            output_dir=output_dir,
+            **kwargs,
+        )
+
+    @staticmethod
+    def snapshot(project_path: Path) -> dict[str, bytes]:
+        """Return the contents of every file in a project."""
+        return {
+            path.relative_to(project_path).as_posix(): path.read_bytes()
+            for path in project_path.rglob("*")
+            if path.is_file()
+        }
+
+    def test_parallel_output_matches_sequential(self, temp_output_dir):
+        """Test that concurrent writes produce the same tree."""
+        sequential = self.make_generator(temp_output_dir / "seq").generate(
+            init_git=False
+        )
+        parallel = self.make_generator(temp_output_dir / "par", io_workers=8).generate(
+            init_git=False
+        )
+
+        assert self.snapshot(parallel) == self.snapshot(sequential)
+
+    def test_write_errors_propagate(self, temp_output_dir):
+        """Test that a failing write in a worker thread is raised."""
+        generator = self.make_generator(temp_output_dir, io_workers=4)
+
+        with (
+            patch.object(Path, "write_bytes", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            generator.generate(init_git=False)
@@ -0,0 +1,118 @@
+"""
+Tests for the native git repository writer.
+"""
+
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.gitwriter import init_repository
+from python_project_generator.renderer import CHUNK_SIZE
+
+requires_git = pytest.mark.skipif(
+    shutil.which("git") is None, reason="git is not installed"
+)
+
+
+def git(project_path: Path, *args: str) -> str:
+    """Run a git command in a project and return its output."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=project_path,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+class TestGitWriter:
+    """Test repositories written without the git command."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_git_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @requires_git
+    def test_repository_passes_fsck(self, temp_output_dir):
+        """Test that the written repository is valid and clean."""
+        (temp_output_dir / "pkg").mkdir()
+        (temp_output_dir / "pkg" / "a.py").write_bytes(b"print('a')\n")
+        (temp_output_dir / "pkg-b.txt").write_bytes(b"b\n")
+        (temp_output_dir / "run.sh").write_bytes(b"#!/bin/sh\n")
+        (temp_output_dir / "run.sh").chmod(0o755)
+
+        commit = init_repository(
+            temp_output_dir,
+            {"pkg/a.py": b"print('a')\n", "pkg-b.txt": None, "run.sh": None},
+            "Git Author",
+            "git@example.com",
+            "Initial commit",
+        )
+
+        git(temp_output_dir, "fsck", "--strict", "--full")
+        assert git(temp_output_dir, "rev-parse", "HEAD").strip() == commit
+        assert git(temp_output_dir, "status", "--porcelain") == ""
+        assert git(temp_output_dir, "ls-files", "-s", "run.sh").startswith("100755")
+        log = git(temp_output_dir, "log", "--format=%an <%ae> %s")
+        assert log == "Git Author <git@example.com> Initial commit\n"
+
+    @requires_git
+    def test_large_files_are_streamed(self, temp_output_dir):
+        """Test that large files are committed without reading them whole."""
+        data = bytes(range(256)) * (CHUNK_SIZE // 128 + 1)
+        (temp_output_dir / "data.bin").write_bytes(data)
+
+        with patch.object(Path, "read_bytes", side_effect=AssertionError):
+            init_repository(
+                temp_output_dir,
+                {"data.bin": None},
+                "Git Author",
+                "git@example.com",
+                "Initial commit",
+            )
+
+        git(temp_output_dir, "fsck", "--strict", "--full")
+        assert git(temp_output_dir, "status", "--porcelain") == ""
+        blob = git(temp_output_dir, "rev-parse", "HEAD:data.bin").strip()
+        assert git(temp_output_dir, "cat-file", "-s", blob).strip() == str(len(data))
+
+    def test_existing_repository_is_not_overwritten(self, temp_output_dir):
+        """Test that an existing .git directory is left alone."""
+        (temp_output_dir / ".git").mkdir()
+
+        with pytest.raises(FileExistsError):
+            init_repository(temp_output_dir, {}, "a", "a@example.com", "m")
+
+    @requires_git
+    def test_generated_project_repository(self, temp_output_dir):
+        """Test that generate() commits every generated file natively."""
+        generator = ProjectGenerator(
+            project_name="git_project",
+            description="Git test",
+            author_name="Git Author",
+            author_email="git@example.com",
+            github_username="gituser",
+            output_dir=temp_output_dir,
+        )
+
+        project_path = generator.generate(init_git=True)
+
+        git(project_path, "fsck", "--strict")
+        assert git(project_path, "status", "--porcelain", "--untracked=all") == ""
+        tracked = git(project_path, "ls-files").splitlines()
+        assert "src/git_project/main.py" in tracked
+        assert ".github/workflows/ci.yml" in tracked
+        on_disk = [
+            path.relative_to(project_path).as_posix()
+            for path in project_path.rglob("*")
+            if path.is_file() and ".git" not in path.relative_to(project_path).parts
+        ]
+        assert sorted(tracked) == sorted(on_disk)
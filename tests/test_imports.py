@@ -0,0 +1,130 @@
+"""
+Tests for import cost and lazy imports.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Cumulative import time budgets in microseconds, measured with -X importtime.
+# They are several times the typical cost so only real regressions (e.g. an
+# eager import of the generator) fail.
+VERSION_BUDGET_US = 60_000
+GENERATOR_BUDGET_US = 200_000
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter with import timing enabled."""
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def imported_modules(code: str) -> set[str]:
+    """Return the modules imported while running code in a fresh interpreter."""
+    dump = "import sys, json; print(json.dumps(list(sys.modules)))"
+    result = run_python(f"{code}\n{dump}")
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def import_time_us(code: str, module: str) -> int:
+    """Return the cumulative import time of a module while running code."""
+    stderr = run_python(code).stderr
+    # Lines read "import time: <self us> | <cumulative us> | <module>"
+    for line in stderr.splitlines():
+        timings, _, name = line.rpartition("|")
+        if timings and name.strip() == module:
+            return int(timings.rpartition("|")[2])
+    msg = f"{module} was not imported"
+    raise AssertionError(msg)
+
+
+class TestLazyImports:
+    """Test that entry points load only the modules they need."""
+
+    def test_package_import_is_lightweight(self):
+        """Test that importing the package does not load the CLI."""
+        modules = imported_modules("import python_project_generator")
+
+        assert "python_project_generator.cli" not in modules
+        assert "python_project_generator.generator" not in modules
+
+    def test_version_skips_generator(self):
+        """Test that --version does not import the generator or argparse."""
+        modules = imported_modules(
+            "from python_project_generator.cli import main; main(['--version'])"
+        )
+
+        assert "python_project_generator.generator" not in modules
+        assert "argparse" not in modules
+        assert "subprocess" not in modules
+        assert "shutil" not in modules
+
+    def test_help_skips_generator(self):
+        """Test that --help only needs the argument parser."""
+        modules = imported_modules(
+            "from python_project_generator.cli import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass"
+        )
+
+        assert "argparse" in modules
+        assert "python_project_generator.generator" not in modules
+
+    def test_generator_defers_heavy_modules(self):
+        """Test that importing the generator leaves optional modules unloaded."""
+        modules = imported_modules("import python_project_generator.generator")
+
+        for module in (
+            "subprocess",
+            "shutil",
+            "tarfile",
+            "zipfile",
+            "concurrent.futures",
+            "python_project_generator.gitwriter",
+        ):
+            assert module not in modules
+
+    def test_main_attribute_still_available(self):
+        """Test that the package still exposes main lazily."""
+        import python_project_generator
+        from python_project_generator.cli import main
+
+        assert python_project_generator.main is main
+        with pytest.raises(AttributeError):
+            _ = python_project_generator.missing
+
+
+class TestImportTimeBudget:
+    """Test import times against fixed budgets."""
+
+    def test_version_budget(self):
+        """Test the import cost of the --version path."""
+        elapsed = import_time_us(
+            "from python_project_generator.cli import main; main(['--version'])",
+            "python_project_generator.cli",
+        )
+
+        assert elapsed < VERSION_BUDGET_US
+
+    def test_generator_budget(self):
+        """Test the import cost of the generator for library use."""
+        elapsed = import_time_us(
+            "import python_project_generator.generator",
+            "python_project_generator.generator",
+        )
+
+        assert elapsed < GENERATOR_BUDGET_US
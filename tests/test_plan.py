@@ -0,0 +1,79 @@
+"""
+Tests for compiled generation plans.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.plan import GenerationPlan, PlanEntry
+from python_project_generator.sinks import MemorySink
+from python_project_generator.update import MANIFEST_NAME
+
+
+@pytest.fixture
+def generator():
+    """Create a generator for the plan test project."""
+    temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_plan_")
+    yield ProjectGenerator(
+        project_name="planned_project",
+        description="Planned",
+        author_name="Plan Author",
+        author_email="plan@example.com",
+        github_username="plan",
+        output_dir=Path(temp_dir),
+    )
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestGenerationPlan:
+    """Test building, serializing and executing plans."""
+
+    def test_plan_covers_every_file(self, generator):
+        """Test that the plan lists template and inline files alike."""
+        plan = generator.build_plan()
+        files = generator.render_to_memory()
+
+        dests = {generator.renderer.render(entry.dest) for entry in plan.entries}
+        assert dests == set(files) - {MANIFEST_NAME}
+        assert "src/{{PROJECT_NAME}}/main.py" in {entry.dest for entry in plan.entries}
+        assert "src/{{PROJECT_NAME}}" in plan.directories
+
+    def test_operations(self, generator):
+        """Test that each entry names its source and operation."""
+        entries = {entry.dest: entry for entry in generator.build_plan().entries}
+
+        assert entries["pyproject.toml"].operation == "render"
+        assert entries["pyproject.toml"].source.name == "pyproject.toml"
+        assert entries[".gitignore"].operation == "copy"
+        assert entries["Makefile"].operation == "render"
+        assert entries["Makefile"].source is None
+
+    def test_round_trip(self, generator):
+        """Test that a serialized plan loads back unchanged."""
+        plan = generator.build_plan()
+
+        assert GenerationPlan.loads(plan.dumps()) == plan
+
+    def test_loaded_plan_renders_same_project(self, generator):
+        """Test that a plan loaded from JSON can be executed by any sink."""
+        expected = generator.render_to_memory()
+        loaded = GenerationPlan.loads(generator.build_plan().dumps())
+
+        with patch.object(generator, "build_plan", return_value=loaded):
+            files = generator.render(MemorySink()).files
+
+        assert files == expected
+
+    def test_invalid_entries_rejected(self):
+        """Test that malformed plans are rejected."""
+        with pytest.raises(ValueError, match="operation"):
+            PlanEntry.from_dict({"dest": "x", "operation": "symlink"})
+        with pytest.raises(ValueError, match="source"):
+            PlanEntry.from_dict({"dest": "x", "operation": "copy"})
+        with pytest.raises(ValueError, match="version"):
+            GenerationPlan.loads('{"version": 0}')
@@ -0,0 +1,116 @@
+"""
+Tests for generation profiling.
+"""
+
+import json
+import pstats
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.profiling import Profiler
+
+
+class TestProfiler:
+    """Test spans recorded while generating a project."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_profile_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, output_dir: Path, **kwargs) -> ProjectGenerator:
+        """Create a generator for the profiling test project."""
+        return ProjectGenerator(
+            project_name="profiled_project",
+            description="Profiled",
+            author_name="Profile Author",
+            author_email="profile@example.com",
+            github_username="profile",
+            output_dir=output_dir,
+            **kwargs,
+        )
+
+    def test_phase_and_file_spans(self, temp_output_dir):
+        """Test that phases and file operations on I/O threads are recorded."""
+        profiler = Profiler()
+        generator = self.make_generator(
+            temp_output_dir, io_workers=4, profiler=profiler
+        )
+        generator.generate()
+
+        phases = {span.name for span in profiler.spans if span.category == "phase"}
+        files = {span.name for span in profiler.spans if span.category == "file"}
+        assert {"copy", "render", "structure", "git", "validate"} <= phases
+        assert "pyproject.toml" in files
+        assert "src/profiled_project/" in files
+        assert len({span.thread for span in profiler.spans}) > 1
+
+    def test_chrome_trace(self, temp_output_dir):
+        """Test that the trace uses the Chrome trace-event format."""
+        profiler = Profiler()
+        generator = self.make_generator(temp_output_dir, profiler=profiler)
+        generator.generate(init_git=False)
+        trace_path = temp_output_dir / "trace.json"
+
+        profiler.write_chrome_trace(trace_path)
+
+        events = json.loads(trace_path.read_text())["traceEvents"]
+        spans = [event for event in events if event["ph"] == "X"]
+        assert len(spans) == len(profiler.spans)
+        assert all(event["dur"] >= 0 for event in spans)
+        assert any(event["ph"] == "M" for event in events)
+
+    def test_summary(self, temp_output_dir):
+        """Test the phase summary table."""
+        profiler = Profiler()
+        generator = self.make_generator(temp_output_dir, profiler=profiler)
+        generator.generate(init_git=False)
+
+        top = 3
+        summary = profiler.summary(generator.phase_timings, top=top)
+
+        assert summary.splitlines()[1].startswith("load")
+        slowest = summary.split("file operations:\n")[1]
+        assert len(slowest.splitlines()) == top
+
+    def test_cli_profile(self, temp_output_dir):
+        """Test that --profile and --cprofile write their artifacts."""
+        trace_path = temp_output_dir / "trace.json"
+        stats_path = temp_output_dir / "generate.pstats"
+
+        result = subprocess.run(
+            [
+                "python-project-generator",
+                "--name",
+                "profiled_project",
+                "--description",
+                "Profiled",
+                "--author",
+                "Profile Author",
+                "--email",
+                "profile@example.com",
+                "--github-username",
+                "profile",
+                "--output",
+                str(temp_output_dir),
+                "--profile",
+                str(trace_path),
+                "--cprofile",
+                str(stats_path),
+            ],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "validate" in result.stderr
+        assert json.loads(trace_path.read_text())["traceEvents"]
+        assert pstats.Stats(str(stats_path)).total_calls > 0
@@ -0,0 +1,289 @@
+"""
+Tests for the persistent render cache.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.plan import PlanEntry
+from python_project_generator.render_cache import (
+    CachedRender,
+    RenderCache,
+    default_cache_dir,
+    main,
+    render_key,
+)
+from python_project_generator.renderer import Renderer
+
+#: Contents of the files in renders stored directly by the tests
+DATA = b"x" * 100
+
+
+class TestRenderCache:
+    """Test serving repeat generations from the render cache."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a temporary directory for projects and the cache."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_render_cache_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, temp_dir: Path, **kwargs) -> ProjectGenerator:
+        """Create a generator that uses a cache below the temp directory."""
+        spec = {
+            "project_name": "cached_project",
+            "description": "Cached",
+            "author_name": "Cache Author",
+            "author_email": "cache@example.com",
+            "github_username": "cache",
+        }
+        spec.update(kwargs)
+        return ProjectGenerator(
+            **spec,
+            output_dir=temp_dir / "out",
+            render_cache=RenderCache(temp_dir / "cache"),
+        )
+
+    @staticmethod
+    def read_tree(root: Path) -> dict[str, bytes]:
+        """Return the contents of every file below a project, except git's."""
+        return {
+            path.relative_to(root).as_posix(): path.read_bytes()
+            for path in sorted(root.rglob("*"))
+            if path.is_file() and ".git" not in path.relative_to(root).parts
+        }
+
+    def test_repeat_generation_is_served_from_cache(self, temp_dir):
+        """Test that the second identical generation does not render."""
+        first = self.make_generator(temp_dir)
+        project = first.generate(init_git=False)
+        rendered = self.read_tree(project)
+        assert not first.cache_hit
+
+        second = self.make_generator(temp_dir)
+        with patch.object(Renderer, "render_segments") as render_segments:
+            second.generate(force=True, init_git=False)
+
+        render_segments.assert_not_called()
+        assert second.cache_hit
+        assert "render" not in second.phase_timings
+        assert self.read_tree(project) == rendered
+
+    def test_cached_project_gets_a_git_repository(self, temp_dir):
+        """Test that git still runs for projects served from the cache."""
+        self.make_generator(temp_dir).generate(init_git=False)
+
+        generator = self.make_generator(temp_dir)
+        project = generator.generate(force=True)
+
+        assert generator.cache_hit
+        assert (project / ".git" / "HEAD").exists()
+
+    def test_different_values_miss(self, temp_dir):
+        """Test that other replacement values are rendered, not served."""
+        self.make_generator(temp_dir).generate(init_git=False)
+
+        generator = self.make_generator(temp_dir, description="Other")
+        project = generator.generate(force=True, init_git=False)
+
+        assert not generator.cache_hit
+        assert "Other" in (project / "pyproject.toml").read_text()
+        assert RenderCache(temp_dir / "cache").stats().entries > 1
+
+    def test_template_change_changes_key(self, temp_dir):
+        """Test that the key covers the template set."""
+        generator = self.make_generator(temp_dir)
+        plan = generator.build_plan()
+        values = generator.renderer.replacements
+        entry = PlanEntry(dest="EXTRA.md", operation="render", segments=("x",))
+        changed = replace(plan, entries=(*plan.entries, entry))
+
+        assert render_key(plan.digest(), values) == render_key(
+            generator.build_plan().digest(), values
+        )
+        assert render_key(plan.digest(), values) != render_key(changed.digest(), values)
+
+    def test_evicted_entry_falls_back_to_rendering(self, temp_dir):
+        """Test that a cache entry deleted mid-copy does not fail the run."""
+        generator = self.make_generator(temp_dir)
+        generator.generate(init_git=False)
+        missing = CachedRender(
+            path=temp_dir / "gone",
+            directories=(),
+            files=(("README.md", "0" * 64, 0o644),),
+        )
+
+        with patch.object(RenderCache, "lookup", return_value=missing):
+            project = generator.generate(force=True, init_git=False)
+
+        assert not generator.cache_hit
+        assert (project / "README.md").exists()
+
+    def test_hard_linked_project_does_not_share_the_cache(self, temp_dir):
+        """Test that editing a project served from the cache keeps it intact."""
+        self.make_generator(temp_dir, link_mode="hardlink").generate(init_git=False)
+        generator = self.make_generator(temp_dir, link_mode="hardlink")
+        project = generator.generate(force=True, init_git=False)
+        rendered = self.read_tree(project)
+
+        assert generator.cache_hit
+        readme = project / "README.md"
+        assert readme.stat().st_nlink == 1
+        with readme.open("a") as file:
+            file.write("local edit\n")
+
+        generator = self.make_generator(temp_dir, link_mode="hardlink")
+        project = generator.generate(force=True, init_git=False)
+
+        assert generator.cache_hit
+        assert self.read_tree(project) == rendered
+
+    def test_deduplicated_render_is_served_writable(self, temp_dir):
+        """Test that read-only blobs do not leak into later cache hits."""
+        first = self.make_generator(temp_dir, link_mode="hardlink", dedupe=True)
+        project = first.generate(init_git=False)
+        assert not (project / "README.md").stat().st_mode & 0o222
+
+        generator = self.make_generator(temp_dir)
+        project = generator.generate(force=True, init_git=False)
+
+        assert generator.cache_hit
+        assert generator.dedup_stats is None
+        for path in project.rglob("*"):
+            if path.is_file():
+                assert path.stat().st_nlink == 1
+                assert path.stat().st_mode & 0o200, path
+        script = project / "scripts" / "validate_project.py"
+        assert script.stat().st_mode & 0o111
+
+    def test_damaged_entry_is_rendered_again(self, temp_dir):
+        """Test that a cached file that no longer matches its hash is not served."""
+        cache = RenderCache(temp_dir / "cache")
+        self.make_generator(temp_dir).generate(init_git=False)
+        (entry,) = (path.parent for path in cache.root.glob("*/*/index.json"))
+        (entry / "files" / "README.md").write_text("damaged\n")
+
+        generator = self.make_generator(temp_dir)
+        project = generator.generate(force=True, init_git=False)
+
+        assert not generator.cache_hit
+        assert "damaged" not in (project / "README.md").read_text()
+        assert cache.stats().entries == 1
+        assert (
+            self.make_generator(temp_dir).generate(force=True, init_git=False).exists()
+        )
+
+    def test_unwritable_cache_does_not_fail(self, temp_dir):
+        """Test that errors storing an entry are ignored."""
+        generator = self.make_generator(temp_dir)
+
+        with patch.object(RenderCache, "store", side_effect=OSError("full")):
+            assert generator.generate(init_git=False).exists()
+
+
+class TestEviction:
+    """Test size-bounded least-recently-used eviction."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create an empty cache with room for two 100-byte renders."""
+        temp_dir = Path(tempfile.mkdtemp(prefix="test_pyprojgen_eviction_"))
+        yield RenderCache(temp_dir / "cache", max_bytes=250)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def store(cache: RenderCache, key: str, age: int) -> None:
+        """Store a one-file render and make it ``age`` seconds old."""
+        project = cache.root.parent / key
+        project.mkdir(parents=True)
+        (project / "data.txt").write_bytes(DATA)
+        digest = hashlib.sha256(DATA).hexdigest()
+        cache.store(key, project, [], {"data.txt": digest})
+        (index,) = cache.root.glob(f"*/{key}/index.json")
+        stamp = 1_000_000 - age
+        os.utime(index, (stamp, stamp))
+
+    def test_least_recently_used_is_evicted(self, cache):
+        """Test that a lookup protects an entry from eviction."""
+        self.store(cache, "aa11", age=30)
+        self.store(cache, "bb22", age=20)
+        assert cache.lookup("aa11") is not None
+
+        self.store(cache, "cc33", age=0)
+
+        assert cache.lookup("aa11") is not None
+        assert cache.lookup("bb22") is None
+        assert cache.lookup("cc33") is not None
+        assert cache.stats().size == 2 * len(DATA)
+
+    def test_store_scans_only_when_over_limit(self, cache):
+        """Test that the running size total spares stores a full scan."""
+        self.store(cache, "aa11", age=30)
+
+        with patch.object(RenderCache, "_entries", return_value=[]) as entries:
+            self.store(cache, "bb22", age=20)
+            entries.assert_not_called()
+            self.store(cache, "cc33", age=0)
+            entries.assert_called_once()
+
+    def test_size_total_is_rebuilt(self, cache):
+        """Test that a missing size file is recomputed from the entries."""
+        self.store(cache, "aa11", age=10)
+        (cache.root / "size").unlink()
+
+        self.store(cache, "bb22", age=0)
+
+        assert (cache.root / "size").read_text() == "200"
+
+    def test_clear(self, cache):
+        """Test that clear removes every entry."""
+        self.store(cache, "aa11", age=0)
+
+        assert cache.clear() == 1
+        assert cache.stats().entries == 0
+
+    def test_oversized_render_is_not_stored(self, cache):
+        """Test that a render larger than the cache is skipped."""
+        project = cache.root.parent / "big"
+        project.mkdir(parents=True)
+        (project / "data.txt").write_bytes(b"x" * 300)
+
+        assert not cache.store("dd44", project, [], {"data.txt": "digest"})
+        assert cache.stats().entries == 0
+
+
+class TestCacheCommand:
+    """Test the cache stats and clear commands."""
+
+    def test_default_dir_follows_xdg(self, monkeypatch, tmp_path):
+        """Test that the cache lives below $XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        assert default_cache_dir() == (
+            tmp_path / "python-project-generator" / "renders"
+        )
+
+    def test_stats_and_clear(self, tmp_path, capsys):
+        """Test the JSON statistics and clearing from the command line."""
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "a.txt").write_bytes(DATA)
+        RenderCache(tmp_path / "cache").store("ee55", project, [], {"a.txt": "d"})
+
+        assert main(["stats", "--json", "--cache-dir", str(tmp_path / "cache")]) == 0
+        stats = json.loads(capsys.readouterr().out)
+        assert stats["entries"] == 1
+        assert stats["size"] == len(DATA)
+
+        assert main(["clear", "--cache-dir", str(tmp_path / "cache")]) == 0
+        assert "Removed 1" in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""
+Tests for the single-pass placeholder renderer.
+"""
+
+import io
+
+import pytest
+
+from python_project_generator.renderer import (
+    MAX_PLACEHOLDER_BYTES,
+    Renderer,
+    split_placeholders,
+)
+
+
+class TestRenderer:
+    """Test placeholder splitting and substitution."""
+
+    def test_split_placeholders(self):
+        """Test that tokens land at odd indices."""
+        assert split_placeholders("a {{X}} b {{Y_2}}") == (
+            "a ",
+            "{{X}}",
+            " b ",
+            "{{Y_2}}",
+            "",
+        )
+        assert split_placeholders("no tokens") == ("no tokens",)
+
+    def test_github_expressions_are_not_placeholders(self):
+        """Test that ${{ ... }} expressions are left untouched."""
+        text = "token: ${{ secrets.PYPI_API_TOKEN }}"
+        assert Renderer({}).render(text) == text
+
+    def test_render_replaces_known_placeholders(self):
+        """Test that every occurrence of a known placeholder is replaced."""
+        renderer = Renderer({"{{NAME}}": "demo", "{{YEAR}}": "2024"})
+
+        result = renderer.render("{{NAME}} (c) {{YEAR}} {{NAME}}")
+
+        assert result == "demo (c) 2024 demo"
+        assert renderer.unknown_placeholders == set()
+
+    def test_render_reports_unknown_placeholders(self):
+        """Test that unknown placeholders are kept and reported."""
+        renderer = Renderer({"{{NAME}}": "demo"})
+
+        result = renderer.render("{{NAME}} by {{OWNER}}")
+
+        assert result == "demo by {{OWNER}}"
+        assert renderer.unknown_placeholders == {"{{OWNER}}"}
+
+    def test_values_are_not_rescanned(self):
+        """Test that values containing tokens are inserted literally."""
+        renderer = Renderer({"{{A}}": "{{B}}", "{{B}}": "b"})
+
+        assert renderer.render("{{A}}") == "{{B}}"
+
+
+class TestStreamingRenderer:
+    """Test rendering templates chunk by chunk."""
+
+    TEMPLATE = "{{NAME}} héllo {{NAME}}{{YEAR}} ${{ x }} {{OWNER}} {NAME}} end{{"
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 11, 64])
+    def test_matches_in_memory_rendering(self, chunk_size):
+        """Test that placeholders split across chunks are still replaced."""
+        renderer = Renderer({"{{NAME}}": "démo", "{{YEAR}}": "2024"})
+        source = io.BytesIO(self.TEMPLATE.encode("utf-8"))
+
+        rendered = b"".join(renderer.render_chunks(source, chunk_size))
+
+        assert rendered.decode("utf-8") == Renderer(renderer.replacements).render(
+            self.TEMPLATE
+        )
+        assert renderer.unknown_placeholders == {"{{OWNER}}"}
+
+    def test_chunks_stay_bounded(self):
+        """Test that no piece grows beyond the chunk size plus one token."""
+        renderer = Renderer({})
+        source = io.BytesIO(b"{{" + b"A" * 10_000)
+
+        pieces = list(renderer.render_chunks(source, chunk_size=100))
+
+        assert b"".join(pieces) == b"{{" + b"A" * 10_000
+        assert max(map(len, pieces)) <= 100 + MAX_PLACEHOLDER_BYTES
+
+    def test_invalid_utf8_raises(self):
+        """Test that non-UTF-8 input is reported instead of rendered."""
+        source = io.BytesIO(b"{{NAME}} \xff\xfe")
+
+        with pytest.raises(UnicodeDecodeError):
+            list(Renderer({"{{NAME}}": "x"}).render_chunks(source, chunk_size=4))
@@ -0,0 +1,160 @@
+"""
+Tests for the generation server.
+"""
+
+import http.client
+import io
+import json
+import shutil
+import socket
+import sys
+import tarfile
+import tempfile
+import threading
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+
+from python_project_generator.server import create_server
+
+PROJECT = {
+    "name": "served_project",
+    "description": "Served project",
+    "author": "Server Author",
+    "email": "server@example.com",
+    "github_username": "server",
+}
+
+
+class TestServer:
+    """Test generation requests over HTTP."""
+
+    @pytest.fixture
+    def output_root(self):
+        """Create a temporary directory requests may write into."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_serve_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @pytest.fixture
+    def server(self, output_root):
+        """Run a server on a free port in a background thread."""
+        server = create_server(port=0, output_root=output_root)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def request(server, method: str, path: str, payload: dict | None = None):
+        """Send a request and return (status, body)."""
+        connection = http.client.HTTPConnection(*server.server_address[:2])
+        body = json.dumps(payload).encode() if payload is not None else None
+        connection.request(method, path, body)
+        response = connection.getresponse()
+        result = response.status, response.read()
+        connection.close()
+        return result
+
+    def test_health(self, server):
+        """Test the health endpoint."""
+        status, body = self.request(server, "GET", "/health")
+
+        assert status == HTTPStatus.OK
+        assert json.loads(body) == {"status": "ok"}
+
+    def test_metrics(self, server):
+        """Test that served generations show up in the metrics."""
+        self.request(server, "POST", "/generate", {**PROJECT, "format": "zip"})
+
+        status, body = self.request(server, "GET", "/metrics")
+
+        text = body.decode()
+        assert status == HTTPStatus.OK
+        assert 'ppg_generations_total{outcome="success"} 1' in text
+        assert 'ppg_files_total{action="rendered"}' in text
+        assert text.endswith("# EOF\n")
+
+    def test_generate_archive(self, server):
+        """Test that archive requests return the rendered project."""
+        status, body = self.request(
+            server, "POST", "/generate", {**PROJECT, "format": "tar.gz"}
+        )
+
+        assert status == HTTPStatus.OK
+        with tarfile.open(fileobj=io.BytesIO(body), mode="r:gz") as archive:
+            assert "served_project/pyproject.toml" in archive.getnames()
+
+    def test_generate_into_directory(self, server, output_root):
+        """Test that projects can be written below the output root."""
+        status, body = self.request(
+            server, "POST", "/generate", {**PROJECT, "output": "team", "git": False}
+        )
+
+        assert status == HTTPStatus.OK
+        project_path = Path(json.loads(body)["path"])
+        assert project_path == output_root / "team" / "served_project"
+        assert (project_path / "pyproject.toml").exists()
+
+        status, _ = self.request(
+            server, "POST", "/generate", {**PROJECT, "output": "team", "git": False}
+        )
+        assert status == HTTPStatus.CONFLICT
+
+    def test_output_outside_root_rejected(self, server):
+        """Test that requests cannot write outside the output root."""
+        status, body = self.request(
+            server, "POST", "/generate", {**PROJECT, "output": "../escape"}
+        )
+
+        assert status == HTTPStatus.BAD_REQUEST
+        assert "inside" in json.loads(body)["error"]
+
+    def test_invalid_request(self, server):
+        """Test that incomplete requests are rejected."""
+        status, body = self.request(server, "POST", "/generate", {"name": "x"})
+
+        assert status == HTTPStatus.BAD_REQUEST
+        assert "missing" in json.loads(body)["error"]
+
+    def test_concurrent_requests(self, server):
+        """Test that many requests can be served at once."""
+        statuses = []
+
+        def send():
+            payload = {**PROJECT, "format": "zip"}
+            statuses.append(self.request(server, "POST", "/generate", payload)[0])
+
+        threads = [threading.Thread(target=send) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert statuses == [200] * 8
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets only")
+    def test_unix_socket(self, output_root):
+        """Test serving over a Unix socket."""
+        socket_path = output_root / "ppg.sock"
+        server = create_server(unix_socket=socket_path)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(str(socket_path))
+            client.sendall(
+                b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+            )
+            response = b""
+            while chunk := client.recv(4096):
+                response += chunk
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert response.startswith(b"HTTP/1.1 200")
+        assert response.endswith(b'{"status": "ok"}')
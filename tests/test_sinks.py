@@ -0,0 +1,262 @@
+"""
+Tests for output sinks.
+"""
+
+import io
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.sinks import (
+    ArchiveSink,
+    DirectorySink,
+    DryRunSink,
+    MemorySink,
+    TarGzSink,
+)
+from python_project_generator.template_cache import TemplateCache
+
+
+@pytest.fixture
+def generator():
+    """Create a generator whose output directory must stay untouched."""
+    temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_sinks_")
+    yield ProjectGenerator(
+        project_name="sink_project",
+        description="Sink test",
+        author_name="Sink Author",
+        author_email="sink@example.com",
+        github_username="sink",
+        output_dir=Path(temp_dir),
+    )
+    shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+class TestSinks:
+    """Test rendering projects into sinks other than a directory."""
+
+    def test_render_to_memory(self, generator):
+        """Test that the in-memory sink returns every file as bytes."""
+        files = generator.render_to_memory()
+
+        assert not generator.project_path.exists()
+        assert b"sink_project" in files["pyproject.toml"]
+        assert files["tests/__init__.py"] == b""
+        assert "src/sink_project/main.py" in files
+        assert ".github/workflows/ci.yml" in files
+
+    def test_memory_sink_matches_directory(self, generator):
+        """Test that the memory sink receives the same files as a directory."""
+        files = generator.render_to_memory()
+        project_path = generator.generate(init_git=False)
+
+        on_disk = {
+            path.relative_to(project_path).as_posix(): path.read_bytes()
+            for path in project_path.rglob("*")
+            if path.is_file()
+        }
+        assert files == on_disk
+
+    def test_memory_sink_with_io_workers(self, generator):
+        """Test that the memory sink is safe to fill from I/O threads."""
+        expected = generator.render_to_memory()
+        generator.io_workers = 8
+
+        assert generator.render(MemorySink()).files == expected
+
+    def test_dry_run_prints_plan(self, generator):
+        """Test that the dry-run sink prints paths and sizes only."""
+        stream = io.StringIO()
+
+        sink = generator.render(DryRunSink(generator.project_path, stream))
+
+        output = stream.getvalue()
+        assert not generator.project_path.exists()
+        assert output.startswith(f"Would create {generator.project_path}\n")
+        assert "src/sink_project/main.py" in output
+        assert output.rstrip().endswith("bytes")
+        assert sink.modes["scripts/validate_project.py"] & 0o111
+
+
+class TestArchives:
+    """Test streaming projects as archives."""
+
+    @pytest.mark.parametrize("fmt", ["tar.gz", "zip"])
+    def test_archive_matches_memory_render(self, generator, fmt):
+        """Test that archives contain every rendered file under the project."""
+        expected = generator.render_to_memory()
+        buffer = io.BytesIO()
+
+        generator.generate_archive(buffer, fmt)
+
+        names, files = self.read_archive(buffer, fmt)
+        assert not generator.project_path.exists()
+        assert files == {
+            f"sink_project/{path}": data for path, data in expected.items()
+        }
+        assert names == sorted(names, key=lambda name: name.rstrip("/"))
+
+    @pytest.mark.parametrize("fmt", ["tar.gz", "zip"])
+    def test_large_files_are_streamed(self, tmp_path, fmt):
+        """Test that large templates and copies are never read whole."""
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "data.txt").write_text("row {{PROJECT_NAME}}\n" * 1000)
+        (templates / "blob.bin").write_bytes(bytes(range(256)) * 100)
+        read_bytes = Path.read_bytes
+
+        def guarded_read_bytes(path):
+            assert path.name not in ("data.txt", "blob.bin")
+            return read_bytes(path)
+
+        with patch("python_project_generator.template_cache.STREAM_THRESHOLD", 64):
+            generator = ProjectGenerator(
+                project_name="streamed",
+                description="d",
+                author_name="a",
+                author_email="a@example.com",
+                github_username="g",
+                output_dir=tmp_path,
+                template_cache=TemplateCache(templates),
+            )
+            buffer = io.BytesIO()
+            with (
+                patch.object(Path, "read_bytes", guarded_read_bytes),
+                patch.object(ArchiveSink, "write_chunks", side_effect=AssertionError),
+            ):
+                generator.generate_archive(buffer, fmt)
+
+        _, files = self.read_archive(buffer, fmt)
+        assert files["streamed/data.txt"] == b"row streamed\n" * 1000
+        assert files["streamed/blob.bin"] == bytes(range(256)) * 100
+
+    @staticmethod
+    def read_archive(buffer: io.BytesIO, fmt: str) -> tuple[list, dict]:
+        """Return the member names and file contents of an archive."""
+        buffer.seek(0)
+        if fmt == "zip":
+            with zipfile.ZipFile(buffer) as archive:
+                names = archive.namelist()
+                files = {
+                    name: archive.read(name) for name in names if not name.endswith("/")
+                }
+        else:
+            with tarfile.open(fileobj=buffer, mode="r:gz") as archive:
+                names = archive.getnames()
+                files = {
+                    member.name: archive.extractfile(member).read()
+                    for member in archive.getmembers()
+                    if member.isfile()
+                }
+        return names, files
+
+    def test_archive_is_reproducible(self, generator):
+        """Test that equal inputs and timestamps give identical archives."""
+        first, second = io.BytesIO(), io.BytesIO()
+
+        generator.render(TarGzSink(first, prefix="p", mtime=0))
+        generator.render(TarGzSink(second, prefix="p", mtime=0))
+
+        assert first.getvalue() == second.getvalue()
+
+    def test_unknown_archive_format(self, generator):
+        """Test that unsupported formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported archive format"):
+            generator.generate_archive(io.BytesIO(), "rar")
+
+
+class TestLinkModes:
+    """Test how DirectorySink materializes unchanged files."""
+
+    @pytest.fixture
+    def source(self, generator):
+        """Create a source file next to the output directory."""
+        source = generator.output_dir / "template.txt"
+        source.write_text("static content\n")
+        return source
+
+    def test_hardlink(self, generator, source):
+        """Test that hardlink mode links read-only files instead of copying."""
+        source.chmod(0o444)
+        sink = DirectorySink(generator.output_dir / "out", link_mode="hardlink")
+        sink.mkdir("")
+
+        assert sink.copy_file("file.txt", source) == "hardlink"
+        assert (sink.root / "file.txt").stat().st_ino == source.stat().st_ino
+
+    def test_hardlink_skips_writable_sources(self, generator, source):
+        """Test that writable files are not shared with the project."""
+        sink = DirectorySink(generator.output_dir / "out", link_mode="hardlink")
+        sink.mkdir("")
+
+        method = sink.copy_file("file.txt", source)
+
+        dest = sink.root / "file.txt"
+        assert method in ("reflink", "copy_file_range", "copy")
+        assert dest.stat().st_ino != source.stat().st_ino
+        with dest.open("a") as file:
+            file.write("local edit\n")
+        assert source.read_text() == "static content\n"
+
+    def test_hardlink_rewrite_leaves_source_alone(self, generator, source):
+        """Test that rewriting a linked file does not modify its source."""
+        source.chmod(0o444)
+        sink = DirectorySink(generator.output_dir / "out", link_mode="hardlink")
+        sink.mkdir("")
+        sink.copy_file("file.txt", source)
+
+        sink.write_bytes("file.txt", b"rendered\n")
+
+        assert source.read_text() == "static content\n"
+        assert (sink.root / "file.txt").read_text() == "rendered\n"
+
+    @pytest.mark.parametrize("link_mode", ["copy", "reflink", "auto"])
+    def test_independent_copies(self, generator, source, link_mode):
+        """Test that the other modes produce independent files."""
+        sink = DirectorySink(generator.output_dir / "out", link_mode=link_mode)
+        sink.mkdir("")
+
+        method = sink.copy_file("file.txt", source)
+
+        dest = sink.root / "file.txt"
+        assert method in ("reflink", "copy_file_range", "copy")
+        assert dest.read_bytes() == source.read_bytes()
+        assert dest.stat().st_ino != source.stat().st_ino
+        assert dest.stat().st_mtime == source.stat().st_mtime
+
+    def test_generate_with_hardlinks(self, tmp_path):
+        """Test that only read-only static templates are hard linked."""
+        templates = tmp_path / "templates"
+        templates.mkdir()
+        (templates / "README.md").write_text("# {{PROJECT_NAME}}\n")
+        (templates / "LICENSE").write_text("license\n")
+        (templates / "LICENSE").chmod(0o444)
+        (templates / "NOTES.md").write_text("notes\n")
+        generator = ProjectGenerator(
+            project_name="linked",
+            description="d",
+            author_name="a",
+            author_email="a@example.com",
+            github_username="g",
+            output_dir=tmp_path,
+            template_cache=TemplateCache(templates),
+        )
+        project_path = tmp_path / "linked"
+
+        generator.render(DirectorySink(project_path, link_mode="hardlink"))
+
+        inode = (project_path / "LICENSE").stat().st_ino
+        assert inode == (templates / "LICENSE").stat().st_ino
+        inode = (project_path / "NOTES.md").stat().st_ino
+        assert inode != (templates / "NOTES.md").stat().st_ino
+
+    def test_unknown_link_mode(self, generator):
+        """Test that unknown link modes are rejected."""
+        with pytest.raises(ValueError, match="link_mode"):
+            DirectorySink(generator.output_dir, link_mode="symlink")
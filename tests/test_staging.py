@@ -0,0 +1,164 @@
+"""
+Tests for atomic, lock-protected project generation.
+"""
+
+import shutil
+import tempfile
+import threading
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.staging import (
+    LOCK_DIR_ENV,
+    STAGING_MARKER,
+    find_staging,
+    lock_path,
+    project_lock,
+)
+
+
+class TestStagedGeneration:
+    """Test that projects only appear once they are complete."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_staging_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def without_makefile(generator: ProjectGenerator):
+        """Make the generator produce a project that fails validation."""
+        plan = generator.build_plan()
+        entries = tuple(entry for entry in plan.entries if entry.dest != "Makefile")
+        return patch.object(
+            generator, "build_plan", return_value=replace(plan, entries=entries)
+        )
+
+    def make_generator(self, output_dir: Path) -> ProjectGenerator:
+        """Create a generator for the staging test project."""
+        return ProjectGenerator(
+            project_name="staged_project",
+            description="Staged",
+            author_name="Stage Author",
+            author_email="stage@example.com",
+            github_username="stage",
+            output_dir=output_dir,
+        )
+
+    def test_failed_validation_publishes_nothing(self, temp_output_dir):
+        """Test that a project failing validation never reaches its path."""
+        generator = self.make_generator(temp_output_dir)
+
+        with (
+            self.without_makefile(generator),
+            pytest.raises(RuntimeError),
+        ):
+            generator.generate(init_git=False)
+        generator.wait_for_cleanup(timeout=5)
+
+        assert not generator.project_path.exists()
+        assert find_staging(generator.project_path) == []
+
+    def test_failed_force_keeps_existing_project(self, temp_output_dir):
+        """Test that a failed overwrite leaves the previous project in place."""
+        generator = self.make_generator(temp_output_dir)
+        project_path = generator.generate(init_git=False)
+        (project_path / "notes.txt").write_text("still here")
+
+        with (
+            self.without_makefile(generator),
+            pytest.raises(RuntimeError),
+        ):
+            generator.generate(force=True, init_git=False)
+
+        assert (project_path / "notes.txt").read_text() == "still here"
+
+    def test_stale_staging_is_swept(self, temp_output_dir):
+        """Test that staging directories of crashed runs are removed."""
+        generator = self.make_generator(temp_output_dir)
+        stale = temp_output_dir / f".staged_project{STAGING_MARKER}deadbeef0000"
+        (stale / "src").mkdir(parents=True)
+
+        generator.generate(init_git=False)
+        generator.wait_for_cleanup(timeout=5)
+
+        assert not stale.exists()
+        assert (generator.project_path / "pyproject.toml").exists()
+
+    def test_lock_serializes_runs(self, temp_output_dir):
+        """Test that generation waits while another run holds the lock."""
+        generator = self.make_generator(temp_output_dir)
+        finished = threading.Event()
+
+        def run():
+            generator.generate(init_git=False)
+            finished.set()
+
+        with project_lock(generator.project_path):
+            thread = threading.Thread(target=run)
+            thread.start()
+            assert not finished.wait(0.3)
+            assert not generator.project_path.exists()
+
+        thread.join(10)
+        assert finished.is_set()
+
+    def test_lock_files_stay_out_of_the_output_directory(
+        self, temp_output_dir, monkeypatch
+    ):
+        """Test that lock files do not clutter the output directory."""
+        lock_dir = temp_output_dir / "locks"
+        monkeypatch.setenv(LOCK_DIR_ENV, str(lock_dir))
+        output_dir = temp_output_dir / "out"
+        output_dir.mkdir()
+        for name in ("one", "two"):
+            generator = self.make_generator(output_dir)
+            generator.project_name = name
+            generator.generate(init_git=False)
+
+        assert sorted(path.name for path in output_dir.iterdir()) == ["one", "two"]
+        locks = sorted(lock_dir.iterdir())
+        assert locks == [lock_path(output_dir / "one"), lock_path(output_dir / "two")]
+
+    def test_lock_path_depends_on_the_output_directory(self, temp_output_dir):
+        """Test that equal project names in different directories do not collide."""
+        one = lock_path(temp_output_dir / "a" / "project")
+        two = lock_path(temp_output_dir / "b" / "project")
+
+        assert one != two
+        assert one.parent == two.parent
+        assert one.name.startswith("project-")
+
+    def test_concurrent_runs(self, temp_output_dir):
+        """Test many concurrent runs targeting the same project."""
+        outcomes = []
+
+        def run(force):
+            generator = self.make_generator(temp_output_dir)
+            try:
+                generator.generate(force=force, init_git=False)
+                generator.wait_for_cleanup(timeout=10)
+                outcomes.append("ok")
+            except FileExistsError:
+                outcomes.append("exists")
+
+        threads = [threading.Thread(target=run, args=(False,)) for _ in range(4)]
+        threads += [threading.Thread(target=run, args=(True,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Exactly one run without force wins; every forced run replaces it
+        assert outcomes.count("exists") in (3, 4)
+        assert outcomes.count("ok") == 8 - outcomes.count("exists")
+        project_path = temp_output_dir / "staged_project"
+        assert (project_path / "pyproject.toml").exists()
+        hidden = [path.name for path in temp_output_dir.iterdir()]
+        assert not [name for name in hidden if STAGING_MARKER in name]
@@ -0,0 +1,166 @@
+"""
+Tests for the in-memory template cache.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.template_cache import INDEX_PATH, TemplateCache
+from python_project_generator.template_index import build_index, dumps_index
+
+
+class TestTemplateCache:
+    """Test loading, sharing and invalidating compiled templates."""
+
+    @pytest.fixture
+    def template_root(self):
+        """Create a minimal repository layout with a templates directory."""
+        temp_dir = Path(tempfile.mkdtemp(prefix="test_template_cache_"))
+        (temp_dir / "templates" / "md_files").mkdir(parents=True)
+        (temp_dir / "templates" / "README.md").write_text("# {{PROJECT_NAME}}\n")
+        (temp_dir / "templates" / "md_files" / "NOTES.md").write_text("notes\n")
+        (temp_dir / ".gitignore").write_text("{{NOT_RENDERED}}\n")
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_files_are_split_at_placeholders(self, template_root):
+        """Test that contents are pre-split and destinations are mapped."""
+        cache = TemplateCache(template_root / "templates")
+        files = {template.dest: template for template in cache.files()}
+
+        assert files["README.md"].segments == ("# ", "{{PROJECT_NAME}}", "\n")
+        assert files["README.md"].has_placeholders
+        assert not files["NOTES.md"].has_placeholders
+        assert files[".gitignore"].segments is None
+
+    def test_large_templates_are_streamed(self, template_root):
+        """Test that large templates are rendered from disk, not memory."""
+        data = template_root / "templates" / "data.txt"
+        data.write_text("row {{PROJECT_NAME}}\n" * 100)
+        blob = template_root / "templates" / "blob.bin"
+        blob.write_bytes(b"\xff{{PROJECT_NAME}}" * 100)
+
+        with patch("python_project_generator.template_cache.STREAM_THRESHOLD", 64):
+            files = {t.dest: t for t in TemplateCache(data.parent).files()}
+            generator = ProjectGenerator(
+                project_name="streamed",
+                description="d",
+                author_name="a",
+                author_email="a@example.com",
+                github_username="g",
+                template_cache=TemplateCache(data.parent),
+            )
+            rendered = generator.render_to_memory()
+
+        assert files["data.txt"].streamed
+        assert files["data.txt"].segments is None
+        assert not files["blob.bin"].streamed
+        assert rendered["data.txt"] == b"row streamed\n" * 100
+        assert rendered["blob.bin"] == blob.read_bytes()
+
+    def test_files_reused_until_templates_change(self, template_root):
+        """Test that unchanged templates are not reloaded."""
+        cache = TemplateCache(template_root / "templates")
+        first = cache.files()
+
+        assert cache.files() is first
+        assert not cache.is_stale()
+
+        readme = template_root / "templates" / "README.md"
+        readme.write_text("# {{PROJECT_NAME}} v2\n")
+        stat = readme.stat()
+        os.utime(readme, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.is_stale()
+        files = {template.dest: template for template in cache.files()}
+        assert files["README.md"].segments[-1] == " v2\n"
+
+    def test_shared_cache_used_by_generators(self):
+        """Test that generators in one process share the same cache."""
+        kwargs = {
+            "description": "d",
+            "author_name": "a",
+            "author_email": "a@example.com",
+            "github_username": "a",
+        }
+        first = ProjectGenerator(project_name="one", **kwargs)
+        second = ProjectGenerator(project_name="two", **kwargs)
+
+        assert first.template_cache is second.template_cache
+        assert first.template_cache is TemplateCache.shared(first.template_dir)
+
+
+class TestTemplateIndex:
+    """Test loading templates from the precomputed index."""
+
+    @pytest.fixture
+    def template_root(self):
+        """Create a template tree with a freshly built index."""
+        temp_dir = Path(tempfile.mkdtemp(prefix="test_template_index_"))
+        (temp_dir / "templates").mkdir()
+        (temp_dir / "templates" / "README.md").write_text("# {{PROJECT_NAME}}\n")
+        (temp_dir / "templates" / "logo.bin").write_bytes(b"\xff\xfe{{X}}")
+        index_path = temp_dir / "index.json"
+        index_path.write_text(dumps_index(build_index(temp_dir / "templates")))
+        yield temp_dir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_index_records_placeholders_and_kind(self, template_root):
+        """Test that the index classifies files and locates placeholders."""
+        index = build_index(template_root / "templates")
+        entries = {entry["dest"]: entry for entry in index["files"]}
+
+        assert entries["README.md"]["kind"] == "text"
+        assert entries["README.md"]["placeholders"] == [[2, 16]]
+        assert entries["logo.bin"]["kind"] == "binary"
+        assert entries["logo.bin"]["placeholders"] == []
+
+    def test_cache_loads_from_index(self, template_root):
+        """Test that an up-to-date index is used without scanning contents."""
+        cache = TemplateCache(
+            template_root / "templates", index_path=template_root / "index.json"
+        )
+
+        split_path = "python_project_generator.template_cache.split_placeholders"
+        with patch(split_path) as split:
+            files = {template.dest: template for template in cache.files()}
+
+        split.assert_not_called()
+        assert cache.uses_index
+        assert files["README.md"].segments == ("# ", "{{PROJECT_NAME}}", "\n")
+        assert files["logo.bin"].segments is None
+
+    def test_stale_index_falls_back_to_live_scan(self, template_root):
+        """Test that changed template contents trigger a live scan."""
+        # Same size, different contents: only the hash check catches it
+        (template_root / "templates" / "README.md").write_text("= {{PROJECT_NAME}}\n")
+        cache = TemplateCache(
+            template_root / "templates", index_path=template_root / "index.json"
+        )
+
+        files = {template.dest: template for template in cache.files()}
+
+        assert not cache.uses_index
+        assert files["README.md"].segments == ("= ", "{{PROJECT_NAME}}", "\n")
+
+    def test_added_template_falls_back_to_live_scan(self, template_root):
+        """Test that a file missing from the index is still generated."""
+        (template_root / "templates" / "NEWFILE.txt").write_text("{{X}}\n")
+        cache = TemplateCache(
+            template_root / "templates", index_path=template_root / "index.json"
+        )
+
+        dests = {template.dest for template in cache.files()}
+
+        assert not cache.uses_index
+        assert "NEWFILE.txt" in dests
+
+    def test_shipped_index_is_up_to_date(self):
+        """Test that the packaged index matches the bundled templates."""
+        assert INDEX_PATH.read_text(encoding="utf-8") == dumps_index(build_index())
@@ -0,0 +1,145 @@
+"""
+Tests for overwriting projects with --force.
+"""
+
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.cli import main
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.trash import (
+    CLAIM_MARKER,
+    TRASH_MARKER,
+    claim,
+    delete_in_background,
+    find_leftovers,
+)
+
+#: Exit status of command line usage errors
+USAGE_ERROR = 2
+
+
+class TestForceOverwrite:
+    """Test replacing an existing project directory."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_trash_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, output_dir: Path) -> ProjectGenerator:
+        """Create a generator for the overwrite test project."""
+        return ProjectGenerator(
+            project_name="overwritten_project",
+            description="Overwritten",
+            author_name="Trash Author",
+            author_email="trash@example.com",
+            github_username="trash",
+            output_dir=output_dir,
+        )
+
+    def test_force_deletes_old_tree_in_background(self, temp_output_dir):
+        """Test that generation does not wait for the old tree to be deleted."""
+        generator = self.make_generator(temp_output_dir)
+        project_path = generator.generate(init_git=False)
+        (project_path / ".venv" / "lib").mkdir(parents=True)
+        (project_path / ".venv" / "lib" / "site.py").write_text("old")
+
+        release = threading.Event()
+        real_rmtree = shutil.rmtree
+
+        def slow_rmtree(path, ignore_errors=False):
+            release.wait(5)
+            real_rmtree(path, ignore_errors=ignore_errors)
+
+        with patch("shutil.rmtree", side_effect=slow_rmtree):
+            generator.generate(force=True, init_git=False)
+
+            assert not (project_path / ".venv").exists()
+            assert (project_path / "pyproject.toml").exists()
+            # Claimed by this process, so no other run picks it up
+            assert len(list(temp_output_dir.glob(f".*{CLAIM_MARKER}*"))) == 1
+            assert find_leftovers(temp_output_dir) == []
+
+            release.set()
+            generator.wait_for_cleanup(timeout=5)
+
+        assert list(temp_output_dir.glob(f".*{CLAIM_MARKER}*")) == []
+
+    def test_force_with_backup_keeps_old_tree(self, temp_output_dir):
+        """Test that backup=True keeps the replaced directory."""
+        generator = self.make_generator(temp_output_dir)
+        project_path = generator.generate(init_git=False)
+        (project_path / "notes.txt").write_text("keep me")
+
+        generator.generate(force=True, init_git=False, backup=True)
+
+        backup = generator.backup_path
+        assert backup.name.startswith("overwritten_project.bak-")
+        assert (backup / "notes.txt").read_text() == "keep me"
+        assert not (project_path / "notes.txt").exists()
+
+    def test_leftovers_are_swept(self, temp_output_dir):
+        """Test that trash from interrupted runs is deleted on the next run."""
+        leftover = temp_output_dir / f".old_project{TRASH_MARKER}0123456789ab"
+        (leftover / "nested").mkdir(parents=True)
+        (leftover / "nested" / "file.txt").write_text("stale")
+
+        generator = self.make_generator(temp_output_dir)
+        generator.generate(init_git=False)
+        generator.wait_for_cleanup(timeout=5)
+
+        assert not leftover.exists()
+
+    def test_claim_has_one_winner(self, temp_output_dir):
+        """Test that a directory is claimed by only one deleter."""
+        leftover = temp_output_dir / f".old_project{TRASH_MARKER}0123456789ab"
+        leftover.mkdir()
+
+        claimed = claim(leftover)
+
+        assert CLAIM_MARKER in claimed.name
+        assert claim(leftover) is None
+        assert claim(claimed) == claimed
+
+    def test_claims_of_live_processes_are_not_leftovers(self, temp_output_dir):
+        """Test that only claims of exited processes are swept again."""
+        host = socket.gethostname()
+        base = f".old_project{TRASH_MARKER}0123456789ab{CLAIM_MARKER}"
+        running = temp_output_dir / f"{base}{os.getppid()}@{host}"
+        exited = temp_output_dir / f"{base}99999999@{host}"
+        running.mkdir()
+        exited.mkdir()
+
+        assert find_leftovers(temp_output_dir) == [exited]
+
+    def test_detached_deletion(self, temp_output_dir):
+        """Test deletion of several trees in one separate process."""
+        victims = [temp_output_dir / "victim", temp_output_dir / "other"]
+        for victim in victims:
+            (victim / "sub").mkdir(parents=True)
+            (victim / "sub" / "file.txt").write_text("x")
+
+        assert delete_in_background(*victims, detach=True) is None
+
+        deadline = time.monotonic() + 10
+        while any(temp_output_dir.iterdir()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert list(temp_output_dir.iterdir()) == []
+
+    def test_cli_backup_requires_force(self):
+        """Test that --backup is rejected without --force."""
+        with pytest.raises(SystemExit) as excinfo:
+            main(["--name", "x", "--backup"])
+
+        assert excinfo.value.code == USAGE_ERROR
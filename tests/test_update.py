@@ -0,0 +1,118 @@
+"""
+Tests for incremental project updates.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from python_project_generator.cli import main
+from python_project_generator.generator import ProjectGenerator
+from python_project_generator.update import MANIFEST_NAME, load_project_manifest
+
+#: Exit status of command line usage errors
+USAGE_ERROR = 2
+
+
+class TestUpdate:
+    """Test updating an already generated project."""
+
+    @pytest.fixture
+    def temp_output_dir(self):
+        """Create a temporary directory for test output."""
+        temp_dir = tempfile.mkdtemp(prefix="test_pyprojgen_update_")
+        yield Path(temp_dir)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def make_generator(self, output_dir: Path, description: str = "First"):
+        """Create a generator for the update test project."""
+        return ProjectGenerator(
+            project_name="update_project",
+            description=description,
+            author_name="Update Author",
+            author_email="update@example.com",
+            github_username="update",
+            output_dir=output_dir,
+        )
+
+    def test_generate_writes_manifest(self, temp_output_dir):
+        """Test that generation records a hash for every generated file."""
+        project_path = self.make_generator(temp_output_dir).generate(init_git=False)
+
+        hashes = load_project_manifest(project_path)
+
+        assert (project_path / MANIFEST_NAME).exists()
+        assert "pyproject.toml" in hashes
+        assert "src/update_project/main.py" in hashes
+        assert "scripts/validate_project.py" in hashes
+
+    def test_update_without_changes_writes_nothing(self, temp_output_dir):
+        """Test that an update with identical inputs skips every file."""
+        generator = self.make_generator(temp_output_dir)
+        generator.generate(init_git=False)
+
+        with patch("shutil.copy2") as copy2:
+            report = generator.update()
+
+        copy2.assert_not_called()
+        assert report.written == []
+        assert report.conflicts == []
+        assert "pyproject.toml" in report.unchanged
+
+    def test_update_rewrites_changed_files(self, temp_output_dir):
+        """Test that files affected by a changed variable are rewritten."""
+        project_path = self.make_generator(temp_output_dir).generate(init_git=False)
+
+        report = self.make_generator(temp_output_dir, "Second").update()
+
+        assert report.written == ["pyproject.toml"]
+        assert "Second" in (project_path / "pyproject.toml").read_text()
+
+    def test_update_keeps_user_modifications(self, temp_output_dir):
+        """Test that user-modified files are reported and left alone."""
+        project_path = self.make_generator(temp_output_dir).generate(init_git=False)
+        pyproject = project_path / "pyproject.toml"
+        pyproject.write_text("# customized\n")
+
+        report = self.make_generator(temp_output_dir, "Second").update()
+
+        assert report.conflicts == ["pyproject.toml"]
+        assert pyproject.read_text() == "# customized\n"
+
+        # The conflict is reported again on the next update
+        report = self.make_generator(temp_output_dir, "Second").update()
+        assert report.conflicts == ["pyproject.toml"]
+
+    def test_update_missing_project(self, temp_output_dir):
+        """Test that updating a project that does not exist fails."""
+        with pytest.raises(FileNotFoundError):
+            self.make_generator(temp_output_dir).update()
+
+
+class TestUpdateCommandLine:
+    """Test the options that cannot be combined with --update or --force."""
+
+    @pytest.mark.parametrize(
+        "args",
+        [
+            ["--update", "--force"],
+            ["--update", "--dry-run"],
+            ["--update", "--format", "zip"],
+            ["--force", "--dry-run"],
+            ["--force", "--format", "tar.gz"],
+        ],
+    )
+    def test_conflict_is_rejected_before_prompting(self, args, capsys):
+        """Test that conflicting options fail before interactive prompts."""
+        with (
+            patch.object(ProjectGenerator, "from_interactive") as interactive,
+            pytest.raises(SystemExit) as excinfo,
+        ):
+            main(args)
+
+        assert excinfo.value.code == USAGE_ERROR
+        interactive.assert_not_called()
+        assert "cannot be used together" in capsys.readouterr().err
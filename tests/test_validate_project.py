@@ -2,6 +2,7 @@
 Tests for validate_project.py
 """
 
+import json
 import shutil
 import tempfile
 from pathlib import Path
@@ -9,7 +10,16 @@ from unittest.mock import patch
 
 import pytest
 
-from validate_project import REQUIRED_DIRS, REQUIRED_FILES
+from validate_project import (
+    BINARY_PROBE_BYTES,
+    MMAP_THRESHOLD,
+    REQUIRED_DIRS,
+    REQUIRED_FILES,
+    find_placeholders,
+    validate,
+    validate_many,
+)
+from validate_project import main as validate_cli
 from validate_project import validate_function as validate_main
 
 
@@ -168,3 +178,174 @@ class TestValidateProject:
             exit_code = validate_main()
 
         assert exit_code == 1
+
+    def test_validate_returns_structured_result(self, temp_project_dir):
+        """Test that validate() reports every error for a given root."""
+        self.create_valid_project_structure(temp_project_dir)
+        (temp_project_dir / "tests" / "test_main.py").unlink()
+
+        result = validate(temp_project_dir)
+
+        assert not result.ok
+        assert result.root == temp_project_dir
+        assert result.errors == ["Missing test_main.py in tests/"]
+
+    def test_validate_function_accepts_root(self, temp_project_dir):
+        """Test that validate_function() checks an explicit project root."""
+        self.create_valid_project_structure(temp_project_dir)
+
+        assert validate_main(temp_project_dir) == 0
+
+
+class TestDeepValidation:
+    """Test the pyproject.toml and placeholder checks of deep validation."""
+
+    @pytest.fixture
+    def project_root(self):
+        """Create a valid project with a parseable pyproject.toml."""
+        root = Path(tempfile.mkdtemp(prefix="test_validate_deep_"))
+        TestValidateProject().create_valid_project_structure(root)
+        (root / "pyproject.toml").write_text('[project]\nname = "mypackage"\n')
+        yield root
+        shutil.rmtree(root, ignore_errors=True)
+
+    def test_clean_project_passes(self, project_root):
+        """Test that a rendered project passes deep validation."""
+        result = validate(project_root, deep=True)
+
+        assert result.ok, result.errors
+
+    def test_unrendered_placeholder(self, project_root):
+        """Test that leftover placeholders are reported with their file."""
+        (project_root / "README.md").write_text("# {{PROJECT_NAME}} by {{AUTHOR}}")
+
+        result = validate(project_root, deep=True)
+
+        assert result.errors == [
+            "Unrendered placeholder in README.md: {{PROJECT_NAME}}, {{AUTHOR}}"
+        ]
+        assert validate(project_root).ok
+
+    def test_large_file_is_memory_mapped(self, project_root):
+        """Test that placeholders are found in files above the mmap threshold."""
+        path = project_root / "docs" / "big.md"
+        path.write_bytes(b"x" * MMAP_THRESHOLD + b" {{DESCRIPTION}}\n")
+
+        with patch("mmap.mmap", wraps=__import__("mmap").mmap) as mapped:
+            assert find_placeholders(path) == ["{{DESCRIPTION}}"]
+        assert mapped.called
+
+    def test_very_large_file_is_scanned(self, project_root):
+        """Test that files of any size are scanned, e.g. streamed templates."""
+        path = project_root / "docs" / "data.md"
+        with path.open("wb") as file:
+            file.write(b"x" * BINARY_PROBE_BYTES)
+            file.seek(32 * 1024 * 1024)
+            file.write(b" {{DESCRIPTION}}\n")
+
+        result = validate(project_root, deep=True)
+
+        assert result.errors == [
+            "Unrendered placeholder in docs/data.md: {{DESCRIPTION}}"
+        ]
+        assert result.skipped == []
+
+    def test_files_over_the_scan_limit_are_reported(self, project_root):
+        """Test that files skipped because of max_scan_bytes are listed."""
+        (project_root / "docs" / "big.md").write_text("{{DESCRIPTION}}" * 10)
+
+        result = validate(project_root, deep=True, max_scan_bytes=100)
+
+        assert result.ok
+        assert result.skipped == ["docs/big.md (150 bytes, over the limit)"]
+        assert result.to_dict()["skipped"] == result.skipped
+
+    def test_skips_binary_files_and_tool_directories(self, project_root):
+        """Test that binary files and SKIP_DIRS are not scanned."""
+        (project_root / "logo.png").write_bytes(b"\x89PNG\0{{PROJECT_NAME}}")
+        cache = project_root / ".venv" / "lib"
+        cache.mkdir(parents=True)
+        (cache / "template.txt").write_text("{{PROJECT_NAME}}")
+
+        assert validate(project_root, deep=True).ok
+
+    def test_ignores_non_placeholder_braces(self, project_root):
+        """Test that Jinja-style and lowercase braces are not reported."""
+        (project_root / "docs" / "ci.yml").write_text(
+            "run: echo ${{ matrix.python }} {{lower}}"
+        )
+
+        assert validate(project_root, deep=True).ok
+
+    def test_invalid_pyproject(self, project_root):
+        """Test that an unparseable pyproject.toml is reported."""
+        (project_root / "pyproject.toml").write_text("[project\n")
+
+        errors = validate(project_root, deep=True).errors
+
+        assert len(errors) == 1
+        assert errors[0].startswith("Invalid pyproject.toml:")
+
+    def test_missing_project_name(self, project_root):
+        """Test that a pyproject.toml without a project name is reported."""
+        (project_root / "pyproject.toml").write_text("[tool.ruff]\n")
+
+        errors = validate(project_root, deep=True).errors
+
+        assert errors == ["pyproject.toml does not declare [project] name"]
+
+
+class TestValidateMany:
+    """Test validating many project roots at once."""
+
+    @pytest.fixture
+    def project_roots(self):
+        """Create three valid projects and one broken one."""
+        temp_dir = Path(tempfile.mkdtemp(prefix="test_validate_many_"))
+        roots = []
+        for index in range(4):
+            root = temp_dir / f"project_{index}"
+            root.mkdir()
+            TestValidateProject().create_valid_project_structure(root)
+            roots.append(root)
+        (roots[2] / "Makefile").unlink()
+        yield roots
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_results_in_input_order(self, project_roots, jobs):
+        """Test that results come back in order, serially or in parallel."""
+        results = list(validate_many(project_roots, jobs=jobs))
+
+        assert [result.root for result in results] == project_roots
+        assert [result.ok for result in results] == [True, True, False, True]
+        assert results[2].errors == ["Missing required file: Makefile"]
+
+    def test_ndjson_report(self, project_roots, capsys):
+        """Test the NDJSON report written by the command line."""
+        exit_code = validate_cli(
+            [*map(str, project_roots), "--format", "ndjson", "--jobs", "2"]
+        )
+
+        lines = capsys.readouterr().out.splitlines()
+        assert exit_code == 1
+        assert [json.loads(line)["ok"] for line in lines] == [
+            True,
+            True,
+            False,
+            True,
+        ]
+
+    def test_json_report_from_file(self, project_roots, capsys, tmp_path):
+        """Test reading roots from a file and writing one JSON report."""
+        roots_file = tmp_path / "roots.txt"
+        roots = project_roots[:2]
+        roots_file.write_text("\n".join(str(root) for root in roots))
+
+        exit_code = validate_cli(["--from-file", str(roots_file), "--format", "json"])
+
+        report = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert report["total"] == len(roots)
+        assert report["failed"] == 0
+        assert report["results"][0]["root"] == str(project_roots[0])